@@ -0,0 +1,138 @@
+"""
+Async_Http_Client.py
+---------------------
+Contains class functions for a small asyncio HTTP/1.1 JSON client with keep-alive
+connection reuse, bounded concurrency, and retry w/ exponential backoff.
+
+"""
+
+import json
+import asyncio
+import urllib.parse
+from imports import *
+
+
+class Async_Http_Client():
+    def __init__(self, max_connections=4, timeout=10.0, retries=3, retry_backoff=0.5):
+        self.max_connections = max_connections                  # Max number of requests in flight at the same time
+        self.timeout = timeout                                  # Seconds to wait for a connection or response
+        self.retries = retries                                  # Number of times a failed request is retried
+        self.retry_backoff = retry_backoff                      # Seconds to wait before the first retry (doubled after each retry)
+        self.semaphore = asyncio.Semaphore(max_connections)     # Limits the number of requests in flight
+        self.idle_connections = dict()                          # (scheme, host, port) --> list of idle keep-alive (reader, writer) connections
+        self.connections_opened = 0                             # Number of TCP connections opened (connection reuse statistic)
+        self.requests_sent = 0                                  # Number of HTTP requests sent
+
+
+
+    async def get_json(self, url):
+        for attempt in range(self.retries + 1):
+            try:
+                status, body = await self.get(url)
+
+                if status >= 500:                               # Server errors are retried
+                    raise ConnectionError(f"HTTP {status} from {url}")
+
+                if status != 200:                               # Client errors are not retried
+                    raise ValueError(f"HTTP {status} from {url}")
+
+                return json.loads(body)
+
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as error:
+                if attempt == self.retries:                     # Out of retries, report request as a connection issue
+                    raise ConnectionError(f"Could not GET {url} after {self.retries + 1} attempts ({error!r})") from error
+
+                await asyncio.sleep(self.retry_backoff * (2 ** attempt))
+
+
+
+    async def get(self, url):
+        parts = urllib.parse.urlsplit(url)
+        key = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == 'https' else 80))
+        path = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+
+        async with self.semaphore:
+            reader, writer = await self.get_connection(key)
+
+            try:
+                writer.write((f"GET {path} HTTP/1.1\r\n"
+                              f"Host: {parts.netloc}\r\n"
+                              f"Accept: application/json\r\n"
+                              f"Connection: keep-alive\r\n"
+                              f"\r\n").encode('latin-1'))
+                await writer.drain()
+                self.requests_sent += 1
+
+                status, headers, body = await asyncio.wait_for(self.read_response(reader), self.timeout)
+
+            except BaseException:                               # Never reuse a connection that failed mid request
+                writer.close()
+                raise
+
+            if headers.get('connection', '').lower() == 'close':
+                writer.close()
+            else:
+                self.idle_connections.setdefault(key, list()).append((reader, writer))     # Keep connection alive for the next request
+
+            return status, body
+
+
+
+    async def get_connection(self, key):
+        idle_connections = self.idle_connections.get(key, list())
+        while idle_connections:                                 # Reuse an idle keep-alive connection if one is still open
+            reader, writer = idle_connections.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer
+            writer.close()
+
+        scheme, host, port = key                                # Else open a new connection
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port, ssl=(scheme == 'https') or None), self.timeout)
+        self.connections_opened += 1
+        return reader, writer
+
+
+
+    async def read_response(self, reader):
+        status_line = await reader.readline()
+        if not status_line:                                     # Server closed an idle keep-alive connection
+            raise ConnectionResetError("Connection closed by server")
+
+        status = int(status_line.split(b' ', 2)[1])
+
+        headers = dict()
+        while True:                                             # Read headers until the blank line
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            body = bytearray()
+            while True:
+                size = int((await reader.readline()).split(b';', 1)[0], 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b'\r\n', b'\n', b''):      # Skip trailer headers
+                        pass
+                    break
+                body += await reader.readexactly(size)
+                await reader.readexactly(2)                     # Skip chunk "\r\n"
+            body = bytes(body)
+
+        elif 'content-length' in headers:
+            body = await reader.readexactly(int(headers['content-length']))
+
+        else:                                                   # Body ends when the server closes the connection
+            body = await reader.read()
+            headers['connection'] = 'close'
+
+        return status, headers, body
+
+
+
+    async def close(self):
+        for connections in self.idle_connections.values():      # Close all idle keep-alive connections
+            for _, writer in connections:
+                writer.close()
+        self.idle_connections.clear()
@@ -0,0 +1,188 @@
+"""
+Comment_Archive.py
+-------------------
+Contains class functions for an append-only columnar archive of WSB comments for a
+trading session directory. Each flush writes only the new comments as a new segment
+(Parquet or Feather) of the comment table and the ticker mention table.
+
+Parquet and Feather segments need pyarrow (Parquet also works w/ fastparquet). When no
+engine can be imported, segments are written as pandas pickle files instead.
+
+"""
+
+from imports import *
+from Comment_Buffer import Comment_Buffer
+
+
+class Comment_Archive():
+    TABLES = ('comments', 'mentions')                   # Comment table (Comment, Time, Sentiment, Author, Text, WAL Segments) and mention table (Comment, Ticker)
+    ENGINES = {'parquet': ('pyarrow', 'fastparquet'),   # Segment file format --> modules that can read/write it
+               'feather': ('pyarrow',),
+               'pickle' : ()}
+
+    def __init__(self, dir_path, file_format='parquet'):
+        self.dir_path = dir_path                        # Trading session directory (ex. from get_dir_path())
+        self.archive_path = os.path.join(dir_path, 'wsb_comments')     # One sub-directory of segments per table
+        self.file_format = file_format                  # Segment file format ('parquet', 'feather' or 'pickle')
+        self.next_comment_id = None                     # Archive comment id of the next appended comment (read from the archive when first needed)
+
+
+
+    @classmethod
+    def get_supported_format(cls, file_format='parquet'):
+        # Return file_format if one of its engines can be imported, else 'pickle' (no extra dependency)
+        for engine in cls.ENGINES[file_format]:
+            try:
+                importlib.import_module(engine)
+                return file_format
+
+            except ImportError:                         # Engine not installed (or not importable, ex. built for another numpy version)
+                continue
+
+        if cls.ENGINES[file_format]:
+            logging.warning(f"*** No {file_format} engine found (install {' or '.join(cls.ENGINES[file_format])}). . . Archiving comments as pickle files. . .")
+            return 'pickle'
+        return file_format
+
+
+
+    def get_segment_paths(self, table):
+        table_path = os.path.join(self.archive_path, table)     # Return segment files of a table (oldest first)
+        if not os.path.exists(table_path):
+            return list()
+        return [os.path.join(table_path, filename) for filename in sorted(os.listdir(table_path)) if filename.endswith(f'.{self.file_format}')]
+
+
+
+    def write_segment(self, df, table, segment):
+        table_path = os.path.join(self.archive_path, table)
+        path = os.path.join(table_path, f"{segment:06d}.{self.file_format}")
+        temp_path = os.path.join(table_path, f".{segment:06d}.{self.file_format}.tmp")     # Hidden temp file (ignored by readers until renamed)
+        os.makedirs(table_path, exist_ok=True)
+
+        if self.file_format == 'feather':
+            df.reset_index(drop=True).to_feather(temp_path)
+        elif self.file_format == 'pickle':
+            df.reset_index(drop=True).to_pickle(temp_path)
+        else:
+            df.to_parquet(temp_path, index=False)
+        os.replace(temp_path, path)                     # Segment appears complete or not at all
+
+
+
+    def read_table(self, table, columns=None):
+        # Read a table from all segments, only loading the requested columns (duplicate rows left by an interrupted compaction are dropped)
+        paths = self.get_segment_paths(table)
+        if not paths:
+            return None
+
+        if self.file_format == 'feather':
+            df = pd.concat([pd.read_feather(path, columns=columns) for path in paths], ignore_index=True)
+        elif self.file_format == 'pickle':              # (Whole segments are read, then only the requested columns are kept)
+            df = pd.concat([pd.read_pickle(path) for path in paths], ignore_index=True)
+            df = df[columns] if columns is not None else df
+        else:
+            df = pd.read_parquet(os.path.join(self.archive_path, table), columns=columns)
+
+        key = ['Comment'] if table == 'comments' else ['Comment', 'Ticker']
+        if all(column in df.columns for column in key):
+            df = df.drop_duplicates(subset=key, ignore_index=True)
+        return df
+
+
+
+    def get_next_comment_id(self):
+        if self.next_comment_id is None:                # Only the comment id column is read from disk
+            comments_df = self.read_table('comments', columns=['Comment'])
+            self.next_comment_id = 0 if comments_df is None or comments_df.empty else int(comments_df['Comment'].max()) + 1
+        return self.next_comment_id
+
+
+
+    def append(self, comments_df, mentions_df, wal_segments=()):
+        # Append new comments (comment table indexed by comment id + mention table) as a new segment of each table (O(new comments))
+        # and return both tables renumbered w/ archive comment ids
+        # (wal_segments: write-ahead log segments of the comments, stored in the same segment so they are not replayed again after a crash)
+        if comments_df.empty:
+            return comments_df, mentions_df
+
+        # Store comment ids --> archive comment ids (unique across every run that writes to this session)
+        first_id = self.get_next_comment_id()
+        archive_ids = np.arange(first_id, first_id + len(comments_df))
+        comments_df = comments_df.reset_index()
+        mentions_df = mentions_df.assign(Comment=archive_ids[pd.Index(comments_df['Comment']).get_indexer(mentions_df['Comment'])])
+        comments_df['Comment'] = archive_ids
+        comments_df['WAL Segments'] = ",".join(str(segment) for segment in wal_segments)
+
+        segment = max([int(os.path.basename(path).split('.')[0]) for path in self.get_segment_paths('comments')], default=-1) + 1
+        self.write_segment(mentions_df, 'mentions', segment)        # Mentions first, so every archived comment has its mentions
+        self.write_segment(comments_df, 'comments', segment)
+        self.next_comment_id = first_id + len(comments_df)
+        return comments_df.set_index('Comment'), mentions_df
+
+
+
+    def get_wal_segments(self):
+        # Return write-ahead log segments whose comments of this session are in the archive
+        try:
+            df = self.read_table('comments', columns=['WAL Segments'])
+
+        except Exception:                               # Archive written before WAL segments were recorded
+            logging.warning(f"*** Unable to read WAL segments of comment archive '{self.archive_path}'. . .", exc_info=True)
+            return set()
+
+        if df is None:
+            return set()
+        return {int(segment) for segments in df['WAL Segments'].dropna().unique() for segment in segments.split(',') if segment}
+
+
+
+    def read_comments(self, columns=None):
+        df = self.read_table('comments', columns)       # Return comment table (only the requested columns)
+        return df if df is not None else Comment_Buffer().get_comments_df().reset_index()[columns or slice(None)]
+
+
+
+    def read_mentions(self, columns=None):
+        df = self.read_table('mentions', columns)       # Return mention table (only the requested columns)
+        return df if df is not None else Comment_Buffer().get_mentions_df()[columns or slice(None)]
+
+
+
+    @staticmethod
+    def join_tables(comments_df, mentions_df, columns=None):
+        # Return the comment dataframe view (Time, Sentiment, Ticker, Text) of a comment table (indexed by comment id) and mention table
+        columns = columns or Comment_Buffer.COLUMNS
+        df = comments_df.join(mentions_df.set_index('Comment'), how='left') if 'Ticker' in columns else comments_df
+        return df.sort_index(kind='stable')[columns]
+
+
+
+    def to_df(self, columns=None):
+        # Rebuild the comment dataframe view (Time, Sentiment, Ticker, Text) w/ one row per mentioned ticker (only reads the columns needed)
+        columns = columns or Comment_Buffer.COLUMNS
+        comments_df = self.read_comments(['Comment'] + [column for column in columns if column != 'Ticker']).set_index('Comment')
+        return self.join_tables(comments_df, self.read_mentions(['Comment', 'Ticker']), columns)
+
+
+
+    def compact(self):
+        # Merge all segments of each table into one segment (fewer files to open for readers)
+        for table in self.TABLES:
+            paths = self.get_segment_paths(table)
+            if len(paths) > 1:
+                df = self.read_table(table)
+                self.write_segment(df, table, int(os.path.basename(paths[-1]).split('.')[0]) + 1)
+                for path in paths:                      # (Rows duplicated by an interrupted compaction are dropped by readers)
+                    os.remove(path)
+
+
+
+    def export_excel(self, file_name='wsb_comments'):
+        print(f'>>> Writing excel file {file_name}. . . ')
+        self.to_df().reset_index(drop=True).to_excel(os.path.join(self.dir_path, f'{file_name}.xlsx'))     # Human readable copy of the archive
+
+
+
+    def __len__(self):
+        return self.get_next_comment_id()               # Number of archived comments
@@ -0,0 +1,147 @@
+"""
+Comment_Buffer.py
+------------------
+Contains class functions for storing collected WSB sentiment comments in
+column lists (amortized O(1) appends) and building a dataframe on request.
+Each comment is stored once (comment table) w/ a thin table of the tickers it
+mentions (mention table). Sentiment labels and tickers are stored as compact integer codes.
+
+"""
+
+import array
+from imports import *
+
+
+SENTIMENT_LABELS = ('none', 'bullish', '(bullish)', 'bearish', '(bearish)')        # Sentiment label for each sentiment code (code = index)
+SENTIMENT_CODES  = {label: code for code, label in enumerate(SENTIMENT_LABELS)}     # Sentiment label --> sentiment code
+BULLISH_CODES    = (SENTIMENT_CODES['bullish'], SENTIMENT_CODES['(bullish)'])       # Bullish and possible bullish sentiment codes
+BEARISH_CODES    = (SENTIMENT_CODES['bearish'], SENTIMENT_CODES['(bearish)'])       # Bearish and possible bearish sentiment codes
+UNKNOWN_CODE     = -1                                                               # Code for unknown sentiment labels and "None" tickers (missing value)
+
+
+
+def get_sentiment_code(sentiment):
+    return SENTIMENT_CODES.get(sentiment, UNKNOWN_CODE)                 # Return sentiment code for a sentiment label (-1 for potential garbage)
+
+
+
+class Comment_Buffer():
+    COLUMNS = ['Time', 'Sentiment', 'Ticker', 'Text']                   # Columns of the comment dataframe view (one row per mentioned ticker)
+
+    def __init__(self):
+        self.comments = {'Time'      : list(),                          # Comment table (comment id = row index)
+                         'Sentiment' : array.array('b'),                # Sentiment codes (int8)
+                         'Author'    : list(),
+                         'Text'      : list()}
+        self.mentions = {'Comment'   : array.array('i'),                # Mention table (comment id, ticker code) in comment order
+                         'Ticker'    : array.array('i')}
+        self.tickers = list()                                           # Ticker dictionary (ticker code --> ticker symbol)
+        self.ticker_codes = dict()                                      # Ticker symbol --> ticker code
+        self.df_cache = None                                            # Last dataframe built from all comments (reused until new comments are appended)
+
+
+
+    def append(self, time_stamp, sentiment_code, author, mentioned_tickers, text):
+        comment_id = len(self.comments['Time'])
+
+        self.comments['Time'].append(time_stamp)                        # Append comment once to the comment table
+        self.comments['Sentiment'].append(sentiment_code)
+        self.comments['Author'].append(author)
+        self.comments['Text'].append(text)
+
+        for ticker in mentioned_tickers:                                # Append one (comment id, ticker code) row per mentioned ticker
+            ticker_code = self.ticker_codes.get(ticker)
+            if ticker_code is None:                                     # Dictionary-encode ticker
+                ticker_code = self.ticker_codes[ticker] = len(self.tickers)
+                self.tickers.append(ticker)
+
+            self.mentions['Comment'].append(comment_id)
+            self.mentions['Ticker'].append(ticker_code)
+
+        return comment_id
+
+
+
+    def get_comments_df(self, start=0):
+        # Build comment table dataframe (one row per comment, indexed by comment id) from comment id "start" onward
+        df = pd.DataFrame({'Time'      : self.comments['Time'][start:],
+                           'Sentiment' : pd.Categorical.from_codes(np.array(self.comments['Sentiment'][start:], dtype=np.int8), categories=SENTIMENT_LABELS),
+                           'Author'    : self.comments['Author'][start:],
+                           'Text'      : self.comments['Text'][start:]})
+        df.index += start
+        df.index.name = 'Comment'
+        return df
+
+
+
+    def get_mentions_df(self, start=0):
+        # Build mention table dataframe (comment id, ticker) for comments from comment id "start" onward
+        comment_ids = np.array(self.mentions['Comment'], dtype=np.int32)
+        first = int(np.searchsorted(comment_ids, start))                # Mentions are stored in comment order
+        return pd.DataFrame({'Comment' : comment_ids[first:],
+                             'Ticker'  : pd.Categorical.from_codes(np.array(self.mentions['Ticker'][first:], dtype=np.int32), categories=self.tickers)})
+
+
+
+    def to_df(self, start=0):
+        # Build the comment dataframe view (Time, Sentiment, Ticker, Text) w/ one row per mentioned ticker ("None" ticker for comments
+        # w/o tickers) for comments from comment id "start" onward (indexed by comment id, Sentiment and Ticker are categorical columns)
+        if start == 0 and self.df_cache is not None and self.df_cache.attrs.get('Comments') == len(self):
+            return self.df_cache
+
+        num_comments = len(self) - start
+        comment_ids = np.array(self.mentions['Comment'], dtype=np.int32)
+        first = int(np.searchsorted(comment_ids, start))
+        comment_ids = comment_ids[first:] - start
+        ticker_codes = np.array(self.mentions['Ticker'][first:], dtype=np.int32)
+
+        # Join comment table and mention table (comments w/o mentions get one row w/ a missing ticker)
+        no_mentions = np.flatnonzero(np.bincount(comment_ids, minlength=num_comments) == 0)
+        row_comments = np.concatenate((comment_ids, no_mentions))
+        row_tickers = np.concatenate((ticker_codes, np.full(len(no_mentions), UNKNOWN_CODE, dtype=np.int32)))
+        order = np.argsort(row_comments, kind='stable')                 # Rows in comment order (mentions in first mentioned order)
+        row_comments, row_tickers = row_comments[order], row_tickers[order]
+
+        df = pd.DataFrame({'Time'      : np.array(self.comments['Time'][start:], dtype=object)[row_comments],
+                           'Sentiment' : pd.Categorical.from_codes(np.array(self.comments['Sentiment'][start:], dtype=np.int8)[row_comments], categories=SENTIMENT_LABELS),
+                           'Ticker'    : pd.Categorical.from_codes(row_tickers, categories=self.tickers),
+                           'Text'      : np.array(self.comments['Text'][start:], dtype=object)[row_comments]},
+                          index=pd.Index(row_comments + start, name='Comment'), columns=self.COLUMNS)
+
+        if start == 0:
+            df.attrs['Comments'] = len(self)
+            self.df_cache = df
+
+        return df
+
+
+
+    def clear(self):
+        for values in (*self.comments.values(), *self.mentions.values()):  # Remove all comments and mentions from the buffer
+            del values[:]
+        self.tickers, self.ticker_codes = list(), dict()
+        self.df_cache = None
+
+
+
+    def __getstate__(self):
+        state = self.__dict__.copy()                                    # Pickle comment/mention tables and ticker dictionary (not the cached dataframe)
+        state['df_cache'] = None
+        return state
+
+
+
+    def __len__(self):
+        return len(self.comments['Time'])                               # Number of comments in the buffer
+
+
+
+    @property
+    def empty(self):
+        return len(self) == 0                                           # True if no comments are in the buffer (same as DataFrame.empty)
+
+
+
+    @property
+    def num_mentions(self):
+        return len(self.mentions['Comment'])                            # Number of ticker mentions in the buffer
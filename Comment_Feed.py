@@ -0,0 +1,93 @@
+"""
+Comment_Feed.py
+----------------
+Contains class functions for finding new lines in the WSB "comment-area" feed.
+New lines are found relative to the previous page (lines above the previous page's
+first line, or below its last line), and pages that cannot be lined up w/ the previous
+page (ex. re-rendered or reordered) are diffed against a bounded (LRU) hash index of
+previously seen comment lines.
+
+"""
+
+from imports import *
+from collections import OrderedDict
+
+
+class Comment_Feed():
+    def __init__(self, max_seen=50000):
+        self.max_seen = max_seen                        # Max number of comment lines remembered by the seen comment index
+        self.seen_index = OrderedDict()                 # Seen (comment header, line) keys (ordered from least to most recently seen)
+        self.prev_page = None                           # Previous "comment-area" text (skip work if page has not changed)
+        self.prev_lines = list()                        # Lines of the previous page (anchor for the next page)
+
+
+
+    def get_line_keys(self, lines):
+        # Return seen index key of each line (header lines are keyed by themselves, continuation lines by their comment's header line + line)
+        keys, header = list(), None
+        for line in lines:
+            if ("bullish" in line) or ("bearish" in line) or ("none" in line):     # Comment header line (sentiment / time / author / text)
+                header = line
+                keys.append(line)
+            else:
+                keys.append((header, line))
+        return keys
+
+
+
+    def find_new_lines(self, lines):
+        # Return new lines of a page lined up w/ the previous page (None if the page cannot be lined up)
+        prev_lines = self.prev_lines
+        if not prev_lines:
+            return None
+
+        first_line, last_line = prev_lines[0], prev_lines[-1]
+        min_overlap = (min(len(lines), len(prev_lines)) + 1) // 2     # At least half of the page must line up w/ the previous page
+        for i in range(len(lines) - min_overlap + 1):   # New comments at the top (previous page scrolls down, its last lines may drop off)
+            if lines[i] == first_line and lines[i:] == prev_lines[:len(lines) - i]:
+                return lines[:i]
+
+        for i in range(len(lines) - 1, min_overlap - 2, -1):    # New comments at the bottom (previous page scrolls up, its first lines may drop off)
+            if lines[i] == last_line and lines[:i + 1] == prev_lines[len(prev_lines) - i - 1:]:
+                return lines[i + 1:]
+
+        return None
+
+
+
+    def get_new_lines(self, page_text):
+        if page_text == self.prev_page:                 # If page has not changed since last poll, there are no new lines
+            return []
+
+        self.prev_page = page_text
+
+        lines = page_text.splitlines()
+        seen_index = self.seen_index
+
+        # Lines above/below the previous page are new (repeated lines, ex. the same one-word reply, are new each time they are posted)
+        new_lines = self.find_new_lines(lines)
+        if new_lines is not None:                       # O(new lines), lines of the previous page are already in the seen comment index
+            keys = self.get_line_keys(new_lines)
+        else:                                           # Page re-rendered or reordered, O(1) hash lookup per line (lines already seen are not new)
+            keys = self.get_line_keys(lines)
+            new_lines = [line for line, key in zip(lines, keys) if key not in seen_index]
+
+        for key in keys:                                # Add lines to the seen comment index after the page has been diffed
+            seen_index[key] = None                      # (identical new lines on the same page are all kept, like the original diff)
+            seen_index.move_to_end(key)                 # Mark line as recently seen
+
+        while len(seen_index) > self.max_seen:          # Evict least recently seen lines to keep the index bounded
+            seen_index.popitem(last=False)
+
+        self.prev_lines = lines
+        return new_lines
+
+
+
+    def seed(self, page_text):
+        self.get_new_lines(page_text)                   # Mark all lines currently on the page as seen (ignore comments posted before startup)
+
+
+
+    def __len__(self):
+        return len(self.seen_index)                     # Number of comment lines in the seen comment index
@@ -0,0 +1,263 @@
+"""
+Comment_Source.py
+------------------
+Contains class functions for the sources of WSB "comment-area" text used by the
+WSB sentiment collector (live Selenium webpage, JSON comment feed over HTTP, or offline
+replay of recorded snapshots).
+
+"""
+
+import abc
+import json
+import asyncio
+import globals
+from imports import *
+from Async_Http_Client import Async_Http_Client
+
+
+class Comment_Source(abc.ABC):
+    # Subclasses must override open/close/is_open/read (a source missing one fails when it is constructed)
+    requires_network = True         # Collector checks network connectivity before reading from the source
+    skip_initial_page = True        # Collector ignores comments already on the page when the source is first opened
+    self_paced = False              # Source waits between reads itself (collector does not need to wait between polls)
+    live = True                     # Source collects live comments (collector starts from the session's archived comments and write-ahead log)
+
+    @abc.abstractmethod
+    def open(self):
+        pass                        # Open the comment source (ex. start webdriver, open replay file)
+
+    @abc.abstractmethod
+    def close(self):
+        pass                        # Close the comment source
+
+    @abc.abstractmethod
+    def is_open(self):
+        pass                        # Return True if the comment source is open
+
+    @abc.abstractmethod
+    def read(self):
+        pass                        # Return the current "comment-area" text (None if the source has no more comments)
+
+
+
+class Selenium_Source(Comment_Source):
+    def __init__(self, url=None, **kwargs):
+        self.url = url or globals.URL                                                           # URL to WSB sentiment AI webpage
+        self.driver = None                                                                      # Initialize chrome webdriver to None
+        self.binary_location = kwargs.get('binary_location',                                    # Chrome executable location
+                                          r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe")
+        self.executable_path = kwargs.get('executable_path',                                    # Chrome webdriver executable location
+                                          r"C:\Program Files (x86)\Google\chromedriver_win32\chromedriver.exe")
+        self.record_path = kwargs.get('record_path')                                            # JSONL file to record "comment-area" snapshots to (replay later)
+        self.prev_text = None                                                                   # Last recorded "comment-area" text
+
+
+
+    def open(self):
+
+        print(">>> Setting Up Chrome Webdriver. . .")
+
+        # Create Chrome webdriver options
+        options = webdriver.ChromeOptions()                                                     # Create webdriver instance
+        options.add_argument('--headless')                                                      # Make windowless browser
+        options.headless = True                                                                 # Prevents chrome window from opening
+        options.add_experimental_option("excludeSwitches", ["enable-logging"])                  # Prevents chrome webdriver logging
+        if self.binary_location:
+            options.binary_location = self.binary_location                                      # Specify chrome webdriver executable location (Dont know if we need this)
+
+        # Create Chrome webdriver using webdriver options
+        try:
+            if self.executable_path:
+                self.driver = webdriver.Chrome(executable_path=self.executable_path, options=options)
+            else:
+                self.driver = webdriver.Chrome(options=options)                                 # Use chromedriver found on PATH
+            self.driver.delete_all_cookies()             # Delete all cookies (Dont know if we really need to do this)
+            self.driver.get(self.url)                    # Open the WSB AI using the site URL
+            return
+
+        # If driver cannot connect to URL, return "None" value
+        except selenium_exceptions.WebDriverException:
+            logging.error(f"*** WebDriverException: Could not reach URL {self.url}. . .")
+            self.driver = None
+            return
+
+        # If unknown exception occured, return "None" value
+        except Exception:
+            logging.error(f"*** Unexpected Exception Occured! ***", exc_info=True)
+            self.driver = None
+            return
+
+
+
+    def close(self):
+        if self.driver is not None:                             # If driver is still active, shutdown driver
+            print('>>> Shutting Down Chrome Webdriver . . .')
+            self.driver.quit()                                  # Shut down chrome webdriver
+            self.driver = None                                  # Set driver to "None" value
+
+        return
+
+
+
+    def is_open(self):
+        return self.driver is not None
+
+
+
+    def read(self):
+        # Get WSB comments from "comment-area" section of webpage (raises AttributeError if the driver is not set up)
+        text = self.driver.find_element_by_id("comment-area").text
+
+        if self.record_path and text != self.prev_text:         # Record changed snapshots so the session can be replayed offline
+            with open(self.record_path, 'a', encoding='utf-8') as file:
+                file.write(json.dumps({'timestamp': time.time(), 'comment_area': text}) + '\n')
+            self.prev_text = text
+
+        return text
+
+
+
+class Replay_Source(Comment_Source):
+    requires_network = False        # Replay does not need a network connection or browser
+    skip_initial_page = False       # All comments in the recording are replayed (including the first snapshot)
+    self_paced = True               # Replay speed sets the wait between snapshots
+    live = False                    # Replayed comments are not added to live session data (archive, write-ahead log, history)
+
+    def __init__(self, path, speed=None, interval=1.0):
+        self.path = path                                        # Directory of snapshot .txt files or JSONL file of {"timestamp", "comment_area"} snapshots
+        self.speed = speed                                      # Replay speed (1.0 = real-time, 2.0 = twice as fast, None = as fast as possible)
+        self.interval = interval                                # Seconds between snapshots that have no timestamp (real-time replay)
+        self.snapshots = None                                   # Iterator of (timestamp, comment_area) snapshots
+        self.prev_timestamp = None                              # Timestamp of the previous snapshot read
+
+
+
+    def load_snapshots(self):
+        if os.path.isdir(self.path):                            # Directory of "comment-area" text snapshots (replayed in file name order)
+            for filename in sorted(os.listdir(self.path)):
+                if filename.endswith('.txt'):
+                    with open(os.path.join(self.path, filename), 'r', encoding='utf-8') as file:
+                        yield None, file.read()
+
+        else:                                                   # JSONL file of "comment-area" text snapshots (one snapshot per line)
+            with open(self.path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    if line.strip():
+                        record = json.loads(line)
+                        yield record.get('timestamp'), record['comment_area']
+
+
+
+    def open(self):
+        print(f">>> Replaying WSB comments from {self.path}. . .")
+        self.snapshots = self.load_snapshots()
+        self.prev_timestamp = None
+
+
+
+    def close(self):
+        if self.snapshots is not None:
+            self.snapshots.close()                              # Close the replay file
+            self.snapshots = None
+
+
+
+    def is_open(self):
+        return self.snapshots is not None
+
+
+
+    def read(self):
+        if self.snapshots is None:                              # If source is not open, there are no more comments
+            return None
+
+        try:
+            timestamp, text = next(self.snapshots)
+
+        except StopIteration:                                   # If all snapshots have been replayed, there are no more comments
+            self.close()
+            return None
+
+        if self.speed:                                          # Wait between snapshots to replay at (scaled) real-time speed
+            if timestamp is None:
+                delay = self.interval
+            elif self.prev_timestamp is None:
+                delay = 0
+            else:
+                delay = timestamp - self.prev_timestamp
+            time.sleep(max(delay, 0) / self.speed)
+
+        self.prev_timestamp = timestamp
+        return text
+
+
+
+class Http_Source(Comment_Source):
+    def __init__(self, urls, max_connections=4, timeout=10.0, retries=3):
+        self.urls = [urls] if isinstance(urls, str) else list(urls)    # JSON comment feed URL(s) (fetched concurrently and merged in order)
+        self.max_connections = max_connections                          # Max number of requests in flight at the same time
+        self.timeout = timeout                                          # Seconds to wait for a connection or response
+        self.retries = retries                                          # Number of times a failed request is retried
+        self.client = None                                              # Asyncio HTTP client (keep-alive connections are reused between reads)
+        self.loop = None                                                # Asyncio event loop (runs on a background thread)
+        self.loop_thread = None
+
+
+
+    def open(self):
+        print(f">>> Connecting to WSB comment feed {', '.join(self.urls)}. . .")
+        self.loop = asyncio.new_event_loop()
+        self.loop_thread = threading.Thread(name="WSBHttpSourceThread", target=self.loop.run_forever, daemon=True)
+        self.loop_thread.start()
+        self.client = Async_Http_Client(max_connections=self.max_connections, timeout=self.timeout, retries=self.retries)
+
+
+
+    def close(self):
+        if self.loop is not None:                                       # If event loop is still running, close connections and stop the loop
+            asyncio.run_coroutine_threadsafe(self.client.close(), self.loop).result()
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.loop_thread.join()
+            self.loop.close()
+            self.loop, self.loop_thread, self.client = None, None, None
+
+        return
+
+
+
+    def is_open(self):
+        return self.loop is not None
+
+
+
+    def read(self):
+        if self.loop is None:                                           # Source is not connected (same as a lost network connection)
+            raise ConnectionError("WSB comment feed is not connected")
+
+        return asyncio.run_coroutine_threadsafe(self.fetch_comment_area(), self.loop).result()
+
+
+
+    async def fetch_comment_area(self):
+        feeds = await asyncio.gather(*(self.client.get_json(url) for url in self.urls), return_exceptions=True)
+
+        # Convert JSON comments to "comment-area" lines (sentiment / time / author / text) so they use the same parsing as the webpage
+        lines, connection_errors = list(), list()
+        for url, feed in zip(self.urls, feeds):
+            if isinstance(feed, ConnectionError):       # Connection issue (already retried w/ backoff), other feeds are still read
+                connection_errors.append(feed)
+                continue
+            if isinstance(feed, Exception) or not isinstance(feed, (dict, list)):  # Client error (ex. HTTP 404) or malformed JSON, read as an empty feed (not retried)
+                logging.warning(f"*** Skipping WSB comment feed {url} ({feed if isinstance(feed, Exception) else 'unexpected JSON'}). . .")
+                continue
+
+            for comment in (feed.get('comments', list()) if isinstance(feed, dict) else feed):
+                try:
+                    lines.append(f"{comment['sentiment']} [{comment['time']}] {comment['author']} {comment['text']}")
+                except (KeyError, TypeError):           # Skip malformed comments
+                    logging.warning(f"*** Skipping malformed comment from WSB comment feed {url}. . .")
+
+        if connection_errors and len(connection_errors) == len(self.urls):     # No feed could be reached (retried by the WSB sentiment loop)
+            raise connection_errors[0]
+
+        return "\n".join(lines)
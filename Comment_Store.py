@@ -0,0 +1,181 @@
+"""
+Comment_Store.py
+-----------------
+Contains class functions for a rolling WSB comment store that keeps a window of
+recent partitions (ex. trading sessions) in memory and spills older partitions to
+on-disk segments that can still be queried (or only drops them from memory when
+another store already holds them, ex. the comment archive). Comments are numbered w/
+a store wide comment sequence number (comment id).
+
+"""
+
+from imports import *
+from Comment_Buffer import Comment_Buffer
+
+
+class Comment_Store():
+    COMMENT_OVERHEAD = 150                              # Estimated bytes per comment not counting the comment text (list slots, time/author strings, sentiment code)
+    MENTION_OVERHEAD = 8                                # Bytes per ticker mention (comment id and ticker code)
+
+    def __init__(self, window_partitions=1, max_memory_mb=256, spill_dir='Data/comment_segments', on_spill=None):
+        self.window_partitions = window_partitions      # Number of partitions (ex. trading sessions) kept in memory
+        self.max_memory_bytes = max_memory_mb * 1024 * 1024     # Estimated memory ceiling for in-memory comments
+        self.spill_dir = spill_dir                      # Directory for on-disk comment segments (one sub-directory per partition, None = drop spilled comments)
+        self.on_spill = on_spill                        # Called w/ a partition before its comments leave memory (ex. hand unwritten comments to the archive)
+        self.run_id = dt.datetime.now().strftime("%Y%m%d%H%M%S")    # Prefix for segment files written by this run
+        self.partitions = list()                        # In-memory partitions [{'Partition', 'Start', 'Buffer'}] (oldest first)
+        self.segments = list()                          # Spilled segments written by this run [{'Partition', 'Start', 'End', 'Path'}]
+        self.total_comments = 0                         # Number of comments ever appended (comment id of the next comment)
+        self.memory_bytes = 0                           # Estimated memory used by in-memory comments
+        self.spilled_comments = 0                       # Number of comments moved out of memory
+
+
+
+    def append(self, time_stamp, sentiment_code, author, mentioned_tickers, text, partition=None):
+        if not self.partitions or self.partitions[-1]['Partition'] != partition:    # New partition (ex. new trading session) rolls the window
+            self.partitions.append({'Partition': partition, 'Start': self.total_comments, 'Buffer': Comment_Buffer()})
+            while len(self.partitions) > self.window_partitions:
+                self.spill(self.partitions[0])
+
+        self.partitions[-1]['Buffer'].append(time_stamp, sentiment_code, author, mentioned_tickers, text)
+        self.total_comments += 1
+        self.memory_bytes += self.get_comment_bytes(text, len(mentioned_tickers))
+
+        if self.memory_bytes > self.max_memory_bytes:   # Enforce memory ceiling by spilling the oldest comments out of memory
+            self.spill(self.partitions[0])
+
+        return self.total_comments - 1                  # Return comment id
+
+
+
+    def get_comment_bytes(self, text, num_mentions):
+        return self.COMMENT_OVERHEAD + sys.getsizeof(text) + (num_mentions * self.MENTION_OVERHEAD)     # Estimated memory used by one comment
+
+
+
+    def spill(self, partition):
+        if self.on_spill is not None:
+            self.on_spill(partition)
+        buffer = partition['Buffer']
+
+        if not buffer.empty and self.spill_dir is not None:     # Write partition comments to an on-disk segment
+            partition_dir = os.path.join(self.spill_dir, str(partition['Partition']))
+            path = os.path.join(partition_dir, f"{self.run_id}_{partition['Start']:012d}.pkl")
+            os.makedirs(partition_dir, exist_ok=True)
+            with open(path, 'wb') as file:
+                pickle.dump(buffer, file, protocol=pickle.HIGHEST_PROTOCOL)          # Comment/mention tables + ticker dictionary
+
+            self.segments.append({'Partition' : partition['Partition'],
+                                  'Start'     : partition['Start'],
+                                  'End'       : partition['Start'] + len(buffer),
+                                  'Path'      : path})
+
+        self.spilled_comments += len(buffer)
+        self.memory_bytes -= sum(self.COMMENT_OVERHEAD + sys.getsizeof(text) for text in buffer.comments['Text']) + (buffer.num_mentions * self.MENTION_OVERHEAD)
+
+        if partition is self.partitions[-1]:            # Current partition stays open (empty) for new comments
+            partition['Start'] += len(buffer)
+            partition['Buffer'] = Comment_Buffer()
+        else:
+            self.partitions.remove(partition)
+
+
+
+    def load_segment_buffer(self, path):
+        with open(path, 'rb') as file:                  # Read spilled segment back into a comment buffer
+            return pickle.load(file)
+
+
+
+    def load_segment(self, path, start=0):
+        df = self.load_segment_buffer(path).to_df()     # Read spilled segment back into a dataframe view (indexed by comment id)
+        df.index += start
+        return df
+
+
+
+    def to_df(self, start=None):
+        # Build dataframe view from the in-memory window (or from every comment w/ comment id >= "start", loading spilled comments if needed)
+        df_list = list()
+        if start is not None:
+            df_list = [self.load_segment(segment['Path'], segment['Start']) for segment in self.segments if segment['End'] > start]
+
+        for partition in self.partitions:
+            if start is None or partition['Start'] + len(partition['Buffer']) > start:
+                df = partition['Buffer'].to_df(start=max((start or 0) - partition['Start'], 0))
+                df_list.append(df.set_axis(df.index + partition['Start']))         # Buffer comment ids --> store comment ids
+
+        if not df_list:
+            return pd.DataFrame(columns=Comment_Buffer.COLUMNS)
+
+        df = pd.concat(df_list)
+        return df if start is None else df[df.index >= start]
+
+
+
+    def get_partition_tables(self, start=0):
+        # Return [(partition, comment table, mention table)] for every comment w/ comment id >= "start" (loading spilled comments if needed)
+        # (tables use store comment ids, partitions are in comment order)
+        buffers = [(segment['Partition'], segment['Start'], self.load_segment_buffer(segment['Path'])) for segment in self.segments if segment['End'] > start]
+        buffers += [(partition['Partition'], partition['Start'], partition['Buffer']) for partition in self.partitions
+                    if partition['Start'] + len(partition['Buffer']) > start]
+
+        tables = list()
+        for partition, buffer_start, buffer in buffers:
+            comments_df = buffer.get_comments_df(max(start - buffer_start, 0))
+            mentions_df = buffer.get_mentions_df(max(start - buffer_start, 0))
+            comments_df.index += buffer_start               # Buffer comment ids --> store comment ids
+            mentions_df['Comment'] += buffer_start
+
+            if tables and tables[-1][0] == partition:       # Merge consecutive buffers of the same partition
+                tables[-1] = (partition, pd.concat([tables[-1][1], comments_df]), pd.concat([tables[-1][2], mentions_df], ignore_index=True))
+            else:
+                tables.append((partition, comments_df, mentions_df))
+
+        return tables
+
+
+
+    def get_tables(self, start=0):
+        # Return (comment table, mention table) dataframes for every comment w/ comment id >= "start" (store comment ids)
+        tables = self.get_partition_tables(start)
+        if not tables:
+            return Comment_Buffer().get_comments_df(), Comment_Buffer().get_mentions_df()
+
+        return pd.concat([table[1] for table in tables]), pd.concat([table[2] for table in tables], ignore_index=True)
+
+
+
+    def query(self, partition, ticker=None):
+        # Return all comments for a partition (ex. trading session) from disk segments (any run) and memory, optionally for one ticker
+        df_list = list()
+        partition_dir = os.path.join(self.spill_dir, str(partition)) if self.spill_dir is not None else None
+        if partition_dir is not None and os.path.exists(partition_dir):
+            df_list += [self.load_segment(os.path.join(partition_dir, filename)) for filename in sorted(os.listdir(partition_dir))]
+
+        df_list += [memory_partition['Buffer'].to_df() for memory_partition in self.partitions if memory_partition['Partition'] == partition]
+
+        df = pd.concat(df_list, ignore_index=True) if df_list else pd.DataFrame(columns=Comment_Buffer.COLUMNS)
+        return df if ticker is None else df[df['Ticker'] == ticker].reset_index(drop=True)
+
+
+
+    def get_window_info(self):
+        return {'Partitions'            : [partition['Partition'] for partition in self.partitions],  # Partitions held in memory
+                'Comments In Memory'    : len(self),                                                # Comments held in memory
+                'Mentions In Memory'    : sum(partition['Buffer'].num_mentions for partition in self.partitions),  # Ticker mentions held in memory
+                'Memory MB'             : round(self.memory_bytes / (1024 * 1024), 2),              # Estimated memory used by in-memory comments
+                'Max Memory MB'         : round(self.max_memory_bytes / (1024 * 1024), 2),          # Memory ceiling
+                'Spilled Segments'      : len(self.segments),                                       # Segments spilled to disk by this run
+                'Spilled Comments'      : self.spilled_comments}                                    # Comments moved out of memory (to disk segments or dropped)
+
+
+
+    def __len__(self):
+        return sum(len(partition['Buffer']) for partition in self.partitions)      # Number of comments held in memory
+
+
+
+    @property
+    def empty(self):
+        return self.total_comments == 0                                             # True if no comments have ever been appended
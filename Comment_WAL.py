@@ -0,0 +1,124 @@
+"""
+Comment_WAL.py
+---------------
+Contains class functions for an append-only write-ahead log (WAL) of ingested WSB
+comments. Records are written as they are collected and fsync'd in groups (every
+"fsync_batch" records or "fsync_interval" seconds), so comments collected since the
+last flush to the comment archive can be replayed after a crash.
+
+"""
+
+import json
+from imports import *
+
+
+class Comment_WAL():
+    def __init__(self, wal_dir='Data/comment_wal', fsync_interval=1.0, fsync_batch=256):
+        self.wal_dir = wal_dir                          # Directory of WAL segment files (one segment per flush to the comment archive)
+        self.fsync_interval = fsync_interval            # Max seconds a written record waits for fsync (group commit)
+        self.fsync_batch = fsync_batch                  # Max records written between fsyncs
+        self.lock = threading.Lock()
+        self.file = None                                # Open segment file (opened on first append)
+        self.segment = None                             # Sequence number of the open segment
+        self.pending = 0                                # Records written since the last fsync
+        self.last_sync = time.monotonic()               # Time of the last fsync
+        self.syncs = 0                                  # Number of fsyncs (group commits)
+        self.next_segment = int(time.time() * 1000)     # Segment numbers are never reused (each run starts at the current time in ms),
+                                                        # so segments recorded in the comment archive never match a later segment
+        self.closed_segments = [segment for segment, _ in self.get_segment_paths()]    # Closed segments not yet in a flush (segments on disk at startup are replayed)
+
+
+
+    def get_segment_paths(self):
+        if not os.path.exists(self.wal_dir):            # Return [(segment, path)] of all WAL segments (oldest first)
+            return list()
+        return sorted((int(filename.split('.')[0]), os.path.join(self.wal_dir, filename)) for filename in os.listdir(self.wal_dir) if filename.endswith('.wal'))
+
+
+
+    def open_segment(self):
+        os.makedirs(self.wal_dir, exist_ok=True)        # Start a new segment after the newest segment on disk
+        self.segment = max(max([segment for segment, _ in self.get_segment_paths()], default=-1) + 1, self.next_segment)
+        self.next_segment = self.segment + 1
+        self.file = open(os.path.join(self.wal_dir, f"{self.segment:012d}.wal"), 'a', encoding='utf-8', newline='\n')
+
+
+
+    def append(self, session, sentiment, time_stamp, author, text, timestamp):
+        # Write one comment record (O(1), fsync'd once per group of records)
+        record = json.dumps([timestamp, session, sentiment, time_stamp, author, text], ensure_ascii=False)
+        with self.lock:
+            if self.file is None:
+                self.open_segment()
+            self.file.write(record + '\n')
+            self.pending += 1
+            if self.pending >= self.fsync_batch or (time.monotonic() - self.last_sync) >= self.fsync_interval:
+                self.sync_locked()
+
+
+
+    def sync_locked(self):
+        if self.file is not None and self.pending:      # Flush written records to disk (caller holds the lock)
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.syncs += 1
+        self.pending = 0
+        self.last_sync = time.monotonic()
+
+
+
+    def sync(self):
+        with self.lock:                                 # Flush written records to disk now (ex. before exiting)
+            self.sync_locked()
+
+
+
+    def sync_if_due(self):
+        with self.lock:                                 # Flush written records to disk if the oldest one has waited "fsync_interval" seconds
+            if self.pending and (time.monotonic() - self.last_sync) >= self.fsync_interval:
+                self.sync_locked()
+
+
+
+    def rotate(self):
+        # Close the open segment (new records go to a new segment) and return sequence numbers of all closed segments not yet in a flush
+        with self.lock:
+            if self.file is not None:
+                self.sync_locked()
+                self.file.close()
+                self.closed_segments.append(self.segment)
+                self.file, self.segment = None, None
+            segments, self.closed_segments = self.closed_segments, list()
+            return segments
+
+
+
+    def checkpoint(self, segments):
+        # Remove the segments of one flush once its comments are in the comment archive (they no longer need to be replayed)
+        # (Only these segments, the segments of a flush that failed to write are kept until it is written)
+        for segment in segments:
+            path = os.path.join(self.wal_dir, f"{segment:012d}.wal")
+            if segment != self.segment and os.path.exists(path):   # (Never the open segment)
+                os.remove(path)
+
+
+
+    def replay(self):
+        # Yield (segment, timestamp, session, sentiment, time stamp, author, text) of every record in the WAL (oldest first)
+        for segment, path in self.get_segment_paths():
+            with open(path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    try:
+                        yield (segment, *json.loads(line))
+                    except ValueError:                  # Partially written last record (crash during a write)
+                        logging.warning(f"*** Skipping partially written WAL record in '{path}'. . .")
+                        break
+
+
+
+    def close(self):
+        with self.lock:                                 # Flush written records to disk and close the open segment
+            self.sync_locked()
+            if self.file is not None:
+                self.file.close()
+                self.file = None
@@ -0,0 +1,166 @@
+"""
+Market_Data.py
+---------------
+Contains class functions for collecting stock market data (Yahoo finance) for many
+tickers at once. Open prices are collected w/ one multi-symbol request, and only the
+tickers missing from it are requested one by one (bounded thread pool).
+
+Per ticker history and fundamentals (info) are cached for "ttl" seconds by (ticker,
+endpoint, period), and concurrent requests for the same key wait on the one request in
+flight, so every analysis of a ticker shares one request per endpoint.
+
+"""
+
+from imports import *
+
+
+class Market_Data():
+    def __init__(self, max_workers=8, ttl=300):
+        self.max_workers = max_workers                  # Max concurrent per-symbol requests (fallback for tickers missing from the batched request)
+        self.last_fetch = dict()                        # Timing of the last open price collection
+        self.ttl = ttl                                  # Seconds a cached response is reused
+        self.cache = dict()                             # (Ticker, endpoint, period) --> (expire time, response)
+        self.in_flight = dict()                         # (Ticker, endpoint, period) --> future of the request in flight (request coalescing)
+        self.cache_lock = threading.Lock()              # Cache is shared by the WSB thread, main thread and thread pools
+        self.hits, self.misses, self.coalesced = 0, 0, 0    # Cached responses / requests sent / requests that waited on a request in flight
+
+
+
+    def get_cached(self, key, function):
+        # Return cached response of key, else wait on the request in flight for key, else request it w/ function()
+        with self.cache_lock:
+            cached = self.cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                self.hits += 1
+                return cached[1]
+
+            future = self.in_flight.get(key)
+            request = future is None                    # Only the first caller sends the request
+            if request:
+                future = self.in_flight[key] = concurrent.futures.Future()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not request:
+            return future.result()                      # Raises the exception of the request in flight (failed requests are not cached)
+
+        try:
+            response = function()
+            with self.cache_lock:
+                self.cache[key] = (time.monotonic() + self.ttl, response)
+            future.set_result(response)
+            return response
+
+        except BaseException as e:                      # Waiting callers get the same exception
+            future.set_exception(e)
+            raise
+
+        finally:
+            with self.cache_lock:
+                del self.in_flight[key]
+
+
+
+    def download(self, tickers, period='1d'):
+        # Return daily price history of all tickers w/ one multi-symbol request (columns: (ticker, Open/High/Low/Close/Volume))
+        return yf.download(list(tickers), period=period, group_by='ticker', auto_adjust=False, threads=True, progress=False)
+
+
+
+    def request_history(self, ticker, period='1mo'):
+        return yf.Ticker(ticker).history(period=period)     # Request daily price history of a ticker (not cached)
+
+
+
+    def request_info(self, ticker):
+        return yf.Ticker(ticker).info                   # Request fundamentals of a ticker (not cached)
+
+
+
+    def get_history(self, ticker, period='1mo'):
+        # Return daily price history of a ticker (cached)
+        return self.get_cached((ticker, 'history', period), lambda: self.request_history(ticker, period))
+
+
+
+    def get_info(self, ticker):
+        # Return fundamentals of a ticker (ex. previousClose, averageVolume, beta) (cached)
+        return self.get_cached((ticker, 'info', None), lambda: self.request_info(ticker))
+
+
+
+    def get_open_price(self, ticker):
+        try:                                            # Return open price of one ticker (per-symbol request)
+            return self.get_info(ticker)['open']
+
+        except (IndexError, KeyError):                  # If unable to obtain open price via first method, try second method
+            try:
+                return self.get_history(ticker, period='1d').iloc[0]['Open']
+
+            except Exception:                           # If unable to obtain open price via second method, return "None" value
+                logging.error(f">>> Failed to collect open price for {ticker}. . .", exc_info=True)
+                return None
+
+        except Exception:
+            logging.error(f">>> Failed to collect open price for {ticker}. . .", exc_info=True)
+            return None
+
+
+
+    def get_open_prices(self, tickers):
+        # Return {ticker: open price} w/ one batched request, falling back to concurrent per-symbol requests for missing tickers
+        start = time.perf_counter()
+        open_prices = dict.fromkeys(tickers)
+        if not open_prices:
+            return open_prices
+
+        try:
+            history_df = self.download(tickers, period='1d')
+            for ticker in tickers:
+                if isinstance(history_df.columns, pd.MultiIndex) and ticker in history_df.columns.get_level_values(0):
+                    opens = history_df[ticker]['Open'].dropna()
+                    if not opens.empty:
+                        open_prices[ticker] = float(opens.iloc[-1])
+
+        except Exception:                               # Batched request failed, every ticker falls back to a per-symbol request
+            logging.warning("*** Batched open price request failed. . . Requesting open prices per ticker. . .", exc_info=True)
+        batch_elapsed = time.perf_counter() - start
+
+        missing_tickers = [ticker for ticker in tickers if open_prices[ticker] is None]
+        if missing_tickers:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing_tickers))) as executor:
+                for ticker, open_price in zip(missing_tickers, executor.map(self.get_open_price, missing_tickers)):
+                    open_prices[ticker] = open_price
+
+        self.last_fetch = {'Tickers'            : len(tickers),
+                           'Batched'            : len(tickers) - len(missing_tickers),
+                           'Fallback'           : len(missing_tickers),
+                           'Failed'             : sum(open_price is None for open_price in open_prices.values()),
+                           'Batch Seconds'      : round(batch_elapsed, 3),
+                           'Total Seconds'      : round(time.perf_counter() - start, 3)}
+        return open_prices
+
+
+
+    def get_last_fetch(self):
+        return self.last_fetch                          # Return timing of the last open price collection
+
+
+
+    def get_cache_stats(self):
+        with self.cache_lock:                           # Return cached responses vs. requests sent for per ticker history and info
+            requests = self.hits + self.misses + self.coalesced
+            return {'Hits'              : self.hits,
+                    'Coalesced'         : self.coalesced,
+                    'Misses'            : self.misses,
+                    'Cached'            : len(self.cache),
+                    'Hit Rate'          : round((self.hits + self.coalesced) / requests * 100, 1) if requests else None}
+
+
+
+    def reset_cache_stats(self):
+        with self.cache_lock:                           # Reset cache stats and drop expired responses (ex. start of an analysis run)
+            now = time.monotonic()
+            self.cache = {key: cached for key, cached in self.cache.items() if cached[0] > now}
+            self.hits, self.misses, self.coalesced = 0, 0, 0
@@ -0,0 +1,118 @@
+"""
+Mention_Spike_Detector.py
+--------------------------
+Contains class functions for detecting tickers whose WSB mention rate suddenly
+accelerates, using exponentially decayed mention and bullish/bearish rates per ticker
+(short horizon rate vs. long horizon baseline).
+
+"""
+
+import math
+from collections import deque
+from imports import *
+from Comment_Buffer import BULLISH_CODES, BEARISH_CODES
+
+
+class Mention_Spike_Detector():
+    # Per ticker state indexes
+    LAST_TIME, SHORT, LONG, SHORT_BULL, SHORT_BEAR, SPIKING = range(6)
+
+    def __init__(self, short_half_life=60.0, long_half_life=3600.0, spike_factor=3.0, min_mentions=5.0, warmup=300.0, max_spikes=1000):
+        self.short_tau = short_half_life / math.log(2)      # Short horizon time constant in seconds (recent mention rate)
+        self.long_tau = long_half_life / math.log(2)        # Long horizon time constant in seconds (baseline mention rate)
+        self.spike_factor = spike_factor                    # Flag ticker when short horizon rate > spike_factor * long horizon rate
+        self.min_mentions = min_mentions                    # Decayed short horizon mentions needed before a ticker can be flagged
+        self.warmup = warmup                                # Seconds after the first mention before tickers are flagged (every ticker is "new" at startup)
+        self.start_time = None                              # Time of the first mention
+        self.lock = threading.Lock()                        # State is updated by the WSB thread and read by the main thread
+        self.tickers = dict()                               # Ticker --> [last time, short count, long count, short bull count, short bear count, spiking]
+        self.spikes = deque(maxlen=max_spikes)              # Most recent spike events (oldest first)
+        self.new_spikes = list()                            # Spike events not yet collected w/ pop_new_spikes()
+        self.updates = 0                                    # Number of mentions since the last prune of inactive tickers
+
+
+
+    def add(self, sentiment_code, mentioned_tickers, timestamp=None):
+        now = timestamp if timestamp is not None else time.time()
+        bull = 1 if sentiment_code in BULLISH_CODES else 0
+        bear = 1 if sentiment_code in BEARISH_CODES else 0
+
+        with self.lock:
+            if self.start_time is None:
+                self.start_time = now
+            warmed_up = (now - self.start_time) >= self.warmup
+
+            for ticker in mentioned_tickers:
+                state = self.tickers.get(ticker)
+                if state is None:
+                    state = self.tickers[ticker] = [now, 0.0, 0.0, 0.0, 0.0, False]
+
+                # Decay counts to the current time, then count the new mention (O(1) per mention)
+                elapsed = max(now - state[self.LAST_TIME], 0.0)
+                short_decay, long_decay = math.exp(-elapsed / self.short_tau), math.exp(-elapsed / self.long_tau)
+                state[self.LAST_TIME] = max(now, state[self.LAST_TIME])
+                state[self.SHORT] = state[self.SHORT] * short_decay + 1
+                state[self.LONG] = state[self.LONG] * long_decay + 1
+                state[self.SHORT_BULL] = state[self.SHORT_BULL] * short_decay + bull
+                state[self.SHORT_BEAR] = state[self.SHORT_BEAR] * short_decay + bear
+
+                short_rate, long_rate = state[self.SHORT] / self.short_tau, state[self.LONG] / self.long_tau   # Mentions per second
+                spiking = (state[self.SHORT] >= self.min_mentions) and (short_rate > self.spike_factor * long_rate)
+
+                if spiking and warmed_up and not state[self.SPIKING]:     # Only flag a ticker when it starts spiking
+                    spike = {'Ticker'           : ticker,
+                             'Time'             : dt.datetime.fromtimestamp(now),
+                             'Short Rate'       : short_rate * 60,                  # Mentions per minute
+                             'Long Rate'        : long_rate * 60,
+                             'Rate Ratio'       : short_rate / long_rate,
+                             'Bull/Bear Ratio'  : state[self.SHORT_BULL] / max(state[self.SHORT_BEAR], 1)}
+                    self.spikes.append(spike)
+                    self.new_spikes.append(spike)
+                state[self.SPIKING] = spiking
+
+            self.updates += len(mentioned_tickers)
+            if self.updates >= max(len(self.tickers), 1000):     # Prune inactive tickers (amortized O(1) per mention)
+                self.prune(now)
+
+
+
+    def prune(self, now):
+        # Remove tickers whose long horizon count has decayed away (memory stays O(active tickers))
+        self.tickers = {ticker: state for ticker, state in self.tickers.items()
+                        if state[self.LONG] * math.exp(-max(now - state[self.LAST_TIME], 0.0) / self.long_tau) >= 0.01}
+        self.updates = 0
+
+
+
+    def pop_new_spikes(self):
+        with self.lock:                                     # Return spike events since the last call
+            new_spikes, self.new_spikes = self.new_spikes, list()
+        return new_spikes
+
+
+
+    def get_spikes_df(self):
+        with self.lock:                                     # Return most recent spike events (oldest first)
+            return pd.DataFrame(list(self.spikes), columns=['Ticker', 'Time', 'Short Rate', 'Long Rate', 'Rate Ratio', 'Bull/Bear Ratio'])
+
+
+
+    def get_spiking_tickers(self, timestamp=None):
+        # Return tickers currently above the spike threshold (rates decayed to the current time)
+        now = timestamp if timestamp is not None else time.time()
+        spiking_tickers = list()
+
+        with self.lock:
+            for ticker, state in self.tickers.items():
+                elapsed = max(now - state[self.LAST_TIME], 0.0)
+                short_count = state[self.SHORT] * math.exp(-elapsed / self.short_tau)
+                long_count = state[self.LONG] * math.exp(-elapsed / self.long_tau)
+                if (short_count >= self.min_mentions) and (short_count / self.short_tau > self.spike_factor * long_count / self.long_tau):
+                    spiking_tickers.append(ticker)
+
+        return spiking_tickers
+
+
+
+    def __len__(self):
+        return len(self.tickers)                            # Number of active tickers tracked
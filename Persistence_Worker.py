@@ -0,0 +1,100 @@
+"""
+Persistence_Worker.py
+----------------------
+Contains class functions for a background persistence thread. The WSB comment thread
+hands off immutable snapshots (ex. new comment tables, ticker sentiment) through a
+bounded queue and the worker writes them to disk in order, so collecting comments
+never waits on disk I/O.
+
+"""
+
+from imports import *
+
+
+class Persistence_Worker():
+    def __init__(self, max_queue=8, name="WSBPersistenceThread"):
+        self.name = name                                # Name of the worker thread
+        self.tasks = Queue(maxsize=max_queue)           # Bounded hand-off queue of (submit time, name, function, args)
+        self.lock = threading.Lock()                    # Stats are updated by the worker thread and read by other threads
+        self.thread = None                              # Worker thread (started on first submit)
+        self.tasks_done = 0                             # Number of tasks written
+        self.tasks_failed = 0                           # Number of tasks that raised an exception
+        self.tasks_rejected = 0                         # Number of tasks not queued because the queue was full
+        self.last_latency = None                        # Seconds from submit to written of the last task
+        self.max_latency = 0.0                          # Largest submit to written latency in seconds
+        self.total_latency = 0.0                        # Sum of submit to written latencies (mean latency = total / tasks done)
+
+
+
+    def start(self):
+        if self.thread is None or not self.thread.is_alive():  # Start background worker thread
+            self.thread = threading.Thread(name=self.name, target=self.run, daemon=True)
+            self.thread.start()
+
+
+
+    def submit(self, name, function, *args):
+        # Queue function(*args) to run on the worker thread w/o blocking (returns False if the queue is full)
+        self.start()
+        try:
+            self.tasks.put_nowait((time.perf_counter(), name, function, args))
+            return True
+
+        except queue.Full:
+            with self.lock:
+                self.tasks_rejected += 1
+            return False
+
+
+
+    def run(self):
+        while True:                                     # Run queued tasks in submit order until stopped
+            task = self.tasks.get()
+            if task is None:
+                self.tasks.task_done()
+                break
+
+            submit_time, name, function, args = task
+            try:
+                function(*args)
+
+            except Exception:                           # Keep writing later tasks if one fails
+                logging.error(f"*** Unexpected Exception Occured! (Persistence Worker: {name}) ***", exc_info=True)
+                with self.lock:
+                    self.tasks_failed += 1
+
+            finally:
+                latency = time.perf_counter() - submit_time
+                with self.lock:
+                    self.tasks_done += 1
+                    self.last_latency = latency
+                    self.max_latency = max(self.max_latency, latency)
+                    self.total_latency += latency
+                self.tasks.task_done()
+
+
+
+    def drain(self):
+        if self.thread is not None and self.thread.is_alive():  # Wait until every queued task is written
+            self.tasks.join()
+
+
+
+    def stop(self):
+        if self.thread is not None and self.thread.is_alive():  # Write every queued task, then stop the worker thread
+            self.tasks.put(None)
+            self.thread.join()
+        self.thread = None
+
+
+
+    def get_stats(self):
+        with self.lock:                                 # Return queue depth and submit to written latency (milliseconds)
+            return {'Queue Depth'       : self.tasks.qsize(),
+                    'Max Queue'         : self.tasks.maxsize,
+                    'Tasks Done'        : self.tasks_done,
+                    'Tasks Failed'      : self.tasks_failed,
+                    'Tasks Rejected'    : self.tasks_rejected,
+                    'Last Latency MS'   : None if self.last_latency is None else round(self.last_latency * 1000, 1),
+                    'Mean Latency MS'   : round(self.total_latency / self.tasks_done * 1000, 1) if self.tasks_done else None,
+                    'Max Latency MS'    : round(self.max_latency * 1000, 1)}
@@ -0,0 +1,55 @@
+"""
+Poll_Scheduler.py
+------------------
+Contains class functions for adapting the WSB comment feed poll interval to the
+observed comment arrival rate (fast polling at peak, backoff when the feed is idle).
+
+"""
+
+from imports import *
+
+
+class Poll_Scheduler():
+    def __init__(self, min_interval=0.25, max_interval=10.0, target_comments=5, backoff=1.5, smoothing=0.3):
+        self.min_interval = min_interval            # Shortest wait between polls in seconds (latency at peak comment rates)
+        self.max_interval = max_interval            # Longest wait between polls in seconds (idle feed)
+        self.target_comments = target_comments      # Number of new comment lines we want to find per poll
+        self.backoff = backoff                      # Interval multiplier applied after each poll with no new comments
+        self.smoothing = smoothing                  # Weight of the newest sample in the arrival rate moving average
+        self.interval = min_interval                # Current wait between polls in seconds
+        self.arrival_rate = 0.0                     # Exponential moving average of new comment lines per second
+        self.prev_poll_time = None                  # Time of the previous poll (monotonic clock)
+
+
+
+    def update(self, new_comments):
+        now = time.monotonic()
+
+        if self.prev_poll_time is not None:                             # Update comment arrival rate from the new lines found since the last poll
+            elapsed = max(now - self.prev_poll_time, 1e-6)
+            self.arrival_rate += self.smoothing * ((new_comments / elapsed) - self.arrival_rate)
+        self.prev_poll_time = now
+
+        if new_comments:                                                # Feed is active, poll about once per "target_comments" new lines
+            interval = self.target_comments / self.arrival_rate if self.arrival_rate > 0 else self.min_interval
+        else:                                                           # Feed is idle, back off the poll interval
+            interval = self.interval * self.backoff
+
+        self.interval = min(max(interval, self.min_interval), self.max_interval)
+
+        return self.interval
+
+
+
+    def wait(self):
+        time.sleep(self.interval)                                       # Sleep until the next poll (no busy waiting)
+
+
+
+    def get_interval(self):
+        return self.interval                                            # Return current wait between polls in seconds
+
+
+
+    def get_arrival_rate(self):
+        return self.arrival_rate                                        # Return moving average of new comment lines per second
@@ -0,0 +1,118 @@
+"""
+Sentiment_Aggregator.py
+------------------------
+Contains class functions for keeping overall and per ticker bullish/bearish counts
+up to date as each WSB comment is collected (no full recomputation per report).
+
+"""
+
+import heapq
+from imports import *
+from Comment_Buffer import BULLISH_CODES, BEARISH_CODES
+
+
+class Sentiment_Aggregator():
+    BULLISH = ('bullish', '(bullish)')                  # Bullish and possible bullish sentiment
+    BEARISH = ('bearish', '(bearish)')                  # Bearish and possible bearish sentiment
+
+    def __init__(self):
+        self.lock = threading.Lock()                    # Counters are updated by the WSB thread and read by the main thread
+        self.bull_count = 0                             # Overall bullish count (one per comment row, same as the comment dataframe)
+        self.bear_count = 0                             # Overall bearish count
+        self.ticker_counts = dict()                     # Ticker --> [bullish count, bearish count] (in first mentioned order)
+
+
+
+    def add(self, sentiment_code, mentioned_tickers):
+        if sentiment_code in BULLISH_CODES:             # Index of counter to increment (0 = bullish, 1 = bearish)
+            idx = 0
+        elif sentiment_code in BEARISH_CODES:
+            idx = 1
+        else:                                           # Ignore all other sentiment (potential garbage)
+            return
+
+        with self.lock:
+            rows = max(len(mentioned_tickers), 1)       # Comment is counted once per mentioned ticker (one row per ticker)
+            if idx == 0:
+                self.bull_count += rows
+            else:
+                self.bear_count += rows
+
+            for ticker in mentioned_tickers:
+                counts = self.ticker_counts.get(ticker)
+                if counts is None:
+                    counts = self.ticker_counts[ticker] = [0, 0]
+                counts[idx] += 1
+
+
+
+    def reset(self):
+        with self.lock:                                 # Clear all counters (ex. new trading session)
+            self.bull_count, self.bear_count = 0, 0
+            self.ticker_counts = dict()
+
+
+
+    def rebuild(self, wsb_sentiment_df):
+        # Replace all counters w/ the counts of a comment dataframe (ex. recovery from an archived wsb_comments excel file)
+        ticker_sentiment_df = self.build_ticker_sentiment_df(wsb_sentiment_df, clamp=False)
+        sentiment = wsb_sentiment_df['Sentiment']
+
+        with self.lock:
+            self.bull_count = int(sentiment.isin(self.BULLISH).sum())
+            self.bear_count = int(sentiment.isin(self.BEARISH).sum())
+            self.ticker_counts = {ticker: [int(bull), int(bear)] for ticker, bull, bear in ticker_sentiment_df[['Bullish Count', 'Bearish Count']].itertuples()}
+
+
+
+    @classmethod
+    def build_ticker_sentiment_df(cls, wsb_sentiment_df, clamp=True):
+        # Build the (Ticker, Bullish Count, Bearish Count, Bull/Bear Ratio) table from a comment dataframe in one vectorized pass
+        # (sorted from largest to smallest Bullish and Bearish count, bearish count of 0 is reported as 1 unless "clamp" is False)
+        sentiment = wsb_sentiment_df['Sentiment']
+        bearish = sentiment.isin(cls.BEARISH).to_numpy()
+        keep = bearish | sentiment.isin(cls.BULLISH).to_numpy()                                            # Only bullish/bearish comments (remove potential garbage)
+        ticker_codes, tickers = pd.factorize(wsb_sentiment_df['Ticker'][keep])                            # Tickers in first mentioned order ("None" --> -1)
+
+        mentioned = ticker_codes >= 0
+        counts = np.bincount(ticker_codes[mentioned] * 2 + bearish[keep][mentioned], minlength=2 * len(tickers)).reshape(-1, 2)
+
+        ticker_sentiment_df = pd.DataFrame({'Ticker': np.asarray(tickers, dtype=object), 'Bullish Count': counts[:, 0], 'Bearish Count': counts[:, 1]})
+
+        bear_count = ticker_sentiment_df['Bearish Count'].clip(lower=1)                                  # Bearish count of 0 is treated as 1 (no divide by zero)
+        if clamp:
+            ticker_sentiment_df['Bearish Count'] = bear_count
+        ticker_sentiment_df['Bull/Bear Ratio'] = ticker_sentiment_df['Bullish Count'] / bear_count
+
+        ticker_sentiment_df = ticker_sentiment_df.sort_values(by=['Bullish Count', 'Bearish Count'], ascending=False, kind='stable')
+        return ticker_sentiment_df.set_index('Ticker')
+
+
+
+    def get_counts(self):
+        return self.bull_count, self.bear_count         # Return overall (bullish count, bearish count)
+
+
+
+    def get_overall_sentiment(self):
+        return self.bull_count / max(self.bear_count, 1)    # Return overall bull/bear ratio (bearish count of 0 is treated as 1)
+
+
+
+    def get_ticker_rows(self):
+        # Return (Ticker, Bullish Count, Bearish Count, Bull/Bear Ratio) rows (bearish count of 0 is reported as 1, like sentiment_analysis())
+        with self.lock:
+            return [(ticker, bull, max(bear, 1), bull / max(bear, 1)) for ticker, (bull, bear) in self.ticker_counts.items()]
+
+
+
+    def get_top_tickers(self, k=10):
+        # Return top k rows sorted from largest to smallest Bullish and Bearish count (O(n log k) instead of sorting every ticker)
+        return heapq.nlargest(k, self.get_ticker_rows(), key=lambda row: (row[1], row[2]))
+
+
+
+    def get_ticker_sentiment_df(self, k=None):
+        rows = self.get_top_tickers(k if k is not None else len(self.ticker_counts))
+        df = pd.DataFrame(rows, columns=['Ticker', 'Bullish Count', 'Bearish Count', 'Bull/Bear Ratio'])
+        return df.set_index('Ticker')                   # Return ticker sentiment dataframe (sorted, indexed by ticker symbol)
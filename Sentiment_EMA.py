@@ -0,0 +1,99 @@
+"""
+Sentiment_EMA.py
+-----------------
+Contains class functions for keeping exponential moving averages (EMA) of the daily
+overall bull/bear ratio for several spans (ex. 5/10/20 days). Each span keeps only its
+latest EMA (persisted in the sentiment history), so a new day is an O(1) update and
+re-running the same day replaces that day's value instead of counting it twice.
+
+"""
+
+from imports import *
+
+
+class Sentiment_EMA():
+    def __init__(self, sentiment_history, spans=(5, 10, 20)):
+        self.sentiment_history = sentiment_history      # Sentiment history (persists EMA state and daily overall sentiment)
+        self.spans = tuple(spans)                       # EMA spans in days
+        self.lock = threading.Lock()
+        self.state = None                               # Span --> {'Date', 'Value', 'EMA', 'Previous Date', 'Previous EMA'} (loaded on first use)
+
+
+
+    @staticmethod
+    def step(span, state, date, value):
+        # Return EMA state after adding the bull/bear ratio of a day (same as pandas ewm(span, adjust=False))
+        if state['Date'] == date:                       # Same day re-run, replace today's value (start from the previous day's EMA)
+            previous_date, previous_ema = state['Previous Date'], state['Previous EMA']
+        elif state['Date'] is None or date > state['Date']:
+            previous_date, previous_ema = state['Date'], state['EMA']
+        else:                                           # Days older than the latest day are already included
+            return state
+
+        alpha = 2 / (span + 1)
+        ema = value if previous_ema is None else (alpha * value) + ((1 - alpha) * previous_ema)
+        return {'Date': date, 'Value': value, 'EMA': ema, 'Previous Date': previous_date, 'Previous EMA': previous_ema}
+
+
+
+    def load(self):
+        # Load EMA state from history (spans w/o state are computed once from the daily overall sentiment history)
+        if self.state is None:
+            self.state = self.sentiment_history.get_ema_state()
+            missing_spans = [span for span in self.spans if span not in self.state]
+            if missing_spans:
+                self.rebuild(missing_spans)
+        return self.state
+
+
+
+    def rebuild(self, spans):
+        sessions_df = self.sentiment_history.get_session_sentiment_df()       # One pass over the daily overall sentiment (oldest first)
+        for span in spans:
+            state = {'Date': None, 'Value': None, 'EMA': None, 'Previous Date': None, 'Previous EMA': None}
+            for date, value in zip(sessions_df['Date'], sessions_df['Bull/Bear Ratio']):
+                state = self.step(span, state, date, value)
+            self.state[span] = state
+        self.sentiment_history.write_ema_state({span: self.state[span] for span in spans})
+
+
+
+    def add_span(self, span):
+        with self.lock:                                 # Start keeping the EMA of another span
+            if span not in self.spans:
+                self.spans += (span,)
+                if self.state is not None:
+                    self.rebuild([span])
+
+
+
+    def update(self, date, value):
+        # Add the bull/bear ratio of a day (ex. "2021-03-08") to every span (O(1) per span) and return {span: EMA}
+        with self.lock:
+            state = self.load()
+            for span in self.spans:
+                state[span] = self.step(span, state[span], date, value)
+            self.sentiment_history.write_ema_state({span: state[span] for span in self.spans})
+            return {span: state[span]['EMA'] for span in self.spans}
+
+
+
+    def get_ema(self, span=10):
+        with self.lock:                                 # Return latest EMA of a span (None if no days were added)
+            return self.load()[span]['EMA']
+
+
+
+    def get_signal(self, value, span=10):
+        ema = self.get_ema(span)                        # Return 'BUY' if bull/bear ratio is above its EMA, 'SELL' if below, else 'HOLD'
+        if ema is None or value == ema:
+            return 'HOLD'
+        return 'BUY' if value > ema else 'SELL'
+
+
+
+    def get_ema_df(self):
+        with self.lock:                                 # Return latest day, bull/bear ratio, and EMA of each span
+            state = self.load()
+            rows = [(f'{span}-day EMA', state[span]['Date'], state[span]['Value'], state[span]['EMA']) for span in self.spans]
+        return pd.DataFrame(rows, columns=['Span', 'Date', 'Bull/Bear Ratio', 'EMA']).set_index('Span')
@@ -0,0 +1,207 @@
+"""
+Sentiment_History.py
+---------------------
+Contains class functions for an indexed SQLite (WAL mode) history of WSB comment
+sentiment and ticker mentions, ticker sentiment, top ticker reports, and overall
+sentiment for every trading session, so history lookups (ex. ticker sentiment over the
+last 30 sessions) are single queries instead of reading excel files from many
+Data/wsb_sentiment_* directories. Comment text and authors are only kept in each
+session's comment archive.
+
+"""
+
+import glob
+import sqlite3
+from imports import *
+
+
+class Sentiment_History():
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS sessions         (session TEXT PRIMARY KEY, session_date TEXT, bullish INTEGER, bearish INTEGER, ratio REAL);
+        CREATE TABLE IF NOT EXISTS comments         (session TEXT, comment INTEGER, time TEXT, sentiment TEXT, PRIMARY KEY (session, comment));
+        CREATE TABLE IF NOT EXISTS mentions         (session TEXT, comment INTEGER, ticker TEXT);
+        CREATE TABLE IF NOT EXISTS ticker_sentiment (session TEXT, session_date TEXT, ticker TEXT, bullish INTEGER, bearish INTEGER, ratio REAL, PRIMARY KEY (session, ticker));
+        CREATE TABLE IF NOT EXISTS top_tickers      (session TEXT, session_date TEXT, rank INTEGER, ticker TEXT, bullish INTEGER, bearish INTEGER, ratio REAL,
+                                                     sentiment_percent_change REAL, open REAL, close REAL, price_percent_change REAL, PRIMARY KEY (session, ticker));
+        CREATE TABLE IF NOT EXISTS ema_state        (span INTEGER PRIMARY KEY, date TEXT, value REAL, ema REAL, previous_date TEXT, previous_ema REAL);
+        CREATE INDEX IF NOT EXISTS sessions_date            ON sessions (session_date);
+        CREATE INDEX IF NOT EXISTS mentions_ticker          ON mentions (ticker, session);
+        CREATE INDEX IF NOT EXISTS mentions_comment         ON mentions (session, comment);
+        CREATE INDEX IF NOT EXISTS ticker_sentiment_date    ON ticker_sentiment (session_date);
+        CREATE INDEX IF NOT EXISTS ticker_sentiment_ticker  ON ticker_sentiment (ticker, session_date);
+        CREATE INDEX IF NOT EXISTS top_tickers_date         ON top_tickers (session_date);
+        CREATE INDEX IF NOT EXISTS top_tickers_ticker       ON top_tickers (ticker, session_date);
+    """
+
+    # Top ticker report dataframe column --> top_tickers table column
+    TOP_TICKER_COLUMNS = {'Bullish Count'            : 'bullish',
+                          'Bearish Count'            : 'bearish',
+                          'Bull/Bear Ratio'          : 'ratio',
+                          'Sentiment Percent Change' : 'sentiment_percent_change',
+                          'Open'                     : 'open',
+                          'Close'                    : 'close',
+                          'Price Percent Change'     : 'price_percent_change'}
+
+    def __init__(self, db_path='Data/wsb_history.db'):
+        self.db_path = db_path                          # SQLite database file
+        self.lock = threading.Lock()                    # Connection is shared by the WSB thread (comments) and the main thread (reports)
+        self.connection = None                          # Opened on first use
+
+
+
+    def connect(self):
+        if self.connection is None:                     # Open database in WAL mode (readers don't block the writer, one fsync per commit at most)
+            if os.path.dirname(self.db_path):
+                os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.executescript(self.SCHEMA)
+        return self.connection
+
+
+
+    def get_session_date(self, session):
+        return str(session).rsplit('_', 1)[-1]         # Market day a session reports on (ex. wsb_sentiment_2021-03-05_2021-03-08 --> 2021-03-08)
+
+
+
+    def execute_many(self, statements):
+        # Run [(sql, rows)] in one transaction (one commit per batch)
+        with self.lock:
+            connection = self.connect()
+            with connection:
+                for sql, rows in statements:
+                    connection.executemany(sql, rows)
+
+
+
+    def query(self, sql, parameters=()):
+        with self.lock:                                 # Return query result as a dataframe
+            return pd.read_sql_query(sql, self.connect(), params=parameters)
+
+
+
+    def add_comments(self, session, comments_df, mentions_df):
+        # Insert sentiment and ticker mentions of a batch of comments (comment table indexed by comment id + mention table) collected for a session
+        # (comment text and author are not stored, they are in the session's comment archive)
+        if comments_df.empty:
+            return
+
+        comment_rows = zip(itertools.repeat(session), comments_df.index.tolist(), comments_df['Time'].tolist(), comments_df['Sentiment'].astype(str).tolist())
+        mention_rows = zip(itertools.repeat(session), mentions_df['Comment'].tolist(), mentions_df['Ticker'].astype(str).tolist())
+
+        self.execute_many([("INSERT OR REPLACE INTO comments (session, comment, time, sentiment) VALUES (?, ?, ?, ?)", comment_rows),
+                           ("INSERT INTO mentions VALUES (?, ?, ?)", mention_rows)])
+
+
+
+    def write_session_sentiment(self, session, bullish, bearish):
+        # Insert or update overall sentiment of a session (re-running on the same session replaces its row)
+        self.execute_many([("INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?)",
+                            [(session, self.get_session_date(session), int(bullish), int(bearish), bullish / max(bearish, 1))])])
+
+
+
+    def write_ticker_sentiment(self, session, ticker_sentiment_df):
+        # Replace ticker sentiment of a session w/ a ticker sentiment dataframe (indexed by ticker)
+        session_date = self.get_session_date(session)
+        rows = zip(itertools.repeat(session), itertools.repeat(session_date), ticker_sentiment_df.index.astype(str).tolist(),
+                   ticker_sentiment_df['Bullish Count'].astype(int).tolist(), ticker_sentiment_df['Bearish Count'].astype(int).tolist(),
+                   ticker_sentiment_df['Bull/Bear Ratio'].astype(float).tolist())
+
+        self.execute_many([("DELETE FROM ticker_sentiment WHERE session = ?", [(session,)]),
+                           ("INSERT INTO ticker_sentiment VALUES (?, ?, ?, ?, ?, ?)", rows)])
+
+
+
+    def write_top_tickers(self, session, top_ticker_sentiment_df):
+        # Replace top ticker report of a session w/ a top ticker sentiment dataframe (indexed by ticker, missing columns are stored as NULL)
+        session_date = self.get_session_date(session)
+        df = top_ticker_sentiment_df.reindex(columns=list(self.TOP_TICKER_COLUMNS)).astype(float)
+        df = df.astype(object).where(df.notna(), None)
+        rows = [(session, session_date, rank, str(ticker), *values) for rank, (ticker, values) in enumerate(zip(df.index, df.values.tolist()))]
+
+        self.execute_many([("DELETE FROM top_tickers WHERE session = ?", [(session,)]),
+                           (f"INSERT INTO top_tickers VALUES (?, ?, ?, ?, {', '.join('?' * len(self.TOP_TICKER_COLUMNS))})", rows)])
+
+
+
+    def get_top_tickers_df(self, session):
+        # Return top ticker report of a session (same columns as the ticker_sentiment_top25 excel file, empty if not found)
+        df = self.query(f"SELECT ticker AS Ticker, {', '.join(f'{column} AS [{name}]' for name, column in self.TOP_TICKER_COLUMNS.items())} "
+                        "FROM top_tickers WHERE session = ? ORDER BY rank", (session,))
+        return df.set_index('Ticker').dropna(axis=1, how='all')
+
+
+
+    def get_ticker_sentiment_df(self, session):
+        # Return ticker sentiment of a session (same columns and order as the ticker_sentiment_all excel file, empty if not found)
+        df = self.query("SELECT ticker AS Ticker, bullish AS [Bullish Count], bearish AS [Bearish Count], ratio AS [Bull/Bear Ratio] "
+                        "FROM ticker_sentiment WHERE session = ? ORDER BY rowid", (session,))
+        return df.set_index('Ticker')
+
+
+
+    def get_ticker_history(self, ticker, n=30):
+        # Return ticker sentiment over the last n sessions the ticker was mentioned in (oldest first)
+        df = self.query("SELECT session_date AS Date, bullish AS [Bullish Count], bearish AS [Bearish Count], ratio AS [Bull/Bear Ratio] "
+                        "FROM ticker_sentiment WHERE ticker = ? ORDER BY session_date DESC LIMIT ?", (ticker, n))
+        return df.iloc[::-1].set_index('Date')
+
+
+
+    def get_session_sentiment_df(self, n=None, end_date=None):
+        # Return overall sentiment of the last n sessions up to "end_date" (oldest first, all sessions if n is None)
+        df = self.query("SELECT session_date AS Date, session AS Session, bullish AS [Bullish Count], bearish AS [Bearish Count], ratio AS [Bull/Bear Ratio] "
+                        "FROM sessions WHERE session_date <= ? ORDER BY session_date DESC LIMIT ?", (end_date or '9999', -1 if n is None else n))
+        return df.iloc[::-1].reset_index(drop=True)
+
+
+
+    def get_ema_state(self):
+        # Return {span: {'Date', 'Value', 'EMA', 'Previous Date', 'Previous EMA'}} of the overall sentiment EMA state
+        df = self.query("SELECT span, date, value, ema, previous_date, previous_ema FROM ema_state")
+        return {int(span): {'Date': date, 'Value': value, 'EMA': ema, 'Previous Date': previous_date, 'Previous EMA': previous_ema}
+                for span, date, value, ema, previous_date, previous_ema in df.astype(object).where(df.notna(), None).itertuples(index=False)}
+
+
+
+    def write_ema_state(self, ema_state):
+        # Insert or update the overall sentiment EMA state of each span
+        self.execute_many([("INSERT OR REPLACE INTO ema_state VALUES (?, ?, ?, ?, ?, ?)",
+                            [(span, state['Date'], state['Value'], state['EMA'], state['Previous Date'], state['Previous EMA']) for span, state in ema_state.items()])])
+
+
+
+    def get_comment_count(self, session=None):
+        if session is None:                             # Return number of comments stored (for a session or all sessions)
+            return int(self.query("SELECT COUNT(*) AS n FROM comments")['n'][0])
+        return int(self.query("SELECT COUNT(*) AS n FROM comments WHERE session = ?", (session,))['n'][0])
+
+
+
+    def import_excel_sessions(self, data_dir='Data'):
+        # Backfill ticker sentiment and top ticker reports from the excel files of existing session directories
+        imported = 0
+        for dir_path in sorted(glob.glob(os.path.join(data_dir, 'wsb_sentiment_*'))):
+            session = os.path.basename(dir_path)
+            try:
+                if os.path.exists(f'{dir_path}/ticker_sentiment_all.xlsx'):
+                    self.write_ticker_sentiment(session, pd.read_excel(f'{dir_path}/ticker_sentiment_all.xlsx', index_col=0, engine='openpyxl'))
+                if os.path.exists(f'{dir_path}/ticker_sentiment_top25.xlsx'):
+                    self.write_top_tickers(session, pd.read_excel(f'{dir_path}/ticker_sentiment_top25.xlsx', index_col=0, engine='openpyxl'))
+                imported += 1
+
+            except Exception:                           # Skip unreadable session directories
+                logging.warning(f"*** Unable to import excel files from '{dir_path}'. . .", exc_info=True)
+
+        return imported
+
+
+
+    def close(self):
+        with self.lock:
+            if self.connection is not None:             # Close database connection
+                self.connection.close()
+                self.connection = None
@@ -0,0 +1,101 @@
+"""
+Sentiment_Timeline.py
+----------------------
+Contains class functions for keeping global and per ticker bullish/bearish counts
+in fixed size time buckets (ex. 1 minute). Overall counts use a preallocated ring
+buffer, per ticker counts only store buckets w/ mentions (memory grows w/ mentions in
+the window, not w/ tickers * buckets, so 1 second buckets over 24 hours stay small).
+
+"""
+
+from imports import *
+from Comment_Buffer import BULLISH_CODES, BEARISH_CODES
+
+
+class Sentiment_Timeline():
+    def __init__(self, bucket_seconds=60, num_buckets=1440):
+        self.bucket_seconds = bucket_seconds            # Length of each time bucket in seconds
+        self.num_buckets = num_buckets                  # Number of buckets kept (default covers 24 hours of 1 minute buckets)
+        self.lock = threading.Lock()                    # Buckets are updated by the WSB thread and read by the main thread
+        self.counts = np.zeros((num_buckets, 2), dtype=np.int64)                        # Ring buffer of overall [bullish, bearish] counts per bucket
+        self.ticker_buckets = dict()                    # Ticker --> {bucket: bullish + (bearish << 32)} (only buckets w/ mentions, tickers w/o mentions in the window are dropped)
+        self.current_bucket = None                      # Newest bucket number (seconds since epoch // bucket_seconds)
+        self.prune_interval = max(num_buckets // 8, 1)  # Buckets between sweeps that drop per ticker buckets older than the window
+        self.last_prune = None                          # Bucket of the last sweep
+
+
+
+    def advance(self, bucket):
+        # Move the newest bucket forward, clearing ring buffer slots of buckets that fell out of the window
+        if self.current_bucket is None or bucket > self.current_bucket:
+            if self.current_bucket is not None:
+                stale = min(bucket - self.current_bucket, self.num_buckets)
+                slots = np.arange(bucket - stale + 1, bucket + 1) % self.num_buckets
+                self.counts[slots] = 0
+            self.current_bucket = bucket
+
+            if self.last_prune is None or bucket - self.last_prune >= self.prune_interval:
+                self.prune()
+
+
+
+    def prune(self):
+        oldest = self.current_bucket - self.num_buckets     # Drop per ticker buckets that fell out of the window (and tickers w/o mentions left)
+        for ticker in list(self.ticker_buckets):
+            buckets = self.ticker_buckets[ticker]
+            for bucket in [bucket for bucket in buckets if bucket <= oldest]:
+                del buckets[bucket]
+            if not buckets:
+                del self.ticker_buckets[ticker]
+        self.last_prune = self.current_bucket
+
+
+
+    def add(self, sentiment_code, mentioned_tickers, timestamp=None):
+        if sentiment_code in BULLISH_CODES:             # Index of counter to increment (0 = bullish, 1 = bearish)
+            idx = 0
+        elif sentiment_code in BEARISH_CODES:
+            idx = 1
+        else:                                           # Ignore all other sentiment (potential garbage)
+            return
+
+        bucket = int((timestamp if timestamp is not None else time.time()) // self.bucket_seconds)
+
+        with self.lock:
+            self.advance(bucket)
+            if bucket <= self.current_bucket - self.num_buckets:    # Comment is older than the oldest bucket kept
+                return
+
+            slot = bucket % self.num_buckets
+            self.counts[slot, idx] += max(len(mentioned_tickers), 1)    # Comment is counted once per mentioned ticker (same as the comment dataframe)
+            increment = 1 << (32 * idx)                 # Both counts packed in one int per bucket (bullish: low 32 bits, bearish: high bits)
+            for ticker in mentioned_tickers:
+                buckets = self.ticker_buckets.get(ticker)
+                if buckets is None:
+                    buckets = self.ticker_buckets[ticker] = dict()
+                buckets[bucket] = buckets.get(bucket, 0) + increment
+
+
+
+    def get_buckets(self, n=None, ticker=None, timestamp=None):
+        # Return the last n buckets (oldest first, ending w/ the current bucket) of overall or ticker bullish/bearish counts
+        n = min(n or self.num_buckets, self.num_buckets)
+
+        with self.lock:
+            self.advance(int((timestamp if timestamp is not None else time.time()) // self.bucket_seconds))
+            buckets = np.arange(self.current_bucket - n + 1, self.current_bucket + 1)
+            slots = buckets % self.num_buckets
+
+            if ticker is None:
+                counts = self.counts[slots]
+            else:                                       # (Buckets w/o ticker mentions stay 0)
+                counts = np.zeros((n, 2), dtype=np.int64)
+                for bucket, packed_counts in self.ticker_buckets.get(ticker, dict()).items():
+                    if bucket >= buckets[0]:
+                        counts[bucket - buckets[0]] = (packed_counts & 0xFFFFFFFF, packed_counts >> 32)
+
+        timeline_df = pd.DataFrame({'Time'              : [dt.datetime.fromtimestamp(bucket * self.bucket_seconds) for bucket in buckets],
+                                    'Bullish Count'     : counts[:, 0],
+                                    'Bearish Count'     : counts[:, 1],
+                                    'Bull/Bear Ratio'   : counts[:, 0] / np.maximum(counts[:, 1], 1)})     # Bearish count of 0 is treated as 1
+        return timeline_df.set_index('Time')
@@ -0,0 +1,64 @@
+"""
+Ticker_Extractor.py
+--------------------
+Contains class functions for extracting mentioned stock tickers from WSB comment
+text in a single pass per comment (single comment and batch APIs).
+
+"""
+
+from imports import *
+
+
+NON_ALPHANUMERIC = re.compile('[^a-zA-Z0-9]+')      # Precompiled pattern for special characters and punctuations attached to tickers
+
+
+class Ticker_Extractor():
+    def __init__(self, ticker_universe, cache_size=100000):
+        self.valid_tickers = ticker_universe.valid_tickers      # Hashed set of valid (mentionable) tickers
+        self.cache_size = cache_size                            # Max number of words kept in the word --> ticker cache
+        self.word_cache = dict()                                # Cache of uppercase word --> ticker (or None if word is not a ticker)
+
+
+
+    def resolve_word(self, word):
+        # Remove all special characters and punctuations that may be attached to the potential ticker (Only keep letters and numbers)
+        if word.isascii() and word.isalnum():
+            ticker = word
+        else:
+            ticker = NON_ALPHANUMERIC.sub('', word)
+
+        if ticker not in self.valid_tickers:                    # Word is not a valid ticker (or is a word to ignore)
+            ticker = None
+
+        if len(self.word_cache) >= self.cache_size:             # Clear the cache if it grows too large (comment vocabulary is unbounded)
+            self.word_cache.clear()
+
+        self.word_cache[word] = ticker                          # Cache result so repeated words are resolved with one dict lookup
+        return ticker
+
+
+
+    def find_mentioned_tickers(self, text):
+        # Determine if any tickers are mentioned in the comment text by finding any words that are uppercase
+        # (Although not always the case, stock ticker symbols are usually written in uppercase)
+        word_cache = self.word_cache
+        mentioned_tickers = dict()                              # Ordered dict used as an ordered set (removes duplicates of same ticker)
+
+        for word in text.split():                               # Single pass over the words in the comment text
+            if not word.isupper():
+                continue
+
+            ticker = word_cache.get(word, word_cache)           # (word_cache is used as a "not cached" sentinel value)
+            if ticker is word_cache:
+                ticker = self.resolve_word(word)
+
+            if ticker is not None:
+                mentioned_tickers[ticker] = None
+
+        return list(mentioned_tickers)
+
+
+
+    def find_mentioned_tickers_batch(self, texts):
+        find_mentioned_tickers = self.find_mentioned_tickers
+        return [find_mentioned_tickers(text) for text in texts]    # Return list of mentioned tickers for each comment text
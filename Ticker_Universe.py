@@ -0,0 +1,89 @@
+"""
+Ticker_Universe.py
+-------------------
+Contains class functions for looking up stock ticker symbols, ETFs, and words to
+ignore using hashed (set/dict) indexes built once from the stock ticker csv files.
+
+"""
+
+from imports import *
+
+
+class Ticker_Universe():
+    def __init__(self, ticker_dict, etfs_list=None, words_to_ignore=None):
+        self.symbols = set()                                                # Set of all NASDAQ, NYSE, and AMEX ticker symbols
+        self.metadata = dict()                                              # Dictionary of ticker symbol --> {Name, Sector, Market Cap}
+        self.etfs = set(etfs_list or [])                                    # Set of top mentioned ETF's
+        self.words_to_ignore = set(words_to_ignore or [])                   # Set of words that should never be counted as tickers
+
+        if ticker_dict is not None:                                         # Build symbol/metadata indexes from ticker dictionary (dict-of-dicts)
+            self.build_index(ticker_dict)
+
+        # Valid tickers are (symbols or ETFs) that are not in the words to ignore list
+        self.valid_tickers = (self.symbols | self.etfs) - self.words_to_ignore
+
+
+
+    def build_index(self, ticker_dict):
+        symbol_col = ticker_dict.get('Symbol', dict())                      # Row index --> ticker symbol
+        name_col = ticker_dict.get('Name', dict())                          # Row index --> company name
+        sector_col = ticker_dict.get('Sector', dict())                      # Row index --> company sector
+        market_cap_col = ticker_dict.get('Market Cap', dict())              # Row index --> company market cap
+
+        for row, symbol in symbol_col.items():                              # Iterate through every ticker row once
+            self.symbols.add(symbol)
+
+            if symbol not in self.metadata:                                 # Keep metadata from the first row a symbol is found in
+                self.metadata[symbol] = {'Name'       : name_col.get(row),
+                                         'Sector'     : sector_col.get(row),
+                                         'Market Cap' : market_cap_col.get(row)}
+
+
+
+    def __contains__(self, ticker):
+        return ticker in self.valid_tickers                                 # O(1) check if ticker is a valid (mentionable) ticker
+
+
+
+    def __len__(self):
+        return len(self.valid_tickers)                                      # Number of valid (mentionable) tickers
+
+
+
+    def is_valid_ticker(self, ticker):
+        return ticker in self.valid_tickers                                 # Return True if ticker is a symbol/ETF and not a word to ignore
+
+
+
+    def is_symbol(self, ticker):
+        return ticker in self.symbols                                       # Return True if ticker is a NASDAQ, NYSE, or AMEX symbol
+
+
+
+    def is_etf(self, ticker):
+        return ticker in self.etfs                                          # Return True if ticker is a top mentioned ETF
+
+
+
+    def is_word_to_ignore(self, word):
+        return word in self.words_to_ignore                                 # Return True if word should be ignored
+
+
+
+    def get_metadata(self, ticker):
+        return self.metadata.get(ticker)                                    # Return {Name, Sector, Market Cap} for symbol (None if not found)
+
+
+
+    def get_name(self, ticker):
+        return (self.metadata.get(ticker) or dict()).get('Name')            # Return company name for symbol (None if not found)
+
+
+
+    def get_sector(self, ticker):
+        return (self.metadata.get(ticker) or dict()).get('Sector')          # Return company sector for symbol (None if not found)
+
+
+
+    def get_market_cap(self, ticker):
+        return (self.metadata.get(ticker) or dict()).get('Market Cap')      # Return company market cap for symbol (None if not found)
@@ -0,0 +1,145 @@
+"""
+Top_Ticker_Tracker.py
+----------------------
+Contains class functions for keeping the top K most bullish, most bearish, and most
+mentioned tickers up to date as each WSB comment is collected (min-heaps over exact
+counters, or over count-min sketch estimates for very wide ticker universes).
+
+"""
+
+import array
+import heapq
+from imports import *
+from Comment_Buffer import BULLISH_CODES, BEARISH_CODES
+
+
+class Top_Ticker_Tracker():
+    METRICS = ('Bullish', 'Bearish', 'Mentions')        # Rankings kept (mentions = bullish + bearish comments)
+    SKETCH_MULTIPLIERS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93,      # Odd 64-bit hash multipliers
+                          0xFF51AFD7ED558CCD, 0xC4CEB9FE1A85EC53, 0x85EBCA77C2B2AE63, 0x27D4EB2F165667C5)     # (one per sketch row, max depth 8)
+
+    def __init__(self, k=100, sketch=False, sketch_width=2**16, sketch_depth=4):
+        self.k = k                                      # Number of top tickers kept for each ranking
+        self.sketch = sketch                            # True = count-min sketch counts (fixed memory), False = exact counts
+        self.sketch_width = sketch_width                # Counters per sketch row
+        self.sketch_depth = sketch_depth                # Number of sketch rows (hash functions)
+        self.lock = threading.Lock()                    # Counts are updated by the WSB thread and read by the main thread
+        self.reset()
+
+
+
+    def reset(self):
+        with self.lock:                                 # Clear all counts and rankings (ex. new trading session)
+            self.counts = dict()                        # Exact mode: ticker --> [bullish count, bearish count]
+            self.sketch_counts = None                   # Sketch mode: [bullish, bearish] flat arrays of (sketch depth * sketch width) counters
+            if self.sketch:
+                self.sketch_counts = [array.array('q', [0]) * (self.sketch_depth * self.sketch_width) for _ in range(2)]
+            self.top = {metric: dict() for metric in self.METRICS}      # Ranking --> {ticker: count} of the top k tickers
+            self.heaps = {metric: list() for metric in self.METRICS}    # Ranking --> min-heap of (count, ticker) (smallest top k count first)
+
+
+
+    def get_sketch_indexes(self, ticker):
+        # Return sketch counter of ticker in each row (multiply-shift hashing w/ a different odd multiplier per row)
+        h = hash(ticker) & 0xFFFFFFFFFFFFFFFF
+        return [(row * self.sketch_width) + ((((h * multiplier) & 0xFFFFFFFFFFFFFFFF) >> 32) % self.sketch_width)
+                for row, multiplier in enumerate(self.SKETCH_MULTIPLIERS[:self.sketch_depth])]
+
+
+
+    def get_ticker_counts(self, ticker):
+        # Return (bullish count, bearish count) of ticker (count-min sketch estimates are never below the exact count)
+        if not self.sketch:
+            return tuple(self.counts.get(ticker, (0, 0)))
+
+        indexes = self.get_sketch_indexes(ticker)
+        return min(self.sketch_counts[0][i] for i in indexes), min(self.sketch_counts[1][i] for i in indexes)
+
+
+
+    def add(self, sentiment_code, mentioned_tickers, count=1):
+        if sentiment_code in BULLISH_CODES:             # Index of counter to increment (0 = bullish, 1 = bearish)
+            idx = 0
+        elif sentiment_code in BEARISH_CODES:
+            idx = 1
+        else:                                           # Ignore all other sentiment (potential garbage)
+            return
+
+        with self.lock:
+            for ticker in mentioned_tickers:
+                if self.sketch:
+                    sketch_counts = self.sketch_counts[idx]
+                    for i in self.get_sketch_indexes(ticker):
+                        sketch_counts[i] += count
+                else:
+                    counts = self.counts.get(ticker)
+                    if counts is None:
+                        counts = self.counts[ticker] = [0, 0]
+                    counts[idx] += count
+
+                bull, bear = self.get_ticker_counts(ticker)
+                self.update(self.METRICS[idx], ticker, bear if idx else bull)
+                self.update('Mentions', ticker, bull + bear)
+
+
+
+    def update(self, metric, ticker, count):
+        # Keep ticker in the top k of a ranking if its (increased) count is large enough (O(log k))
+        top, heap = self.top[metric], self.heaps[metric]
+
+        if ticker in top:                               # Already in the top k (heap entry is refreshed lazily)
+            top[ticker] = count
+            return
+
+        if len(top) < self.k:
+            top[ticker] = count
+            heapq.heappush(heap, (count, ticker))
+            return
+
+        while heap[0][0] != top[heap[0][1]]:            # Refresh stale heap entries until the smallest entry is current
+            heapq.heapreplace(heap, (top[heap[0][1]], heap[0][1]))
+
+        if count > heap[0][0]:                          # Replace the smallest top k ticker
+            del top[heap[0][1]]
+            heapq.heapreplace(heap, (count, ticker))
+            top[ticker] = count
+
+
+
+    def load_counts(self, ticker_counts):
+        # Replace all counts w/ {ticker: (bullish count, bearish count)} (ex. rebuilt from the wsb_comments excel file)
+        self.reset()
+        for ticker, (bull, bear) in ticker_counts.items():
+            if bull:
+                self.add(BULLISH_CODES[0], [ticker], count=bull)
+            if bear:
+                self.add(BEARISH_CODES[0], [ticker], count=bear)
+
+
+
+    def get_top(self, metric='Bullish', n=10):
+        # Return top n (ticker, bullish count, bearish count) rows of a ranking (O(k log n), ties ranked by the other counts)
+        with self.lock:
+            rows = [(ticker, *self.get_ticker_counts(ticker)) for ticker in self.top[metric]]
+
+        if metric == 'Bullish':
+            key = lambda row: (row[1], row[2])
+        elif metric == 'Bearish':
+            key = lambda row: (row[2], row[1])
+        else:
+            key = lambda row: (row[1] + row[2], row[1])
+
+        return heapq.nlargest(min(n, self.k), rows, key=key)
+
+
+
+    def get_top_df(self, metric='Bullish', n=10):
+        # Return top n tickers of a ranking as a ticker sentiment dataframe (bearish count of 0 is reported as 1, like sentiment_analysis())
+        rows = [(ticker, bull, max(bear, 1), bull / max(bear, 1)) for ticker, bull, bear in self.get_top(metric, n)]
+        df = pd.DataFrame(rows, columns=['Ticker', 'Bullish Count', 'Bearish Count', 'Bull/Bear Ratio'])
+        return df.set_index('Ticker')
+
+
+
+    def __len__(self):
+        return len(self.top['Mentions'])                # Number of tickers in the most mentioned ranking
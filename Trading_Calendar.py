@@ -0,0 +1,195 @@
+"""
+Trading_Calendar.py
+--------------------
+Contains class functions for a precomputed US stock market (NYSE) trading calendar.
+Every trading session (market open/close, early closes, session ID, and session
+directory) is computed once for a range of years, so sessions are found by date or
+timestamp w/ a dictionary lookup instead of date arithmetic on every call.
+
+A session covers the comments collected from the previous trading day's market close
+up to the trading day's market close (directory "wsb_sentiment_<previous day>_<day>").
+
+"""
+
+from imports import *
+
+
+class Trading_Calendar():
+    def __init__(self, start_year=None, end_year=None, market_open=dt.time(6, 30), market_close=dt.time(13, 0), early_close=dt.time(10, 0), data_dir='Data'):
+        self.market_open = market_open                  # Market open time (local time, default 06:30 AM PT)
+        self.market_close = market_close                # Market close time (default 01:00 PM PT)
+        self.early_close = early_close                  # Market close time of early close days (default 10:00 AM PT)
+        self.data_dir = data_dir                        # Directory of session directories
+        self.lock = threading.Lock()                    # Sessions may be extended by the WSB thread, persistence worker and main thread
+        self.calendar = None                            # {'Sessions', 'Session IDs', 'Date Index', 'Holidays', 'Start Year', 'End Year'} (replaced as a whole when extended)
+        self.build(start_year or dt.date.today().year - 1, end_year or dt.date.today().year + 1)
+
+
+
+    @staticmethod
+    def get_nth_weekday(year, month, weekday, n):
+        # Return the nth (1 = first, -1 = last) weekday (0 = Monday) of a month
+        if n > 0:
+            first = dt.date(year, month, 1)
+            return first + dt.timedelta(days=((weekday - first.weekday()) % 7) + (7 * (n - 1)))
+        last = dt.date(year + (month == 12), (month % 12) + 1, 1) - dt.timedelta(days=1)
+        return last - dt.timedelta(days=(last.weekday() - weekday) % 7)
+
+
+
+    @staticmethod
+    def get_easter(year):
+        # Return Easter Sunday of a year (Anonymous Gregorian algorithm)
+        a, b, c = year % 19, year // 100, year % 100
+        d, e = divmod(b, 4)
+        g = (8 * b + 13) // 25
+        h = (19 * a + b - d - g + 15) % 30
+        i, k = divmod(c, 4)
+        l = (32 + 2 * e + 2 * i - h - k) % 7
+        m = (a + 11 * h + 22 * l) // 451
+        month, day = divmod(h + l - 7 * m + 114, 31)
+        return dt.date(year, month, day + 1)
+
+
+
+    @staticmethod
+    def get_observed(date):
+        if date.weekday() == 5:                         # Holidays on Saturday are observed on Friday
+            return date - dt.timedelta(days=1)
+        if date.weekday() == 6:                         # Holidays on Sunday are observed on Monday
+            return date + dt.timedelta(days=1)
+        return date
+
+
+
+    def get_holidays(self, year):
+        # Return {date: holiday name} of full day US stock market closures for a year
+        holidays = {self.get_nth_weekday(year, 1, 0, 3)         : "Martin Luther King Jr. Day",
+                    self.get_nth_weekday(year, 2, 0, 3)         : "Washington's Birthday",
+                    self.get_easter(year) - dt.timedelta(days=2): "Good Friday",
+                    self.get_nth_weekday(year, 5, 0, -1)        : "Memorial Day",
+                    self.get_observed(dt.date(year, 7, 4))      : "Independence Day",
+                    self.get_nth_weekday(year, 9, 0, 1)         : "Labor Day",
+                    self.get_nth_weekday(year, 11, 3, 4)        : "Thanksgiving",
+                    self.get_observed(dt.date(year, 12, 25))    : "Christmas Day"}
+
+        if dt.date(year, 1, 1).weekday() != 5:          # New Year's Day (not observed on the previous Friday when on Saturday)
+            holidays[self.get_observed(dt.date(year, 1, 1))] = "New Year's Day"
+        if year >= 2022:                                # Juneteenth (market holiday since 2022)
+            holidays[self.get_observed(dt.date(year, 6, 19))] = "Juneteenth"
+
+        return holidays
+
+
+
+    def get_early_closes(self, year):
+        # Return {date: reason} of early close days for a year (day before Independence Day, day after Thanksgiving, Christmas Eve)
+        holidays = self.get_holidays(year)
+        early_closes = {self.get_nth_weekday(year, 11, 3, 4) + dt.timedelta(days=1): "Day After Thanksgiving"}
+        for date, name in ((dt.date(year, 7, 3), "Day Before Independence Day"), (dt.date(year, 12, 24), "Christmas Eve")):
+            if date.weekday() < 5 and date not in holidays:
+                early_closes[date] = name
+        return early_closes
+
+
+
+    def build(self, start_year, end_year):
+        # Precompute all sessions from start_year through end_year (one pass over the calendar days)
+        holidays, early_closes = dict(), dict()
+        for year in range(start_year - 1, end_year + 1):
+            holidays.update(self.get_holidays(year))
+            early_closes.update(self.get_early_closes(year))
+
+        sessions, session_ids, date_index = list(), dict(), dict()
+        previous_date, pending_dates = None, list()
+        date, last_date = dt.date(start_year - 1, 12, 1), dt.date(end_year, 12, 31)
+        while date <= last_date:
+            pending_dates.append(date)
+            if date.weekday() < 5 and date not in holidays:     # Trading day
+                if previous_date is not None and date.year >= start_year:
+                    session_id = f"wsb_sentiment_{previous_date.strftime('%Y-%m-%d')}_{date.strftime('%Y-%m-%d')}"
+                    session = {'Session'        : session_id,
+                               'Date'           : date,                 # Trading day (session reports on this day's market)
+                               'Previous Date'  : previous_date,        # Previous trading day (session starts at its market close)
+                               'Open'           : dt.datetime.combine(date, self.market_open),
+                               'Close'          : dt.datetime.combine(date, self.early_close if date in early_closes else self.market_close),
+                               'Early Close'    : early_closes.get(date),
+                               'Dir Path'       : f"{self.data_dir}/{session_id}"}
+                    sessions.append(session)
+                    session_ids[session_id] = session
+                    for pending_date in pending_dates:          # Non-trading days map to the next session
+                        date_index[pending_date] = len(sessions) - 1
+                pending_dates = list()
+                previous_date = date
+            date += dt.timedelta(days=1)
+
+        # Publish the new calendar w/ one assignment (readers never see new sessions w/ an old date index)
+        self.calendar = {'Sessions'         : sessions,         # All sessions (oldest first)
+                         'Session IDs'      : session_ids,      # Session ID --> session
+                         'Date Index'       : date_index,       # Calendar date --> index of the first session on or after the date
+                         'Holidays'         : holidays,         # Date --> holiday name of full day market closures
+                         'Start Year'       : start_year,       # Years covered by the sessions
+                         'End Year'         : end_year}
+        return self.calendar
+
+
+
+    def ensure_date(self, date):
+        # Return calendar covering date, extending the sessions if needed (also covers the next session of the last day)
+        calendar = self.calendar
+        if calendar['Start Year'] <= date.year < calendar['End Year']:
+            return calendar
+        with self.lock:
+            calendar = self.calendar
+            if not (calendar['Start Year'] <= date.year < calendar['End Year']):
+                calendar = self.build(min(calendar['Start Year'], date.year), max(calendar['End Year'], date.year + 1))
+            return calendar
+
+
+
+    def get_session(self, timestamp=None):
+        # Return session containing timestamp (default now): after the previous trading day's close, up to (not incl.) the trading day's close (O(1))
+        timestamp = timestamp or dt.datetime.now()
+        calendar = self.ensure_date(timestamp.date())
+        session = calendar['Sessions'][calendar['Date Index'][timestamp.date()]]
+        if timestamp >= session['Close']:               # After market close, comments belong to the next session
+            session = self.get_next_session(session)
+        return session
+
+
+
+    def get_session_by_date(self, date):
+        # Return session of a trading day (None if the market is closed on date)
+        calendar = self.ensure_date(date)
+        session = calendar['Sessions'][calendar['Date Index'][date]]
+        return session if session['Date'] == date else None
+
+
+
+    def get_session_by_id(self, session_id):
+        return self.calendar['Session IDs'].get(session_id)     # Return session from its session ID / directory name (None if unknown)
+
+
+
+    def get_previous_session(self, session):
+        return self.get_session_by_date(session['Previous Date'])      # Return session before a session (O(1))
+
+
+
+    def get_next_session(self, session):
+        next_date = session['Date'] + dt.timedelta(days=1)             # Return session after a session (O(1))
+        calendar = self.ensure_date(next_date)
+        return calendar['Sessions'][calendar['Date Index'][next_date]]
+
+
+
+    def get_sessions(self, start_date, end_date):
+        # Return sessions of all trading days from start_date through end_date (ex. backfills and backtests)
+        self.ensure_date(start_date)
+        calendar = self.ensure_date(end_date)          # (Calendar covering end_date also covers start_date)
+        return calendar['Sessions'][calendar['Date Index'][start_date]:calendar['Date Index'][end_date + dt.timedelta(days=1)]]
+
+
+
+    def get_holiday_name(self, date):
+        return self.ensure_date(date)['Holidays'].get(date)     # Return holiday name if the market is closed on a weekday holiday (else None)
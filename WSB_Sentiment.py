@@ -1,588 +1,754 @@
-"""
-WSB_Sentiment.py
------------------
-Contains class functions for processing WSB comment sentiment and analysis.
-
-"""
-
-import urllib3
-import globals
-from imports import *
-from helper import *
-
-
-
-class WSB_Sentiment():
-    def __init__(self, **kwargs):
-        self.wsb_thread = None                                                                  # Initialize WSB Sentiment thread       
-        self.driver = None                                                                      # Initialize chrome webdriver to None
-        self.wsb_sentiment_df = pd.DataFrame(columns=['Time', 'Sentiment', 'Ticker', 'Text'])   # This dataframe contains all sentiment comments from WSB
-        self.wsb_status_update_df = pd.DataFrame()                                              # This dataframe contains stock tickers for the WSB status report
-        self.ticker_sentiment_df = pd.DataFrame()                                               # This dataframe contains all stock ticker sentiment
-        self.top_ticker_sentiment_df = pd.DataFrame()                                           # This dataframe contains top stock ticker sentiment
-        self.ema_df = pd.DataFrame()                                                            # Exponential Moving Average dataframe
-        self.overall_sentiment = 1.0                                                            # Initialize bull/bear ratio (overall market sentiment)
-        self.update_hour = kwargs.get('update_hour')                                            # Initialize WSB sentiment update hour
-        if self.update_hour is None:
-            self.update_hour = 1                                                                # Default setiment update hour to 1 if not set from kwargs
-
-
-
-    def run(self):
-        self.wsb_thread = threading.Thread(name="WSBSentimentThread",                           # Create WSB thread to collect sentiment comments
-                                      target=self.get_wsb_comments)
-        self.wsb_thread.setDaemon(True)                                                         # Set WSB thread to be background task
-        self.wsb_thread.start()                                                                 # Start WSB thread (Begin collecting sentiment comments in the background)
-
-
-
-    def setup_driver(self):
-
-        print(">>> Setting Up Chrome Webdriver. . .")
-
-        # Create Chrome webdriver options
-        options = webdriver.ChromeOptions()                                                     # Create webdriver instance
-        options.add_argument('--headless')                                                      # Make windowless browser
-        options.headless = True                                                                 # Prevents chrome window from opening
-        options.add_experimental_option("excludeSwitches", ["enable-logging"])                  # Prevents chrome webdriver logging
-        options.binary_location="C:\Program Files (x86)\Google\Chrome\Application\chrome.exe"   # Specify chrome webdriver executable location (Dont know if we need this)
-
-        # Create Chrome webdriver using webdriver options
-        try:
-            self.driver = webdriver.Chrome(executable_path="C:\Program Files (x86)\Google\chromedriver_win32\chromedriver.exe", options=options)
-            self.driver.delete_all_cookies()             # Delete all cookies (Dont know if we really need to do this)
-            self.driver.get(globals.URL)                 # Open the WSB AI using the site URL
-            return
-        
-        # If driver cannot connect to URL, return "None" value
-        except WebDriverException:
-            logging.error(f"*** WebDriverException: Could not reach URL {globals.URL}. . .")
-            self.driver = None
-            return
-
-        # If unknown exception occured, return "None" value
-        except Exception:
-            logging.error(f"*** Unexpected Exception Occured! ***", exc_info=True)
-            self.driver = None
-            return
-
-
-
-    def shutdown_driver(self):
-        if self.driver is not None:                             # If driver is still active, shutdown driver
-            print('>>> Shutting Down Chrome Webdriver . . .')
-            self.driver.quit()                                  # Shut down chrome webdriver
-            self.driver = None                                  # Set driver to "None" value
-
-        return
-
-
-
-    def get_wsb_comments(self):
-
-        self.setup_driver()                                                     # Setup Chrome Webdriver
-
-        retry_count = 0                                                         # Initialize reconnection attempts counter if webdriver or socket interrupts occur
-        previous_time = dt.datetime.now()                                       # Initialize current time for WSB sentiment status updates
-        prev_comments = self.driver.find_element_by_id("comment-area").text     # Initialize current comments collected from WSB
-
-        print(">>> Collecting WSB Sentiment Comments. . .")
-
-        with globals.WSB_SPINNER as spinner:                                                # Create progress spinner for sentiment loop
-            while True:                                                                     # Loop forever on daemon thread. . .
-                try:
-                    # /// Network connection handling
-                    if retry_count > 0 and is_network_connected():                          # If network connection is re-established after being disconnected
-                        with spinner.hidden():
-                            print(">>> Network Connection Established. . .")
-                            retry_count = 0                                                 # Reset the reconnection attempts counter
-
-                            if self.driver is None:                                         # Setup webdriver if driver was not established
-                                self.setup_driver()                                                   
-
-                    elif not is_network_connected():                                        # If network connection is disconnected after being established
-                        with spinner.hidden():
-                            print(">>> Network Disconnected. . .")
-                            self.shutdown_driver()                                          # Shutdown the webdriver
-
-                    # /// Sentiment message processing
-                    recent_comments = self.driver.find_element_by_id("comment-area").text   # Get new WSB comments from "comment-area" section of webpage
-
-                    old_comments = prev_comments.splitlines()                               # Split text from old comments
-                    new_comments = recent_comments.splitlines()                             # Split text from new comments
-
-                    # Get new "Bullish", "Bearish", and "None" sentiment type comments, if any
-                    updated_comments = [comment for comment in new_comments if comment not in set(old_comments)]
-                    
-                    if not updated_comments:                                                # If no new comments have been collected, 
-                        continue                                                            # return to the beginning of while loop
-
-                    prev_comments = recent_comments                                         # Update previous comments collected with most recent comments collected
-
-                    # Find all indexes of "bullish", "bearish", and "none" comments
-                    idx_list = [idx for idx, comment in enumerate(updated_comments) if ("bullish" in comment) or ("bearish" in comment) or ("none" in comment)]
-
-                    # Merge comments initially separated by "\n" into one comment and ignore all "none" sentiment type comments
-                    updated_comments = [" ".join(updated_comments[idx_list[i]:idx_list[i+1]]) if (i < len(idx_list)-1) and (idx_list[i+1]-idx_list[i] > 1) \
-                                        else updated_comments[idx_list[i]] for i in range(len(idx_list)) if not("none" in updated_comments[idx_list[i]])]
-
-                    if not updated_comments:                                                # If no new "bullish" or "bearish" comments have been collected (only "none" comments)
-                        continue                                                            # have been collected), return to the beginning of while loop  
-                        
-                    for comment in updated_comments:                                        # Iterate through all new comments collected
-                        strn = comment.split(' ', 3)
-                        
-                        if len(strn) < 4:                                                   # Skip new comment if not in the correct format 
-                            continue                                                        # (sentiment / time / author / text)
-
-                        sentiment, time_stamp, author, text = strn[0], strn[1], strn[2], strn[3]    # Get sentiment / time stamp / author / comment text
-                        mentioned_tickers = self.find_mentioned_tickers(text)                       # Find any tickers mentioned in comment text        
-                            
-                        # If no tickers are mentioned in WSB comment, set "Ticker" to "None" value and append row to Sentiment Dataframe
-                        if not mentioned_tickers:
-                            df_row = {  'Time'        : time_stamp[1:-1],
-                                        'Sentiment'   : sentiment,
-                                        'Ticker'      : None,
-                                        'Text'        : text}
-                            
-                            self.wsb_sentiment_df = self.wsb_sentiment_df.append(df_row, ignore_index=True)
-                        
-                        # Else if there are tickers mentioned in WSB comment
-                        else:
-                            # Iterate through each mentioned ticker and append row to Sentiment Dataframe
-                            for ticker in mentioned_tickers:
-                                df_row = {  'Time'        : time_stamp[1:-1],
-                                            'Sentiment'   : sentiment,
-                                            'Ticker'      : ticker,
-                                            'Text'        : text}
-                            
-                                self.wsb_sentiment_df = self.wsb_sentiment_df.append(df_row, ignore_index=True)
-
-                        spinner.text = f"Mentioned Tickers: {mentioned_tickers}"                    # Show mentioned tickers in spinner text for visual confirmation
-                    
-                    # Provide sentiment update every (n) hour increments [(# of hours to wait) * (# of sec in an hour)]
-                    if (dt.datetime.now() - previous_time).total_seconds() >= (self.update_hour * 3600):    
-                        self.sentiment_analysis()                                                           
-                        previous_time = dt.datetime.now()                                           # Update current time for WSB sentiment status updates
-
-
-                # /// WiFi Connection Issues
-                except AttributeError:
-                    with spinner.hidden():                                                      
-                        logging.warning("*** AttributeError: Could Not Access Sentiment Data. . .")
-                        retry_count += 1                                                            # If AttributeError raised (internet connection issue), increment retry count
-                        
-                        # If connection retry counter < max number of connection retries allowed
-                        if retry_count <= globals.MAX_RETRIES:                                      
-                            print(f">>> Connection retry attempt {retry_count}/{globals.MAX_RETRIES}. . . ")
-                            time.sleep(5.0)                                                         # Wait 5 seconds before trying again
-                            continue                                                                # Return to beginning of While Loop
-
-                        # WiFi re-connectivity failed
-                        else:                                                                   
-                            print('>>> Max connection retry attempts reached. . . Exiting WSB Sentiment Program')
-                            break
-
-                # /// Keyboard Shutdown Enabled
-                except (urllib3.exceptions.ProtocolError, urllib3.exceptions.NewConnectionError, KeyboardInterrupt):
-                    with spinner.hidden():
-                        logging.warning("*** ProtocolError/NewConnectionError/KeyboardInterrupt: Exiting WSB Sentiment loop. . .")
-
-                        # Write any collected WSB sentiment comments to excel file before exiting
-                        if not self.wsb_sentiment_df.empty:
-                            write_df_to_excel(self.wsb_sentiment_df, "wsb_comments")
-
-                        break
-
-                # /// Unknown Exception Handling
-                except Exception:   
-                    with spinner.hidden():                                                      
-                        logging.error(f"*** Unexpected Exception Occured! (WSB Loop)***", exc_info=True)
-                        break
-
-            # If still active, shutdown driver
-            with spinner.hidden():
-                self.shutdown_driver()
-
-        return
-
-
-
-    def find_mentioned_tickers(self, text):
-        # Determine if any tickers are mentioned in the comment text by finding any words that are uppercase
-        # (Although not always the case, stock ticker symbols are usually written in uppercase)
-        potential_ticker_list = [list(word) for upper, word in itertools.groupby(text.split(), key=str.isupper) if upper]   # Returns a list of lists w/ potential ticker mentions
-        potential_ticker_list = [item for sublist in potential_ticker_list for item in sublist]                             # Converts list of lists to single list of potential tickers
-
-        # Remove all special characters and punctuations that may be attached to potential tickers (Only keep letters and numbers)
-        potential_ticker_list = [re.sub('[^a-zA-Z0-9]+','', ticker) for ticker in potential_ticker_list]
-
-        # Check if potential tickers are valid tickers
-        mentioned_tickers = [ticker for ticker in potential_ticker_list if ((ticker in globals.TICKER_DICT['Symbol'].values()) or \
-                                                                            (ticker in globals.ETFS_LIST)) and (ticker not in globals.WORDS_TO_IGNORE)]
-
-        # Remove duplicates of same ticker (ex. [TSLA, TSLA, TSLA, AAPL] --> [TSLA, AAPL])
-        mentioned_tickers = list(dict.fromkeys(mentioned_tickers))
-
-        return mentioned_tickers
-
-
-
-    def sentiment_analysis(self):
-        try:
-            if self.wsb_sentiment_df.empty:     # If WSB sentiment dataframe is empty (no WSB comments were collected)
-                print(">>> No WSB sentiment comments found!. . . No analysis to be done. . .")
-                return                          # Exit function
-
-            # Only keep bullish/bearish and possible bullish/bearish comments ((bullish)/(bearish)) (Remove potential garbage from dataframe)
-            self.wsb_sentiment_df = self.wsb_sentiment_df[self.wsb_sentiment_df['Sentiment'].isin(['bullish', '(bullish)', 'bearish', '(bearish)'])].reset_index(drop=True)
-
-            self.wsb_sentiment_df = write_df_to_excel(self.wsb_sentiment_df, "wsb_comments")          # Write WSB sentiment comments to excel file
-
-            print(">>>")
-            print(">>> ===========================================================")
-            print(">>> $ $ $    W S B    S E N T I M E N T    S T A T U S    $ $ $")
-            print(">>> ===========================================================")
-            print(">>>")
-
-            print(f">>> DATE / TIME OF REPORT: {dt.date.today().strftime('%Y-%m-%d')} \t {dt.datetime.now().time()}")
-
-            # Count all occurrences of bullish / possible bullish sentiment and bearish / possible bearish sentiment
-            value_counts = self.wsb_sentiment_df['Sentiment'].value_counts()
-
-            # Get bullish and potential bullish sentiment count
-            if ('bullish' in value_counts) or ('(bullish)' in value_counts):
-                if 'bullish' not in value_counts:
-                    bull_count = value_counts['(bullish)']
-                elif '(bullish)' not in value_counts:
-                    bull_count = value_counts['bullish']
-                else:
-                    bull_count = value_counts['bullish'] + value_counts['(bullish)']
-            else:
-                bull_count = 0
-            
-            # Get bearish and potential bearish sentiment count
-            if ('bearish' in value_counts) or ('(bearish)' in value_counts):
-                if 'bearish' not in value_counts:
-                    bear_count = value_counts['(bearish)']
-                elif '(bearish)' not in value_counts:
-                    bear_count = value_counts['bearish']
-                else:
-                    bear_count = value_counts['bearish'] + value_counts['(bearish)']
-            else:
-                bear_count = 0
-
-            if bear_count == 0:                                                                     # This ensures no divide by zero error when calculating 
-                bear_count = 1                                                                      # bull/bear ratio
-
-            self.overall_sentiment = bull_count/bear_count
-
-            print(f">>> OVERALL WSB SENTIMENT SCORE (BULL / BEAR RATIO): {self.overall_sentiment}") 
-            print(">>>")
-
-            mentioned_tickers = self.wsb_sentiment_df['Ticker'].unique().tolist()                   # Collect all tickers mentioned in WSB dataframe
-            mentioned_tickers = list(filter(None, mentioned_tickers))                               # Remove any "None" type values from list
-
-            ticker_sentiment_rows_list = list()                                                     # Create list to hold dataframe rows that will obtain ticker sentiment data
-            for ticker in mentioned_tickers:                                                        # Iterate through all mentioned tickers
-                ticker_df = self.wsb_sentiment_df[self.wsb_sentiment_df['Ticker'].isin([ticker])]   # Create separate dataframe for specific ticker
-
-                # Count all occurrences of bullish / possible bullish sentiment and bearish / possible bearish sentiment for ticker
-                ticker_value_counts = ticker_df['Sentiment'].value_counts()
-                
-                # Get bullish and potential bullish sentiment count
-                if ('bullish' in ticker_value_counts) or ('(bullish)' in ticker_value_counts):
-                    if 'bullish' not in ticker_value_counts:
-                        ticker_bull_count = ticker_value_counts['(bullish)']
-                    elif '(bullish)' not in ticker_value_counts:
-                        ticker_bull_count = ticker_value_counts['bullish']
-                    else:
-                        ticker_bull_count = ticker_value_counts['bullish'] + ticker_value_counts['(bullish)']
-                else:
-                    ticker_bull_count = 0
-                
-                # Get bearish and potential bearish sentiment count
-                if ('bearish' in ticker_value_counts) or ('(bearish)' in ticker_value_counts):
-                    if 'bearish' not in ticker_value_counts:
-                        ticker_bear_count = ticker_value_counts['(bearish)']
-                    elif '(bearish)' not in ticker_value_counts:
-                        ticker_bear_count = ticker_value_counts['bearish']
-                    else:
-                        ticker_bear_count = ticker_value_counts['bearish'] + ticker_value_counts['(bearish)']
-                else:
-                    ticker_bear_count = 0
-
-                if ticker_bear_count == 0:                                                          # This ensures no divide by zero error when calculating 
-                    ticker_bear_count = 1                                                           # bull/bear ratio
-
-                # Create dataframe row w/ specific ticker data
-                ticker_sentiment_row = {'Ticker'            : ticker, 
-                                        'Bullish Count'     : ticker_bull_count, 
-                                        'Bearish Count'     : ticker_bear_count, 
-                                        'Bull/Bear Ratio'   : ticker_bull_count/ticker_bear_count}
-
-                ticker_sentiment_rows_list.append(ticker_sentiment_row)                                  # Append list containing sentiment data for specific ticker
-                
-            # Append rows to ticker sentiment dataframe
-            self.ticker_sentiment_df = self.ticker_sentiment_df.append(ticker_sentiment_rows_list, ignore_index=True)
-
-            # Sort ticker sentiment dataframe from largest to smallest Bullish and Bearish count
-            self.ticker_sentiment_df.sort_values(by=['Bullish Count', 'Bearish Count'], ascending=False, inplace=True)  
-            self.ticker_sentiment_df.set_index('Ticker', inplace=True)                              # Set dataframe indexes to be stock ticker symbols
-                      
-            write_df_to_excel(self.ticker_sentiment_df, "ticker_sentiment_all")                     # Write all ticker sentiment dataframe to excel file
-
-            ticker_report_df = self.ticker_sentiment_df[:10]                                        # Only show top 10 Bullish/Bearish tickers for WSB status update
-
-            bull_bear_ratio_percent_change = "N/A"                                                  # Initialize bull/bear ratio percent change to N/A
-            for ticker in ticker_report_df.index:                                                   # Iterate through each top 10 Bullish/Bearish tickers
-
-                # If the WSB status update dataframe is not empty (contains ticker data) and the current ticker is found in the dataframe and the Bull/Bear Ratio of the ticker
-                # in the WSB status update dataframe is not zero (prevent divide by zero error), calculate a percent change between the ticker's current and previous 
-                # bull/bear ratio values
-                if (not self.wsb_status_update_df.empty) and (ticker in self.wsb_status_update_df.index) and (self.wsb_status_update_df.loc[ticker, "Bull/Bear Ratio"] != 0):
-                    bull_bear_ratio_percent_change = str(round(((ticker_report_df.loc[ticker, "Bull/Bear Ratio"] - self.wsb_status_update_df.loc[ticker, "Bull/Bear Ratio"])\
-                                                        / self.wsb_status_update_df.loc[ticker, "Bull/Bear Ratio"]) * 100, 2))
-
-                # Print information for each ticker
-                print(">>> TICKER: %-8s BULL COUNT: %-8d BEAR COUNT: %-8d BULL/BEAR RATIO: %-8.2f RATIO %% CHANGE: %-8s" % (ticker,
-                                                                                                                            ticker_report_df.loc[ticker, "Bullish Count"],
-                                                                                                                            ticker_report_df.loc[ticker, "Bearish Count"],
-                                                                                                                            ticker_report_df.loc[ticker, "Bull/Bear Ratio"],
-                                                                                                                            bull_bear_ratio_percent_change))
-
-            print(">>>")
-            self.wsb_status_update_df = ticker_report_df                                        # Update WSB status update dataframe
-            return 
-
-        except KeyError:
-            logging.warning("*** KeyError: DataFrame Key Not Found. . .", exc_info=True)        # If dataframe Key Error Exception occured,
-            print(">>> Unable to provide WSB sentiment analysis!. . . ")
-            self.overall_sentiment = 1.0
-            return                                                                             
-
-        except Exception:
-            logging.error(f"*** Unexpected Exception Occured! ***", exc_info=True)              # If an Unknown Exception occured,
-            print(">>> Unable to provide WSB sentiment analysis!. . . ")
-            self.overall_sentiment = 1.0
-            return                                                                                     
-
-
-
-    def get_top_tickers(self):
-        print(">>> Collecting top tickers. . .")
-        try:
-            # Get all ticker sentiment data from excel file
-            self.top_ticker_sentiment_df = pd.read_excel(f'{get_dir_path()}/ticker_sentiment_all.xlsx', index_col=0, engine='openpyxl')
-
-            # If overall sentiment is bullish, get all bullish tickers
-            if self.overall_sentiment > 1.0:
-                # Find tickers with a bull/bear ratio > 1.0
-                self.top_ticker_sentiment_df = self.top_ticker_sentiment_df[self.top_ticker_sentiment_df['Bull/Bear Ratio'] > 1.0]  # Overwrite ticker dataframe with only bullish tickers
-                                                                                                                                    # (Bull/Bear Ratio already sorted from sentiment_analysis() function)
-            
-            # If overall sentiment is bearish, get all bearish tickers
-            elif self.overall_sentiment < 1.0:
-                self.top_ticker_sentiment_df = self.top_ticker_sentiment_df[self.top_ticker_sentiment_df['Bull/Bear Ratio'] < 1.0]  # Overwrite ticker dataframe with only bearish tickers
-                self.top_ticker_sentiment_df.sort_values(by=['Bull/Bear Ratio'], ascending=True, inplace=True)                      # Sort Bull/Bear Ratio from smallest to largest
-                
-            self.top_ticker_sentiment_df = self.top_ticker_sentiment_df[:25]    # Collect only the top 25 bullish/bearish tickers
-
-            self.get_previous_sentiment_percent_chng()                          # Calculate previous day's sentiment percent change for top
-                                                                                # 25 bullish/bearish tickers
-
-            # Get open price for top 25 bullish/bearish tickers
-            with globals.WSB_SPINNER as spinner:                   # Create progress spinner for sentiment loop
-                open_price_list = list()                                                    # Initialize list for Open price of stock tickers
-                for ticker in self.top_ticker_sentiment_df.index:                           # Iterate through all tickers
-                    try:
-                        spinner.text = f'Collecting Open Price for. . . {ticker}'
-                        open_price_list.append(yf.Ticker(ticker).info['open'])
-                    
-                    except IndexError:                                                      # If unable to obtain open price via first method, try second method
-                        with spinner.hidden():
-                            print(f">>> Unable to collect open price for {ticker}. . . Trying alternative method. . .")
-                            try:
-                                open_price_list.append(yf.Ticker(ticker).history(period="1d").iloc[0]['Open'])
-
-                            except Exception:                                                  # If unable to obtain open price via second method, insert "None" value
-                                logging.error(f">>> Failed to collect open price for {ticker}. . .", exc_info=True)
-                                open_price_list.append(None)
-
-            
-            self.top_ticker_sentiment_df['Open'] = open_price_list                          # Add stock ticker's Open price to top tickers dataframe
-
-            write_df_to_excel(self.top_ticker_sentiment_df, 'ticker_sentiment_top25')
-
-            return 
-
-        except FileNotFoundError:       # If excel file w/ individual ticker sentiment is not found, exit from function
-            logging.warning(f"*** FileNotFoundError: Excel file '{get_dir_path()}/ticker_sentiment_all' not found. . .")
-            return
-        
-        except Exception:               # If an Unknown Exception occured, exit from function
-            logging.error("*** Unexpected Exception Occured! ***", exc_info=True)    
-            return  
-
-
-
-    def get_previous_sentiment_percent_chng(self):
-        print(">>> Collecting percent change of previous day sentiment. . .")
-        dir_path = get_dir_path(prev_day=True)          # Get directory path for previous market day data
-
-        try:
-            yesterdays_ticker_sentiment_df = pd.read_excel(f'{dir_path}/ticker_sentiment_top25.xlsx', index_col=0, engine='openpyxl')
-
-            # Iterate through all tickers from today's top 25 ticker sentiment
-            for ticker in self.top_ticker_sentiment_df.index:
-                # If ticker found in yesterday's top 25 ticker sentiment, calculate sentiment percent change for ticker
-                if ticker in yesterdays_ticker_sentiment_df.index:
-                    self.top_ticker_sentiment_df.loc[ticker, 'Sentiment Percent Change'] = ((self.top_ticker_sentiment_df.loc[ticker, 'Bull/Bear Ratio'] - yesterdays_ticker_sentiment_df.loc[ticker, 'Bull/Bear Ratio'])\
-                                                                                            / yesterdays_ticker_sentiment_df.loc[ticker, 'Bull/Bear Ratio']) * 100
-
-            return
-        
-        except FileNotFoundError:       # If excel file w/ top 25 individual ticker sentiment data is not found, exit from function
-            logging.warning(f"*** FileNotFoundError: Excel file '{dir_path}/ticker_sentiment_top25' not found. . .")
-            return
-
-        except Exception:               # If an Unknown Exception occured, exit from function
-            logging.error("*** Unexpected Exception Occured! ***", exc_info=True)    
-            return   
-
-
-
-    def calc_ema(self, period=10):
-        # If previous EMA data exists, read EMA excel file
-        if os.path.exists(f'Data/{period}_day_ema".xlsx'):
-            self.ema_df = pd.read_excel(f'Data/{period}_day_ema".xlsx', index_col=0, engine='openpyxl')
-        
-            # If 10-day EMA for today's date already exists in dataframe, return 10-day EMA value
-            if dt.date.today().strftime("%Y_%m_%d") in self.ema_df['Date']:
-                return self.ema_df["10-day EMA"][self.ema_df['Date'] == dt.date.today().strftime("%Y_%m_%d")].values
-
-        # Add today's date and bull/bear ratio to dataframe
-        self.ema_df = self.ema_df.append({"Date": dt.date.today().strftime("%Y_%m_%d"), "Bull/Bear Ratio": self.overall_sentiment}, ignore_index=True)
-
-        # Calculate 10 day EMA for all bull/bear ratio entries in dataframe
-        self.ema_df['10-day EMA'] = self.ema_df['Bull/Bear Ratio'].ewm(span=period, adjust=False).mean()
-
-        # Write EMA data to excel file
-        write_df_to_excel(self.ema_df, f"{period}_day_ema")
-
-        # Return 10-day EMA for today's date
-        return self.ema_df["10-day EMA"][self.ema_df['Date'] == dt.date.today().strftime("%Y_%m_%d")].values
-
-
-
-    def get_close_price_and_percent_chng(self):
-        print(">>> Collecting Close Price. . .")
-        try:
-            # Write close price for top 10 bullish/bearish tickers to dataframe
-            #self.top_ticker_sentiment_df['Close'] = [yf.Ticker(ticker).history(period="1d").iloc[0]['Close'] for ticker in self.top_ticker_sentiment_df.index\
-            #                                                                                                    if self.top_ticker_sentiment_df.loc[ticker, "Open"] is not None]
-
-            # Write percent change between open and close prices for top 25 bullish/bearish tickers to dataframe
-            for ticker in self.top_ticker_sentiment_df.index:
-                if self.top_ticker_sentiment_df.loc[ticker, 'Open'] is not None:
-                    self.top_ticker_sentiment_df.loc[ticker, 'Close'] = yf.Ticker(ticker).history(period="1d").iloc[0]['Close'] 
-                    self.top_ticker_sentiment_df.loc[ticker, "Price Percent Change"] = ((self.top_ticker_sentiment_df.loc[ticker, 'Close'] - self.top_ticker_sentiment_df.loc[ticker, 'Open'])\
-                                                                                        / self.top_ticker_sentiment_df.loc[ticker, 'Open']) * 100
-                else:
-                    self.top_ticker_sentiment_df.loc[ticker, "Close"] = None
-                    self.top_ticker_sentiment_df.loc[ticker, "Price Percent Change"] = None
-
-            # self.top_ticker_sentiment_df['Price Percent Change'] = ((self.top_ticker_sentiment_df['Close'] - self.top_ticker_sentiment_df['Open'])\
-            #                                                         / self.top_ticker_sentiment_df['Open']) * 100
-
-            # Write ticker sentiment dataframe to excel file (this should overwrite previous ticker_sentiment excel sheet)
-            write_df_to_excel(self.top_ticker_sentiment_df, "ticker_sentiment_top25")
-
-            return
-
-        except TypeError:       
-            logging.warning("*** TypeError: Empty DataFrame. . .")                      # If top 25 ticker sentiment dataframe is empty, exit function
-            return
-
-        except Exception:       
-            logging.error(f"*** Unexpected Exception Occured! ***", exc_info=True)      # If Unknown Exception occured, return exit function
-            return  
-
-
-
-    def determine_potential_profits(self):
-        print(">>> Writing Potential Profit/Loss Report. . .")
-
-        # Create watchlist report file
-        file = open(f'{get_dir_path()}/potential_profit_loss_report.txt', 'w')
-
-        file.write("====================================================================\n")
-        file.write("                       PROFIT / LOSS REPORT                         \n")
-        file.write("====================================================================\n")
-
-        # Write total cost to own 100 shares of each stock at Market Open price
-        file.write('\n')
-        file.write(">>> Cost for 100 shares at Market Open\n")
-        total_cost = 0
-        for ticker in self.top_ticker_sentiment_df.index:
-            file.write("Ticker: %-8s | Open Price Cost (USD): $%-8.2f" % (ticker, self.top_ticker_sentiment_df.loc[ticker, "Open"] * 100))
-            total_cost += round(self.top_ticker_sentiment_df.loc[ticker, "Open"] * 100, 2)
-        file.write(f"Total Cost (USD): ${total_cost}")
-        
-        # Write total value/worth of 100 shares of each stock at Market Close price
-        file.write('\n')
-        file.write(">>> Value of 100 shares at Market Close\n")
-        total_value = 0
-        for ticker in self.top_ticker_sentiment_df.index:
-            file.write("Ticker: %-8s | Close Price Value (USD): $%-8.2f" % (ticker, self.top_ticker_sentiment_df.loc[ticker, "Close"] * 100))
-            total_value += round(self.top_ticker_sentiment_df.loc[ticker, "Close"] * 100, 2)
-        file.write(f"Total Value (USD): ${total_value}")
-
-        # Write daily profit/loss made from each stock
-        file.write('\n')
-        file.write(">>> Daily Profit/Loss from each stock ticker\n")
-        for ticker in self.top_ticker_sentiment_df.index:
-            file.write("Ticker: %-8s | Profit/Loss (USD): $%-8.2f" % (ticker, ((self.top_ticker_sentiment_df.loc[ticker, "Close"] * 100) - \
-                                                                                (self.top_ticker_sentiment_df.loc[ticker, "Open"] * 100))))
-
-        # Write total daily profit/loss
-        file.write('\n')
-        file.write(f">>> Total Daily Profit/Loss (USD): ${total_value - total_cost}\n")        
-
-        # Close the file after writing
-        file.close()    
-        
-        return
-
-
-
-    def get_wsb_thread(self):
-        return self.wsb_thread                  # Return WSB sentiment daemon thread
-
-
-
-    def get_wsb_sentiment_df(self):
-        return self.wsb_sentiment_df            # Return dataframe containing all WSB sentiment comments
-
-
-
-    def get_all_ticker_sentiment_df(self):
-        return self.ticker_sentiment_df         # Return dataframe containing the sentiment of all collected tickers from WSB comments
-
-
-
-    def get_top_ticker_sentiment_df(self):
-        return self.top_ticker_sentiment_df     # Return dataframe containing the sentiment of the 25 top mentioned tickers from WSB comments
-
-
-
-    def get_ema_df(self):
-        return self.ema_df                      # Return dataframe containing EMA data
-
-
-
-    def get_overall_sentiment(self):
-        return self.overall_sentiment           # Return overall bull/bear ratio sentiment score
-
-
+"""
+WSB_Sentiment.py
+-----------------
+Contains class functions for processing WSB comment sentiment and analysis.
+
+"""
+
+import globals
+from imports import *
+from helper import *
+from Ticker_Extractor import Ticker_Extractor
+from Comment_Feed import Comment_Feed
+from Comment_Store import Comment_Store
+from Comment_Archive import Comment_Archive
+from Comment_WAL import Comment_WAL
+from Persistence_Worker import Persistence_Worker
+from Sentiment_History import Sentiment_History
+from Sentiment_EMA import Sentiment_EMA
+from Market_Data import Market_Data
+from Comment_Buffer import get_sentiment_code
+from Comment_Source import Selenium_Source
+from Poll_Scheduler import Poll_Scheduler
+from Sentiment_Aggregator import Sentiment_Aggregator
+from Sentiment_Timeline import Sentiment_Timeline
+from Mention_Spike_Detector import Mention_Spike_Detector
+from Top_Ticker_Tracker import Top_Ticker_Tracker
+
+
+
+class WSB_Sentiment():
+    def __init__(self, **kwargs):
+        self.wsb_thread = None                                                                  # Initialize WSB Sentiment thread       
+        self.data_dir = kwargs.get('data_dir', 'Data')                                          # Root of the session directories, history database and write-ahead log
+        self.source = kwargs.get('source') or Selenium_Source()                                 # Source of WSB "comment-area" text (defaults to chrome webdriver)
+        self.ticker_extractor = Ticker_Extractor(globals.TICKER_UNIVERSE)                       # Single pass ticker extractor for comment text
+        self.comment_feed = Comment_Feed(max_seen=kwargs.get('max_seen_comments', 50000))       # Finds new lines in the WSB comment feed
+        self.poll_scheduler = Poll_Scheduler(min_interval=kwargs.get('min_poll_interval', 0.25), # Adapts the WSB comment feed poll interval to the comment arrival rate
+                                             max_interval=kwargs.get('max_poll_interval', 10.0))
+        self.comment_store = Comment_Store(window_partitions=kwargs.get('comment_window', 1),   # This store contains WSB sentiment comments (comment table + ticker mention table)
+                                           max_memory_mb=kwargs.get('max_comment_memory_mb', 256),    # (current trading session in memory, older sessions only in the comment archive)
+                                           spill_dir=None, on_spill=lambda partition: self.flush_comments())    # (unwritten comments are handed to the archive from memory before they are dropped)
+        self.flushed_comments = 0                                                               # Number of comments already handed to the persistence worker
+        self.unwritten_comments = list()                                                        # Comment snapshots not written yet (persistence queue full or failed write)
+        self.unwritten_lock = threading.Lock()                                                  # (Failed writes are added back by the persistence worker thread)
+        self.unarchived_snapshots = list()                                                      # Comment snapshots handed off but not in the comment archive yet (queried w/ the archive)
+        self.archive_lock = threading.Lock()                                                    # Comment archive appends vs. queries (a comment is read from the archive or its snapshot, not both)
+        self.comment_archives = dict()                                                          # Trading session --> append-only comment archive (session directory)
+        self.archive_format = Comment_Archive.get_supported_format(kwargs.get('archive_format', 'parquet'))    # Comment archive segment format ('parquet' or 'feather', 'pickle' if pyarrow is missing)
+        self.export_comments_excel = kwargs.get('export_comments_excel', False)                 # Also write a human readable wsb_comments excel file after each flush
+        self.sentiment_history = Sentiment_History(kwargs.get('history_db', os.path.join(self.data_dir, 'wsb_history.db')))     # Indexed history of comments, ticker sentiment and reports (all sessions)
+        self.sentiment_ema = Sentiment_EMA(self.sentiment_history, spans=kwargs.get('ema_spans', (5, 10, 20)))    # Daily bull/bear ratio EMAs (O(1) update per day)
+        self.comment_wal = Comment_WAL(wal_dir=kwargs.get('wal_dir', os.path.join(self.data_dir, 'comment_wal')),  # Write-ahead log of comments not yet in the comment archive
+                                       fsync_interval=kwargs.get('wal_fsync_interval', 1.0),    # (group commit: fsync every n seconds or n records)
+                                       fsync_batch=kwargs.get('wal_fsync_batch', 256))
+        self.market_data = kwargs.get('market_data') or Market_Data(max_workers=kwargs.get('market_data_workers', 8))     # Batched stock market data requests (open prices)
+        self.persistence_worker = Persistence_Worker(max_queue=kwargs.get('persistence_queue', 8))     # Writes comment/sentiment snapshots to disk in the background
+        self.wsb_status_update_df = pd.DataFrame()                                              # This dataframe contains stock tickers for the WSB status report
+        self.ticker_sentiment_df = pd.DataFrame()                                               # This dataframe contains all stock ticker sentiment
+        self.top_ticker_sentiment_df = pd.DataFrame()                                           # This dataframe contains top stock ticker sentiment
+        self.ema_df = pd.DataFrame()                                                            # Exponential Moving Average dataframe
+        self.sentiment_aggregator = Sentiment_Aggregator()                                      # Overall and per ticker bullish/bearish counts (updated as each comment is collected)
+        self.session = None                                                                     # Trading session of the comments being counted
+        self.sentiment_timeline = Sentiment_Timeline(bucket_seconds=kwargs.get('bucket_seconds', 60),   # Overall and per ticker bullish/bearish counts per time bucket
+                                                     num_buckets=kwargs.get('num_buckets', 1440))       # (default 1 minute buckets covering 24 hours)
+        self.top_tickers = Top_Ticker_Tracker(k=kwargs.get('top_k', 100),                      # Top k most bullish / bearish / mentioned tickers (always current)
+                                              sketch=kwargs.get('top_k_sketch', False))         # (count-min sketch counts for very wide ticker universes)
+        self.spike_detector = Mention_Spike_Detector(short_half_life=kwargs.get('spike_short_half_life', 60.0),    # Flags tickers whose mention rate suddenly accelerates
+                                                     long_half_life=kwargs.get('spike_long_half_life', 3600.0),
+                                                     spike_factor=kwargs.get('spike_factor', 3.0),
+                                                     min_mentions=kwargs.get('spike_min_mentions', 5.0),
+                                                     warmup=kwargs.get('spike_warmup', 300.0))
+        self.update_hour = kwargs.get('update_hour')                                            # Initialize WSB sentiment update hour
+        if self.update_hour is None:
+            self.update_hour = 1                                                                # Default setiment update hour to 1 if not set from kwargs
+        self.update_seconds = kwargs.get('update_seconds')                                      # Initialize WSB sentiment update interval in seconds
+        if self.update_seconds is None:
+            self.update_seconds = self.update_hour * 3600                                       # Default sentiment update interval to (update hour) if not set from kwargs
+
+        if self.source.live:                                                                    # (Offline sources (ex. replay) start from empty sentiment counts)
+            self.load_session_counts(os.path.basename(get_dir_path()))                          # Start from the comments of this session already archived (ex. program restarted)
+            self.replay_wal()                                                                   # Recover comments collected before a crash (not yet in the comment archive)
+
+
+
+    def run(self):
+        self.wsb_thread = threading.Thread(name="WSBSentimentThread",                           # Create WSB thread to collect sentiment comments
+                                      target=self.get_wsb_comments)
+        self.wsb_thread.setDaemon(True)                                                         # Set WSB thread to be background task
+        self.wsb_thread.start()                                                                 # Start WSB thread (Begin collecting sentiment comments in the background)
+
+
+
+    def get_wsb_comments(self):
+
+        self.source.open()                                                      # Open comment source (ex. Setup Chrome Webdriver)
+
+        retry_count = 0                                                         # Initialize reconnection attempts counter if webdriver or socket interrupts occur
+        previous_time = dt.datetime.now()                                       # Initialize current time for WSB sentiment status updates
+        if self.source.skip_initial_page:                                       # Initialize current comments collected from WSB (mark as seen)
+            self.comment_feed.seed(self.source.read())
+
+        print(">>> Collecting WSB Sentiment Comments. . .")
+
+        with globals.WSB_SPINNER as spinner:                                                # Create progress spinner for sentiment loop
+            while True:                                                                     # Loop forever on daemon thread. . .
+                try:
+                    if not self.source.self_paced:                                          # Wait for next poll (poll interval adapts to the comment arrival rate)
+                        self.poll_scheduler.wait()
+
+                    self.comment_wal.sync_if_due()                                          # Sync write-ahead log records waiting longer than the fsync interval
+
+                    # /// Network connection handling
+                    # (Offline comment sources (ex. replay) do not require a network connection)
+                    if self.source.requires_network and retry_count > 0 and is_network_connected():     # If network connection is re-established after being disconnected
+                        with spinner.hidden():
+                            print(">>> Network Connection Established. . .")
+                            retry_count = 0                                                 # Reset the reconnection attempts counter
+
+                            if not self.source.is_open():                                   # Setup comment source (webdriver) if it was not established
+                                self.source.open()
+
+                    elif self.source.requires_network and not is_network_connected():       # If network connection is disconnected after being established
+                        with spinner.hidden():
+                            print(">>> Network Disconnected. . .")
+                            self.source.close()                                             # Shutdown the comment source (webdriver)
+
+                    # /// Sentiment message processing
+                    recent_comments = self.source.read()                                    # Get new WSB comments from "comment-area" section of webpage
+
+                    if recent_comments is None:                                             # If comment source has no more comments (ex. replay finished),
+                        with spinner.hidden():                                              # provide a final sentiment update and exit the WSB sentiment loop
+                            print(">>> No more WSB comments from comment source. . .")
+                            self.sentiment_analysis()
+                        break
+
+                    # Get new "Bullish", "Bearish", and "None" sentiment type comments, if any (lines not found in the seen comment index)
+                    updated_comments = self.comment_feed.get_new_lines(recent_comments)
+                    self.poll_scheduler.update(len(updated_comments))                      # Update poll interval w/ number of new comment lines
+                    
+                    if not updated_comments:                                                # If no new comments have been collected, 
+                        continue                                                            # return to the beginning of while loop
+
+                    # Find all indexes of "bullish", "bearish", and "none" comments
+                    idx_list = [idx for idx, comment in enumerate(updated_comments) if ("bullish" in comment) or ("bearish" in comment) or ("none" in comment)]
+
+                    # Merge comments initially separated by "\n" into one comment and ignore all "none" sentiment type comments
+                    updated_comments = [" ".join(updated_comments[idx_list[i]:idx_list[i+1]]) if (i < len(idx_list)-1) and (idx_list[i+1]-idx_list[i] > 1) \
+                                        else updated_comments[idx_list[i]] for i in range(len(idx_list)) if not("none" in updated_comments[idx_list[i]])]
+
+                    if not updated_comments:                                                # If no new "bullish" or "bearish" comments have been collected (only "none" comments)
+                        continue                                                            # have been collected), return to the beginning of while loop  
+                        
+                    session = os.path.basename(get_dir_path())                              # Trading session of new comments (comment store partition)
+
+                    for comment in updated_comments:                                        # Iterate through all new comments collected
+                        strn = comment.split(' ', 3)
+                        
+                        if len(strn) < 4:                                                   # Skip new comment if not in the correct format 
+                            continue                                                        # (sentiment / time / author / text)
+
+                        sentiment, time_stamp, author, text = strn[0], strn[1], strn[2], strn[3]    # Get sentiment / time stamp / author / comment text
+                        mentioned_tickers = self.ingest_comment(sentiment, time_stamp[1:-1], author, text, session)
+
+                        spinner.text = f"Mentioned Tickers: {mentioned_tickers}"                    # Show mentioned tickers in spinner text for visual confirmation
+
+                    # Report tickers whose mention rate just spiked (short horizon mention rate > spike factor * long horizon baseline)
+                    for spike in self.spike_detector.pop_new_spikes():
+                        with spinner.hidden():
+                            print(">>> MENTION SPIKE: %-8s %6.1f mentions/min (baseline %.1f/min, %.1fx) BULL/BEAR RATIO: %.2f" % (spike['Ticker'], spike['Short Rate'],
+                                                                                                                      spike['Long Rate'], spike['Rate Ratio'],
+                                                                                                                      spike['Bull/Bear Ratio']))
+                    
+                    # Provide sentiment update every (n) second increments (default: update hour * # of sec in an hour)
+                    if (dt.datetime.now() - previous_time).total_seconds() >= self.update_seconds:          
+                        self.sentiment_analysis()                                                           
+                        previous_time = dt.datetime.now()                                           # Update current time for WSB sentiment status updates
+
+
+                # /// WiFi Connection Issues
+                except (AttributeError, ConnectionError):
+                    with spinner.hidden():                                                      
+                        logging.warning("*** AttributeError/ConnectionError: Could Not Access Sentiment Data. . .")
+                        retry_count += 1                                                            # If AttributeError/ConnectionError raised (internet connection issue), increment retry count
+                        
+                        # If connection retry counter < max number of connection retries allowed
+                        if retry_count <= globals.MAX_RETRIES:                                      
+                            print(f">>> Connection retry attempt {retry_count}/{globals.MAX_RETRIES}. . . ")
+                            time.sleep(5.0)                                                         # Wait 5 seconds before trying again
+                            continue                                                                # Return to beginning of While Loop
+
+                        # WiFi re-connectivity failed
+                        else:                                                                   
+                            print('>>> Max connection retry attempts reached. . . Exiting WSB Sentiment Program')
+                            break
+
+                # /// Keyboard Shutdown Enabled
+                except (urllib3.exceptions.ProtocolError, urllib3.exceptions.NewConnectionError, KeyboardInterrupt):
+                    with spinner.hidden():
+                        logging.warning("*** ProtocolError/NewConnectionError/KeyboardInterrupt: Exiting WSB Sentiment loop. . .")
+
+                        # Write any collected WSB sentiment comments (not yet written) to the comment archive before exiting
+                        self.flush_comments()
+                        self.persistence_worker.stop()                                      # Wait for queued writes to finish
+
+                        break
+
+                # /// Unknown Exception Handling
+                except Exception:   
+                    with spinner.hidden():                                                      
+                        logging.error(f"*** Unexpected Exception Occured! (WSB Loop)***", exc_info=True)
+                        break
+
+            # If still active, shutdown comment source (webdriver)
+            with spinner.hidden():
+                self.source.close()
+                self.persistence_worker.drain()                                             # Wait for queued writes to finish
+                self.comment_wal.close()                                                    # Sync any comments not yet in the comment archive to the write-ahead log
+
+        return
+
+
+
+    def ingest_comment(self, sentiment, time_stamp, author, text, session=None, timestamp=None, log=True):
+        timestamp = timestamp if timestamp is not None else time.time()             # Time comment was collected
+        if log:                                                                     # Write comment to the write-ahead log (replayed after a crash)
+            self.comment_wal.append(session, sentiment, time_stamp, author, text, timestamp)
+
+        if session != self.session:                                                 # New trading session, restart sentiment counts (from its archived comments, if any)
+            self.load_session_counts(session)
+
+        sentiment_code = get_sentiment_code(sentiment)                              # Normalize sentiment label once (bullish/(bullish)/bearish/(bearish)/none --> code)
+        mentioned_tickers = self.find_mentioned_tickers(text)                       # Find any tickers mentioned in comment text        
+            
+        # Append comment once to the Sentiment comment store (w/ one mention row per mentioned ticker)
+        self.comment_store.append(time_stamp, sentiment_code, author, mentioned_tickers, text, session)
+
+        self.sentiment_aggregator.add(sentiment_code, mentioned_tickers)            # Update overall and per ticker sentiment counts
+        self.top_tickers.add(sentiment_code, mentioned_tickers)                     # Update top bullish / bearish / most mentioned tickers
+        self.sentiment_timeline.add(sentiment_code, mentioned_tickers, timestamp)   # Update overall and per ticker sentiment counts of the current time bucket
+        self.spike_detector.add(sentiment_code, mentioned_tickers, timestamp)       # Update per ticker mention rates (flags mention spikes)
+
+        return mentioned_tickers                                                    # Return list of tickers mentioned in comment text
+
+
+
+    def find_mentioned_tickers(self, text):
+        return self.ticker_extractor.find_mentioned_tickers(text)           # Return list of tickers mentioned in comment text
+
+
+
+    def find_mentioned_tickers_batch(self, texts):
+        return self.ticker_extractor.find_mentioned_tickers_batch(texts)    # Return list of mentioned tickers for each comment text
+
+
+
+    def sentiment_analysis(self):
+        try:
+            if self.comment_store.empty:        # If WSB sentiment comment store is empty (no WSB comments were collected)
+                print(">>> No WSB sentiment comments found!. . . No analysis to be done. . .")
+                return                          # Exit function
+
+            self.flush_comments()               # Hand comments collected since the last flush to the persistence worker (earlier comments are already archived)
+
+            print(">>>")
+            print(">>> ===========================================================")
+            print(">>> $ $ $    W S B    S E N T I M E N T    S T A T U S    $ $ $")
+            print(">>> ===========================================================")
+            print(">>>")
+
+            print(f">>> DATE / TIME OF REPORT: {dt.date.today().strftime('%Y-%m-%d')} \t {dt.datetime.now().time()}")
+
+            comment_window = self.comment_store.get_window_info()                                   # Report in-memory comment window (long running memory usage)
+            print(f">>> COMMENT WINDOW: {comment_window['Comments In Memory']} comments / {comment_window['Mentions In Memory']} ticker mentions in memory "
+                  f"({comment_window['Memory MB']}/{comment_window['Max Memory MB']} MB) | {comment_window['Spilled Comments']} comments released from memory (in comment archive)")
+
+            persistence = self.persistence_worker.get_stats()                                       # Report background write queue (comments are never blocked on disk writes)
+            print(f">>> PERSISTENCE: {persistence['Queue Depth']}/{persistence['Max Queue']} writes queued | last write {persistence['Last Latency MS']} ms "
+                  f"(max {persistence['Max Latency MS']} ms) | {persistence['Tasks Rejected']} writes deferred (queue full)")
+
+            print(f">>> OVERALL WSB SENTIMENT SCORE (BULL / BEAR RATIO): {self.get_overall_sentiment()}") 
+            print(">>>")
+
+            # Get ticker sentiment (sorted from largest to smallest Bullish and Bearish count) from the sentiment counts updated as comments are collected
+            self.ticker_sentiment_df = self.sentiment_aggregator.get_ticker_sentiment_df()
+                      
+            # Write all ticker sentiment dataframe to excel file and history in the background (skipped if the write queue is full, the next update replaces it)
+            self.persistence_worker.submit("ticker_sentiment", self.write_ticker_sentiment, self.session, self.get_session_dir_path(self.session),
+                                           self.ticker_sentiment_df, self.sentiment_aggregator.get_counts())
+
+            ticker_report_df = self.get_status_report_df()                                          # Only show top 10 Bullish/Bearish tickers for WSB status update
+
+            bull_bear_ratio_percent_change = "N/A"                                                  # Initialize bull/bear ratio percent change to N/A
+            for ticker in ticker_report_df.index:                                                   # Iterate through each top 10 Bullish/Bearish tickers
+
+                # If the WSB status update dataframe is not empty (contains ticker data) and the current ticker is found in the dataframe and the Bull/Bear Ratio of the ticker
+                # in the WSB status update dataframe is not zero (prevent divide by zero error), calculate a percent change between the ticker's current and previous 
+                # bull/bear ratio values
+                if (not self.wsb_status_update_df.empty) and (ticker in self.wsb_status_update_df.index) and (self.wsb_status_update_df.loc[ticker, "Bull/Bear Ratio"] != 0):
+                    bull_bear_ratio_percent_change = str(round(((ticker_report_df.loc[ticker, "Bull/Bear Ratio"] - self.wsb_status_update_df.loc[ticker, "Bull/Bear Ratio"])\
+                                                        / self.wsb_status_update_df.loc[ticker, "Bull/Bear Ratio"]) * 100, 2))
+
+                # Print information for each ticker
+                print(">>> TICKER: %-8s BULL COUNT: %-8d BEAR COUNT: %-8d BULL/BEAR RATIO: %-8.2f RATIO %% CHANGE: %-8s" % (ticker,
+                                                                                                                            ticker_report_df.loc[ticker, "Bullish Count"],
+                                                                                                                            ticker_report_df.loc[ticker, "Bearish Count"],
+                                                                                                                            ticker_report_df.loc[ticker, "Bull/Bear Ratio"],
+                                                                                                                            bull_bear_ratio_percent_change))
+
+            print(">>>")
+            self.wsb_status_update_df = ticker_report_df                                        # Update WSB status update dataframe
+            return 
+
+        except KeyError:
+            logging.warning("*** KeyError: DataFrame Key Not Found. . .", exc_info=True)        # If dataframe Key Error Exception occured,
+            print(">>> Unable to provide WSB sentiment analysis!. . . ")
+            return                                                                             
+
+        except Exception:
+            logging.error(f"*** Unexpected Exception Occured! ***", exc_info=True)              # If an Unknown Exception occured,
+            print(">>> Unable to provide WSB sentiment analysis!. . . ")
+            return                                                                                     
+
+
+
+    def get_session_dir_path(self, session=None):
+        session = session or os.path.basename(get_dir_path())                      # Return directory of a trading session (defaults to the current trading session)
+        return os.path.join(self.data_dir, session)
+
+
+
+    def get_comment_archive(self, session=None):
+        session = session or os.path.basename(get_dir_path())                      # Return append-only comment archive of a trading session directory
+        if session not in self.comment_archives:
+            self.comment_archives[session] = Comment_Archive(self.get_session_dir_path(session), file_format=self.archive_format)
+        return self.comment_archives[session]
+
+
+
+    def replay_wal(self):
+        # Replay comments from the write-ahead log into the comment store and sentiment counts (same as collecting them again)
+        # (Comments of a session whose WAL segment is recorded in the session's comment archive are already archived and counted, ex. crash
+        # between the archive write and the WAL checkpoint)
+        start, num_comments, archived_segments = time.perf_counter(), 0, dict()
+        for segment, timestamp, session, sentiment, time_stamp, author, text in self.comment_wal.replay():
+            if session not in archived_segments:
+                archived_segments[session] = self.get_comment_archive(session).get_wal_segments()
+            if segment in archived_segments[session]:
+                continue
+
+            self.ingest_comment(sentiment, time_stamp, author, text, session, timestamp=timestamp, log=False)
+            num_comments += 1
+
+        if num_comments:
+            self.spike_detector.pop_new_spikes()                                    # Don't report spikes of recovered comments as new
+            print(f">>> Recovered {num_comments} comments from the write-ahead log in {time.perf_counter() - start:.2f} sec. . .")
+
+
+
+    def flush_comments(self):
+        # Hand a snapshot of the comments collected since the last flush to the persistence worker (only the new comments are written)
+        # Snapshots not written yet (persistence queue full or failed write) are handed to the persistence worker again first
+        with self.unwritten_lock:
+            snapshots, self.unwritten_comments = self.unwritten_comments, list()
+
+            if self.comment_store.total_comments != self.flushed_comments:
+                partitions = [[session, comments_df, mentions_df, False]                    # (False: not in the comment archive yet)
+                              for session, comments_df, mentions_df in self.get_unflushed_tables()]
+                snapshots.append({'Partitions': partitions, 'WAL Segments': self.comment_wal.rotate()})    # Comments logged up to now are in this flush
+                self.unarchived_snapshots.append(snapshots[-1])
+                self.flushed_comments = self.comment_store.total_comments
+
+        for i, snapshot in enumerate(snapshots):
+            if not self.persistence_worker.submit("comments", self.write_comments, snapshot):
+                logging.warning("*** Persistence queue full. . . Comments will be written w/ the next flush. . .")
+                with self.unwritten_lock:                                           # Queue full, snapshots are handed off again w/ the next flush
+                    self.unwritten_comments = snapshots[i:] + self.unwritten_comments
+                break
+
+
+
+    def get_unflushed_tables(self):
+        # Return [(session, comment table, mention table)] of the comments collected since the last flush (store comment ids)
+        tables = list()
+        for session, comments_df, mentions_df in self.comment_store.get_partition_tables(start=self.flushed_comments):
+            # Only keep bullish/bearish and possible bullish/bearish comments ((bullish)/(bearish)) (Remove potential garbage)
+            comments_df = comments_df[comments_df['Sentiment'].isin(['bullish', '(bullish)', 'bearish', '(bearish)'])]
+            mentions_df = mentions_df[mentions_df['Comment'].isin(comments_df.index)]
+            tables.append((session, comments_df, mentions_df))
+        return tables
+
+
+
+    def query_comments(self, session=None, ticker=None):
+        # Return all comments of a trading session (archived comments, then comments not archived yet from snapshots and memory), optionally for one ticker
+        session = session or os.path.basename(get_dir_path())
+        with self.archive_lock:
+            df_list = [self.get_comment_archive(session).to_df().reset_index(drop=True)]
+            with self.unwritten_lock:
+                tables = [(comments_df, mentions_df) for snapshot in self.unarchived_snapshots
+                          for partition, comments_df, mentions_df, archived in snapshot['Partitions'] if partition == session and not archived]
+                tables += [(comments_df, mentions_df) for partition, comments_df, mentions_df in self.get_unflushed_tables() if partition == session]
+
+        df_list += [Comment_Archive.join_tables(comments_df, mentions_df).reset_index(drop=True) for comments_df, mentions_df in tables]
+        df = pd.concat(df_list, ignore_index=True).astype({'Sentiment': str, 'Ticker': object})
+        return df if ticker is None else df[df['Ticker'] == ticker].reset_index(drop=True)
+
+
+
+    def write_comments(self, snapshot):
+        # Append comment snapshot to the comment archive and history of each trading session (runs on the persistence worker thread)
+        try:
+            partitions = snapshot['Partitions']
+            while partitions:
+                session, comments_df, mentions_df, archived = partitions[0]
+                comment_archive = self.get_comment_archive(session)
+                if not archived:                                                    # (A snapshot written again skips partitions already in the archive)
+                    with self.archive_lock:
+                        comments_df, mentions_df = comment_archive.append(comments_df, mentions_df, snapshot['WAL Segments'])
+                        partitions[0] = [session, comments_df, mentions_df, True]
+                self.sentiment_history.add_comments(session, comments_df, mentions_df)     # Batched insert (one transaction per flush)
+                partitions.pop(0)
+
+                if session != self.session:                                         # Trading session is over, merge its segments into one
+                    comment_archive.compact()
+                if self.export_comments_excel:                                      # Optional human readable copy of the archive
+                    comment_archive.export_excel()
+
+            self.comment_wal.checkpoint(snapshot['WAL Segments'])                  # Written comments no longer need to be replayed
+            with self.unwritten_lock:
+                self.unarchived_snapshots = [unarchived for unarchived in self.unarchived_snapshots if unarchived is not snapshot]
+
+        except Exception:                                                           # Write snapshot again w/ the next flush (its WAL segments are kept until written)
+            with self.unwritten_lock:
+                self.unwritten_comments.append(snapshot)
+            raise
+
+
+
+    def write_ticker_sentiment(self, session, dir_path, ticker_sentiment_df, counts):
+        # Write ticker sentiment snapshot to excel file (session directory of the snapshot) and history (runs on the persistence worker thread)
+        write_df_to_excel(ticker_sentiment_df, "ticker_sentiment_all", dir_path)
+        self.sentiment_history.write_ticker_sentiment(session, ticker_sentiment_df)
+        self.sentiment_history.write_session_sentiment(session, *counts)
+
+
+
+    def load_session_counts(self, session):
+        # Start sentiment counts of a trading session from its archived comments (ex. program restarted mid-session), before new comments are counted
+        self.sentiment_aggregator.reset()
+        self.top_tickers.reset()
+        self.session = session
+        if session is None:
+            return
+
+        if len(self.get_comment_archive(session)) or os.path.exists(f'{self.get_session_dir_path(session)}/wsb_comments.xlsx'):
+            self.rebuild_ticker_sentiment(session=session)
+            bull_count, bear_count = self.sentiment_aggregator.get_counts()
+            print(f">>> Loaded sentiment counts of {session} from archived comments (BULL COUNT: {bull_count}, BEAR COUNT: {bear_count}). . .")
+
+
+
+    def rebuild_ticker_sentiment(self, wsb_sentiment_df=None, session=None):
+        # Rebuild all sentiment counts from a comment dataframe (defaults to the session's comment archive) in one vectorized pass
+        session = session or os.path.basename(get_dir_path())                      # Trading session of the counts (defaults to the current trading session)
+        try:
+            if wsb_sentiment_df is None:
+                comment_archive = self.get_comment_archive(session)
+                if len(comment_archive):                                            # Only the Sentiment and Ticker columns are read from disk
+                    wsb_sentiment_df = comment_archive.to_df(columns=['Sentiment', 'Ticker'])
+                else:                                                               # Sessions archived before the comment archive (wsb_comments excel file)
+                    wsb_sentiment_df = pd.read_excel(f'{self.get_session_dir_path(session)}/wsb_comments.xlsx', index_col=0, engine='openpyxl')
+
+            self.sentiment_aggregator.rebuild(wsb_sentiment_df)                     # Replace sentiment counts (overall and per ticker)
+            self.top_tickers.load_counts(self.sentiment_aggregator.ticker_counts)   # Replace top ticker rankings
+            self.ticker_sentiment_df = self.sentiment_aggregator.get_ticker_sentiment_df()
+            self.session = session                                                  # Counts belong to this trading session
+            return self.ticker_sentiment_df
+
+        except FileNotFoundError:       # If excel file w/ WSB comments is not found, exit from function
+            logging.warning(f"*** FileNotFoundError: Excel file '{self.get_session_dir_path(session)}/wsb_comments' not found. . .")
+            return
+
+        except Exception:               # If an Unknown Exception occured, exit from function
+            logging.error("*** Unexpected Exception Occured! ***", exc_info=True)
+            return
+
+
+
+    def get_top_tickers(self):
+        print(">>> Collecting top tickers. . .")
+        try:
+            # If no comments were collected by this run (ex. program restarted), rebuild sentiment counts from the session's comment archive
+            if not len(self.top_tickers):
+                self.rebuild_ticker_sentiment()
+
+            if not len(self.top_tickers):       # If no ticker sentiment is available, exit from function
+                logging.warning("*** No ticker sentiment collected. . . Cannot collect top tickers. . .")
+                return
+
+            # Get the top 25 bullish/bearish tickers from the always current top k rankings (no excel file read)
+            metric = 'Bearish' if self.get_overall_sentiment() < 1.0 else 'Bullish'
+            self.top_ticker_sentiment_df = self.filter_top_tickers(self.top_tickers.get_top_df(metric, self.top_tickers.k))
+
+            # If fewer than 25 of the top k tickers pass the bull/bear ratio filter, filter the sentiment of all tickers instead
+            if len(self.top_ticker_sentiment_df) < 25:
+                self.top_ticker_sentiment_df = self.filter_top_tickers(self.sentiment_aggregator.get_ticker_sentiment_df())
+
+            self.top_ticker_sentiment_df = self.top_ticker_sentiment_df[:25].copy()     # Collect only the top 25 bullish/bearish tickers
+
+            self.get_previous_sentiment_percent_chng()                          # Calculate previous day's sentiment percent change for top
+                                                                                # 25 bullish/bearish tickers
+
+            # Get open price for top 25 bullish/bearish tickers (one batched request, concurrent per-ticker requests for tickers missing from it)
+            with globals.WSB_SPINNER as spinner:                   # Create progress spinner for open price request
+                spinner.text = f'Collecting Open Price for. . . {len(self.top_ticker_sentiment_df)} tickers'
+                open_prices = self.market_data.get_open_prices(list(self.top_ticker_sentiment_df.index))
+
+            self.top_ticker_sentiment_df['Open'] = [open_prices[ticker] for ticker in self.top_ticker_sentiment_df.index]   # Add stock ticker's Open price to top tickers dataframe
+            fetch = self.market_data.get_last_fetch()
+            print(f">>> Collected {fetch['Tickers'] - fetch['Failed']}/{fetch['Tickers']} open prices in {fetch['Total Seconds']} sec "
+                  f"(BATCHED: {fetch['Batched']} in {fetch['Batch Seconds']} sec, PER TICKER: {fetch['Fallback']}). . .")
+
+            write_df_to_excel(self.top_ticker_sentiment_df, 'ticker_sentiment_top25', self.get_session_dir_path())
+            self.sentiment_history.write_top_tickers(os.path.basename(get_dir_path()), self.top_ticker_sentiment_df)
+
+            return 
+
+        except Exception:               # If an Unknown Exception occured, exit from function
+            logging.error("*** Unexpected Exception Occured! ***", exc_info=True)    
+            return  
+
+
+
+    def filter_top_tickers(self, ticker_sentiment_df):
+        # If overall sentiment is bullish, get the bullish tickers
+        if self.get_overall_sentiment() > 1.0:
+            # Find tickers with a bull/bear ratio > 1.0 (sorted from largest to smallest Bullish and Bearish count)
+            return ticker_sentiment_df[ticker_sentiment_df['Bull/Bear Ratio'] > 1.0]
+
+        # If overall sentiment is bearish, get the bearish tickers
+        elif self.get_overall_sentiment() < 1.0:
+            ticker_sentiment_df = ticker_sentiment_df[ticker_sentiment_df['Bull/Bear Ratio'] < 1.0]                        # Only bearish tickers
+            return ticker_sentiment_df.sort_values(by=['Bull/Bear Ratio'], ascending=True, kind='stable')                  # Sort Bull/Bear Ratio from smallest to largest
+
+        # Else overall sentiment is neutral, get the most bullish tickers
+        return ticker_sentiment_df
+
+
+
+    def get_previous_sentiment_percent_chng(self):
+        print(">>> Collecting percent change of previous day sentiment. . .")
+        dir_path = self.get_session_dir_path(os.path.basename(get_dir_path(prev_day=True)))     # Get directory path for previous market day data
+
+        try:
+            # Read previous market day's top 25 ticker sentiment from history (excel file for sessions not in history)
+            yesterdays_ticker_sentiment_df = self.sentiment_history.get_top_tickers_df(os.path.basename(dir_path))
+            if yesterdays_ticker_sentiment_df.empty:
+                yesterdays_ticker_sentiment_df = pd.read_excel(f'{dir_path}/ticker_sentiment_top25.xlsx', index_col=0, engine='openpyxl')
+
+            # Iterate through all tickers from today's top 25 ticker sentiment
+            for ticker in self.top_ticker_sentiment_df.index:
+                # If ticker found in yesterday's top 25 ticker sentiment, calculate sentiment percent change for ticker
+                if ticker in yesterdays_ticker_sentiment_df.index:
+                    self.top_ticker_sentiment_df.loc[ticker, 'Sentiment Percent Change'] = ((self.top_ticker_sentiment_df.loc[ticker, 'Bull/Bear Ratio'] - yesterdays_ticker_sentiment_df.loc[ticker, 'Bull/Bear Ratio'])\
+                                                                                            / yesterdays_ticker_sentiment_df.loc[ticker, 'Bull/Bear Ratio']) * 100
+
+            return
+        
+        except FileNotFoundError:       # If excel file w/ top 25 individual ticker sentiment data is not found, exit from function
+            logging.warning(f"*** FileNotFoundError: Excel file '{dir_path}/ticker_sentiment_top25' not found. . .")
+            return
+
+        except Exception:               # If an Unknown Exception occured, exit from function
+            logging.error("*** Unexpected Exception Occured! ***", exc_info=True)    
+            return   
+
+
+
+    def calc_ema(self, period=10):
+        session = os.path.basename(get_dir_path())
+        self.sentiment_ema.add_span(period)
+
+        # Record today's bull/bear ratio in history (re-running on the same day replaces today's entry)
+        self.sentiment_history.write_session_sentiment(session, *self.sentiment_aggregator.get_counts())
+
+        # Add today's bull/bear ratio to the EMA of every span (O(1) update of the stored EMA state, same day re-runs replace today's value)
+        self.sentiment_ema.update(self.sentiment_history.get_session_date(session), self.get_overall_sentiment())
+        self.ema_df = self.sentiment_ema.get_ema_df()
+
+        # Write EMA data to excel file in the background (not needed for the buy/sell/hold signal)
+        self.persistence_worker.submit("ema", write_df_to_excel, self.ema_df, "sentiment_ema", self.data_dir)
+
+        # Return 10-day EMA for today's date
+        return self.sentiment_ema.get_ema(period)
+
+
+
+    def get_ema_signal(self, period=10):
+        return self.sentiment_ema.get_signal(self.get_overall_sentiment(), period)     # Return 'BUY' / 'SELL' / 'HOLD' for bull/bear ratio vs. its EMA
+
+
+
+    def get_close_price_and_percent_chng(self):
+        print(">>> Collecting Close Price. . .")
+        try:
+            # Write close price for top 10 bullish/bearish tickers to dataframe
+            #self.top_ticker_sentiment_df['Close'] = [yf.Ticker(ticker).history(period="1d").iloc[0]['Close'] for ticker in self.top_ticker_sentiment_df.index\
+            #                                                                                                    if self.top_ticker_sentiment_df.loc[ticker, "Open"] is not None]
+
+            # Write percent change between open and close prices for top 25 bullish/bearish tickers to dataframe
+            for ticker in self.top_ticker_sentiment_df.index:
+                if self.top_ticker_sentiment_df.loc[ticker, 'Open'] is not None:
+                    self.top_ticker_sentiment_df.loc[ticker, 'Close'] = yf.Ticker(ticker).history(period="1d").iloc[0]['Close'] 
+                    self.top_ticker_sentiment_df.loc[ticker, "Price Percent Change"] = ((self.top_ticker_sentiment_df.loc[ticker, 'Close'] - self.top_ticker_sentiment_df.loc[ticker, 'Open'])\
+                                                                                        / self.top_ticker_sentiment_df.loc[ticker, 'Open']) * 100
+                else:
+                    self.top_ticker_sentiment_df.loc[ticker, "Close"] = None
+                    self.top_ticker_sentiment_df.loc[ticker, "Price Percent Change"] = None
+
+            # self.top_ticker_sentiment_df['Price Percent Change'] = ((self.top_ticker_sentiment_df['Close'] - self.top_ticker_sentiment_df['Open'])\
+            #                                                         / self.top_ticker_sentiment_df['Open']) * 100
+
+            # Write ticker sentiment dataframe to excel file (this should overwrite previous ticker_sentiment excel sheet)
+            write_df_to_excel(self.top_ticker_sentiment_df, "ticker_sentiment_top25", self.get_session_dir_path())
+            self.sentiment_history.write_top_tickers(os.path.basename(get_dir_path()), self.top_ticker_sentiment_df)
+
+            return
+
+        except TypeError:       
+            logging.warning("*** TypeError: Empty DataFrame. . .")                      # If top 25 ticker sentiment dataframe is empty, exit function
+            return
+
+        except Exception:       
+            logging.error(f"*** Unexpected Exception Occured! ***", exc_info=True)      # If Unknown Exception occured, return exit function
+            return  
+
+
+
+    def determine_potential_profits(self):
+        print(">>> Writing Potential Profit/Loss Report. . .")
+
+        # Create watchlist report file
+        file = open(f'{self.get_session_dir_path()}/potential_profit_loss_report.txt', 'w')
+
+        file.write("====================================================================\n")
+        file.write("                       PROFIT / LOSS REPORT                         \n")
+        file.write("====================================================================\n")
+
+        # Write total cost to own 100 shares of each stock at Market Open price
+        file.write('\n')
+        file.write(">>> Cost for 100 shares at Market Open\n")
+        total_cost = 0
+        for ticker in self.top_ticker_sentiment_df.index:
+            file.write("Ticker: %-8s | Open Price Cost (USD): $%-8.2f" % (ticker, self.top_ticker_sentiment_df.loc[ticker, "Open"] * 100))
+            total_cost += round(self.top_ticker_sentiment_df.loc[ticker, "Open"] * 100, 2)
+        file.write(f"Total Cost (USD): ${total_cost}")
+        
+        # Write total value/worth of 100 shares of each stock at Market Close price
+        file.write('\n')
+        file.write(">>> Value of 100 shares at Market Close\n")
+        total_value = 0
+        for ticker in self.top_ticker_sentiment_df.index:
+            file.write("Ticker: %-8s | Close Price Value (USD): $%-8.2f" % (ticker, self.top_ticker_sentiment_df.loc[ticker, "Close"] * 100))
+            total_value += round(self.top_ticker_sentiment_df.loc[ticker, "Close"] * 100, 2)
+        file.write(f"Total Value (USD): ${total_value}")
+
+        # Write daily profit/loss made from each stock
+        file.write('\n')
+        file.write(">>> Daily Profit/Loss from each stock ticker\n")
+        for ticker in self.top_ticker_sentiment_df.index:
+            file.write("Ticker: %-8s | Profit/Loss (USD): $%-8.2f" % (ticker, ((self.top_ticker_sentiment_df.loc[ticker, "Close"] * 100) - \
+                                                                                (self.top_ticker_sentiment_df.loc[ticker, "Open"] * 100))))
+
+        # Write total daily profit/loss
+        file.write('\n')
+        file.write(f">>> Total Daily Profit/Loss (USD): ${total_value - total_cost}\n")        
+
+        # Close the file after writing
+        file.close()    
+        
+        return
+
+
+
+    def get_wsb_thread(self):
+        return self.wsb_thread                  # Return WSB sentiment daemon thread
+
+
+
+    def get_wsb_sentiment_df(self):
+        return self.comment_store.to_df()       # Return dataframe containing WSB sentiment comments in the in-memory window (one row per mentioned ticker)
+
+
+
+    def get_comment_tables(self):
+        return self.comment_store.get_tables()  # Return (comment table, ticker mention table) dataframes for the comments in the in-memory window (older comments are in the comment archive)
+
+
+
+    def get_comment_window(self):
+        return self.comment_store.get_window_info()     # Return in-memory comment window (partitions, comments, memory) and released comment info
+
+
+
+    def get_all_ticker_sentiment_df(self):
+        return self.sentiment_aggregator.get_ticker_sentiment_df()      # Return dataframe containing the sentiment of all collected tickers from WSB comments
+
+
+
+    def get_sentiment_timeline_df(self, n=60, ticker=None):
+        return self.sentiment_timeline.get_buckets(n, ticker)           # Return last n time buckets of overall (or ticker) bullish/bearish counts
+
+
+
+    def get_mention_spikes_df(self):
+        return self.spike_detector.get_spikes_df()                      # Return most recent mention spike events
+
+
+
+    def get_spiking_tickers(self):
+        return self.spike_detector.get_spiking_tickers()                # Return tickers whose mention rate is currently spiking
+
+
+
+    def get_ticker_history_df(self, ticker, n=30):
+        return self.sentiment_history.get_ticker_history(ticker, n)     # Return ticker sentiment over the last n sessions (from history)
+
+
+
+    def get_top_ticker_sentiment_df(self):
+        return self.top_ticker_sentiment_df     # Return dataframe containing the sentiment of the 25 top mentioned tickers from WSB comments
+
+
+
+    def get_ema_df(self):
+        return self.ema_df                      # Return dataframe containing the latest EMA of each span
+
+
+
+    def get_persistence_stats(self):
+        return self.persistence_worker.get_stats()                      # Return background write queue depth and flush latency
+
+
+
+    def get_overall_sentiment(self):
+        return self.sentiment_aggregator.get_overall_sentiment()        # Return overall bull/bear ratio sentiment score (up to date w/ every collected comment)
+
+
+
+    def get_status_report_df(self, k=10):
+        return self.top_tickers.get_top_df('Bullish', k)                # Return top k Bullish/Bearish tickers (sorted by Bullish and Bearish count)
+
+
     
\ No newline at end of file
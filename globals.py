@@ -1,105 +1,131 @@
-"""
-----------------
-globals.py
-----------------
-Contains all global variables used by the program.
-
-"""
-
-import helper
-from imports import *
-
-URL                     = "https://stocks.comment.ai/"                        # URL to WSB sentiment AI webpage
-MARKET_OPEN             = dt.datetime.strptime('06:30AM', '%I:%M%p').time()   # 06:30 AM
-MARKET_CLOSE            = dt.datetime.strptime('01:00PM', '%I:%M%p').time()   # 01:00 PM
-HOLIDAY_DETERMINED      = False                                               # Determine if Market Holiday
-IS_MARKET_OPEN          = False                                               # Initialize US stock market open flag to be false (market closed)
-IS_WEEKEND              = False                                               # Initialize weekend determination flag to be false
-MAX_RETRIES             = 12                                                  # Number of internet reconnectivity attempts
-TICKER_DICT             = helper.get_all_stock_tickers()                      # Collects all available company stock tickers
-WORDS_TO_IGNORE         = helper.get_words_to_ignore()                        # Read txt file containing words to ignore
-HOLIDAYS                = helper.get_market_holidays()                        # Get US Stock Market Holidays
-
-# Custom spinner design
-MONEY_SPINNER           = Spinner(["( $    )",
-                                   "(  $   )",
-                                   "(   $  )",
-                                   "(    $ )",
-                                   "(     $)",
-                                   "(    $ )",
-                                   "(   $  )",
-                                   "(  $   )",
-                                   "( $    )",
-                                   "($     )"], 100)
-WSB_SPINNER             = yaspin(spinner=MONEY_SPINNER, color="white")
-
-# List of top mentioned ETF's
-ETFS_LIST               = ["EEM", "SPY", "GDX", "XLF", "XOP", "AMLP", "FXI", 
-                           "QQQ", "EWZ", "EFA", "USO", "HYG", "IAU", "IWM", 
-                           "XLE", "XLU", "IEMG", "GDXJ", "SLV", "VWO", "XLP",
-                           "XLI", "OIH", "LQD", "XLK", "VEA", "TLT", "IEFA", 
-                           "XLV", "EWJ", "GLD", "IYR", "BKLN", "EWH", "ASHR", 
-                           "XLB", "RSX", "JNK", "KRE", "XBI", "AGG", "VNQ", 
-                           "GOVT", "UNG", "IVV", "XLY", "EWT", "PFF", "XLRE", 
-                           "MCHI", "INDA", "BND", "USMV", "EZU", "SMH", "XRT", 
-                           "EWY", "IEF", "SPLV", "XLC", "IJR", "VIXY", "EWG", 
-                           "EWW", "VTI", "VGK", "IBB", "PGX", "VOO", "EMB", 
-                           "SCHF", "VEU", "SJNK", "EMLC", "XME", "DIA", "EWA", 
-                           "VCSH", "JPST", "MLPA", "VCIT", "ITB", "ACWI", "KWEB", 
-                           "EWC", "EWU", "BNDX", "SHY", "VT", "IWD", "VXUS", 
-                           "MBB", "ACWX", "XHB", "BSV", "SHV", "FEZ", "IWF", 
-                           "IGSB", "SPYV", "ITOT", "FPE", "FVD", "SHYG", "VYM", 
-                           "BBJP", "DGRO", "KBE", "VTV", "SPAB", "SPIB", "IWR", 
-                           "DBC", "BIL", "SPSB", "FLOT", "GLDM", "VIG", "XES", 
-                           "SCHE", "TIP", "PDBC", "SPYG", "MINT", "SCZ", "SPDW", 
-                           "PCY", "USHY", "IXUS", "NEAR", "EPI", "SPLG", "HYLB", 
-                           "AAXJ", "SPEM", "VMBS", "BIV", "QUAL", "ILF", "EWP",
-                           "TQQQ"]
-
-# US/Canada cell carriers dictionary
-CARRIERS = {
-    # US Carriers
-    "alltel"        : "@mms.alltelwireless.com",
-    "att"           : "@mms.att.net",
-    "boost"         : "@myboostmobile.com",
-    "cricket"       : "@mms.cricketwireless.net",
-    "p_fi"          : "msg.fi.google.com",
-    "sprint"        : "@pm.sprint.com",
-    "tmobile"       : "@tmomail.net",
-    "us_cellular"   : "@mms.uscc.net",
-    "verizon"       : "@vtext.com",
-    "virgin"        : "@vmpix.com",
-
-    # Canada Carriers
-    "bell"          : "@txt.bell.ca",
-    "chatr"         : "@fido.ca",
-    "fido"          : "@fido.ca",
-    "freedom"       : "@txt.freedommobile.ca",
-    "koodo"         : "@msg.koodomobile.com",
-    "public_mobile" : "@msg.telus.com",
-    "telus"         : "@msg.telus.com",
-    "rogers"        : "@pcs.rogers.com",
-    "sasktel"       : "@sms.sasktel.com",
-    "speakout"      : "@pcs.rogers.com",
-    "virgin_ca"     : "@vmobile.ca"
-}
-
-# TEXT MESSAGE SEPARATOR
-SEPARATOR = '-' * 60
-
-# SUBJECT MESSAGES
-STARTUP_MSG_SUBJECT     = "Email SMS Startup"
-WSB_MSG_SUBJECT         = "WSB Tickers"
-SHUTDOWN_MSG_SUBJECT    = "Email SMS Shutdown"
-MSG_SUBJECT             = "Email SMS Message"
-ERROR_MSG_SUBJECT       = "Email SMS Error"
-
-# SMS MESSAGES
-SMS_STARTUP             = "SMS is active! Waiting to send WSB Tickers!\n" + SEPARATOR 
-SMS_WSB_TICKERS         = "Here are the top 10 mentioned WSB Tickers!\n" + SEPARATOR
-SMS_CONFIRM             = "Command Received...Processing Request...\n" + SEPARATOR
-SMS_SHUTDOWN            = "SMS shutting down...\n" + SEPARATOR
-
-# ERROR MESSAGES
-SMS_ERROR_INVALID_CMD   = "ERROR: Invalid command entered.\n" + SEPARATOR
-SMS_ERROR_GENERAL       = "ERROR: An unknown error occured.\n" + SEPARATOR
\ No newline at end of file
+"""
+----------------
+globals.py
+----------------
+Contains all global variables used by the program.
+
+"""
+
+import helper
+from imports import *
+from Ticker_Universe import Ticker_Universe
+from Trading_Calendar import Trading_Calendar
+
+URL                     = "https://stocks.comment.ai/"                        # URL to WSB sentiment AI webpage
+MARKET_OPEN             = dt.datetime.strptime('06:30AM', '%I:%M%p').time()   # 06:30 AM
+MARKET_CLOSE            = dt.datetime.strptime('01:00PM', '%I:%M%p').time()   # 01:00 PM
+EARLY_CLOSE             = dt.datetime.strptime('10:00AM', '%I:%M%p').time()   # 10:00 AM (Early market close days)
+IS_MARKET_OPEN          = False                                               # Initialize US stock market open flag to be false (market closed)
+IS_WEEKEND              = False                                               # Initialize weekend determination flag to be false
+MAX_RETRIES             = 12                                                  # Number of internet reconnectivity attempts
+
+# Custom spinner design
+MONEY_SPINNER_FRAMES    = ["( $    )",
+                           "(  $   )",
+                           "(   $  )",
+                           "(    $ )",
+                           "(     $)",
+                           "(    $ )",
+                           "(   $  )",
+                           "(  $   )",
+                           "( $    )",
+                           "($     )"]
+
+# List of top mentioned ETF's
+ETFS_LIST               = ["EEM", "SPY", "GDX", "XLF", "XOP", "AMLP", "FXI", 
+                           "QQQ", "EWZ", "EFA", "USO", "HYG", "IAU", "IWM", 
+                           "XLE", "XLU", "IEMG", "GDXJ", "SLV", "VWO", "XLP",
+                           "XLI", "OIH", "LQD", "XLK", "VEA", "TLT", "IEFA", 
+                           "XLV", "EWJ", "GLD", "IYR", "BKLN", "EWH", "ASHR", 
+                           "XLB", "RSX", "JNK", "KRE", "XBI", "AGG", "VNQ", 
+                           "GOVT", "UNG", "IVV", "XLY", "EWT", "PFF", "XLRE", 
+                           "MCHI", "INDA", "BND", "USMV", "EZU", "SMH", "XRT", 
+                           "EWY", "IEF", "SPLV", "XLC", "IJR", "VIXY", "EWG", 
+                           "EWW", "VTI", "VGK", "IBB", "PGX", "VOO", "EMB", 
+                           "SCHF", "VEU", "SJNK", "EMLC", "XME", "DIA", "EWA", 
+                           "VCSH", "JPST", "MLPA", "VCIT", "ITB", "ACWI", "KWEB", 
+                           "EWC", "EWU", "BNDX", "SHY", "VT", "IWD", "VXUS", 
+                           "MBB", "ACWX", "XHB", "BSV", "SHV", "FEZ", "IWF", 
+                           "IGSB", "SPYV", "ITOT", "FPE", "FVD", "SHYG", "VYM", 
+                           "BBJP", "DGRO", "KBE", "VTV", "SPAB", "SPIB", "IWR", 
+                           "DBC", "BIL", "SPSB", "FLOT", "GLDM", "VIG", "XES", 
+                           "SCHE", "TIP", "PDBC", "SPYG", "MINT", "SCZ", "SPDW", 
+                           "PCY", "USHY", "IXUS", "NEAR", "EPI", "SPLG", "HYLB", 
+                           "AAXJ", "SPEM", "VMBS", "BIV", "QUAL", "ILF", "EWP",
+                           "TQQQ"]
+
+# US/Canada cell carriers dictionary
+CARRIERS = {
+    # US Carriers
+    "alltel"        : "@mms.alltelwireless.com",
+    "att"           : "@mms.att.net",
+    "boost"         : "@myboostmobile.com",
+    "cricket"       : "@mms.cricketwireless.net",
+    "p_fi"          : "msg.fi.google.com",
+    "sprint"        : "@pm.sprint.com",
+    "tmobile"       : "@tmomail.net",
+    "us_cellular"   : "@mms.uscc.net",
+    "verizon"       : "@vtext.com",
+    "virgin"        : "@vmpix.com",
+
+    # Canada Carriers
+    "bell"          : "@txt.bell.ca",
+    "chatr"         : "@fido.ca",
+    "fido"          : "@fido.ca",
+    "freedom"       : "@txt.freedommobile.ca",
+    "koodo"         : "@msg.koodomobile.com",
+    "public_mobile" : "@msg.telus.com",
+    "telus"         : "@msg.telus.com",
+    "rogers"        : "@pcs.rogers.com",
+    "sasktel"       : "@sms.sasktel.com",
+    "speakout"      : "@pcs.rogers.com",
+    "virgin_ca"     : "@vmobile.ca"
+}
+
+# TEXT MESSAGE SEPARATOR
+SEPARATOR = '-' * 60
+
+# SUBJECT MESSAGES
+STARTUP_MSG_SUBJECT     = "Email SMS Startup"
+WSB_MSG_SUBJECT         = "WSB Tickers"
+SHUTDOWN_MSG_SUBJECT    = "Email SMS Shutdown"
+MSG_SUBJECT             = "Email SMS Message"
+ERROR_MSG_SUBJECT       = "Email SMS Error"
+
+# SMS MESSAGES
+SMS_STARTUP             = "SMS is active! Waiting to send WSB Tickers!\n" + SEPARATOR 
+SMS_WSB_TICKERS         = "Here are the top 10 mentioned WSB Tickers!\n" + SEPARATOR
+SMS_CONFIRM             = "Command Received...Processing Request...\n" + SEPARATOR
+SMS_SHUTDOWN            = "SMS shutting down...\n" + SEPARATOR
+
+# ERROR MESSAGES
+SMS_ERROR_INVALID_CMD   = "ERROR: Invalid command entered.\n" + SEPARATOR
+SMS_ERROR_GENERAL       = "ERROR: An unknown error occured.\n" + SEPARATOR
+
+
+
+# Global variables that are expensive to compute (file reads or heavy imports) are only computed the first
+# time they are accessed (ex. globals.TICKER_DICT) and then stored as regular module variables.
+# (Inside this module, use __getattr__("NAME") since module __getattr__ is not used for bare name lookups)
+LAZY_GLOBALS = {
+    "TICKER_DICT"       : lambda: helper.get_all_stock_tickers(),                                   # Collects all available company stock tickers
+    "WORDS_TO_IGNORE"   : lambda: helper.get_words_to_ignore(),                                     # Read txt file containing words to ignore
+    "TRADING_CALENDAR"  : lambda: Trading_Calendar(market_open=MARKET_OPEN, market_close=MARKET_CLOSE,  # US stock market sessions (holidays, early closes,
+                                                   early_close=EARLY_CLOSE),                            # session directories) precomputed for a range of years
+    "TICKER_UNIVERSE"   : lambda: Ticker_Universe(__getattr__("TICKER_DICT"), ETFS_LIST,            # Hashed index of all stock tickers, ETF's, and words to ignore
+                                              __getattr__("WORDS_TO_IGNORE")),
+    "MONEY_SPINNER"     : lambda: Spinner(MONEY_SPINNER_FRAMES, 100),                               # Custom spinner design
+    "WSB_SPINNER"       : lambda: yaspin(spinner=__getattr__("MONEY_SPINNER"), color="white"),      # Progress spinner shared by the main and WSB threads
+}
+LAZY_GLOBALS_LOCK = threading.RLock()
+
+
+
+def __getattr__(name):
+    if name not in LAZY_GLOBALS:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    with LAZY_GLOBALS_LOCK:                             # Only compute the global variable once (WSB thread and main thread may race)
+        if name not in globals():
+            globals()[name] = LAZY_GLOBALS[name]()
+        return globals()[name]
@@ -0,0 +1,724 @@
+"""
+wsb_benchmark.py
+-----------------
+Contains benchmarks for the performance critical paths of the WSB sentiment program.
+
+    General Use:
+        python wsb_benchmark.py                         (Run all benchmarks)
+        python wsb_benchmark.py ticker_extraction       (Run a single benchmark)
+"""
+
+import io
+import json
+import random
+import argparse
+import statistics
+import tempfile
+import contextlib
+import subprocess
+import globals
+from imports import *
+from Ticker_Extractor import Ticker_Extractor
+from Comment_Buffer import get_sentiment_code
+from Comment_Store import Comment_Store
+from Comment_Archive import Comment_Archive
+from Comment_WAL import Comment_WAL
+from Trading_Calendar import Trading_Calendar
+from Sentiment_History import Sentiment_History
+from Sentiment_EMA import Sentiment_EMA
+from Market_Data import Market_Data
+from Short_Squeeze import Short_Squeeze
+from Sentiment_Aggregator import Sentiment_Aggregator
+from Top_Ticker_Tracker import Top_Ticker_Tracker
+from Comment_Source import Replay_Source, Http_Source
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+
+def legacy_find_mentioned_tickers(text):
+    # Original (multi-pass) implementation of WSB_Sentiment.find_mentioned_tickers() used as the golden reference
+    potential_ticker_list = [list(word) for upper, word in itertools.groupby(text.split(), key=str.isupper) if upper]
+    potential_ticker_list = [item for sublist in potential_ticker_list for item in sublist]
+    potential_ticker_list = [re.sub('[^a-zA-Z0-9]+','', ticker) for ticker in potential_ticker_list]
+    mentioned_tickers = [ticker for ticker in potential_ticker_list if ((ticker in globals.TICKER_DICT['Symbol'].values()) or \
+                                                                        (ticker in globals.ETFS_LIST)) and (ticker not in globals.WORDS_TO_IGNORE)]
+    return list(dict.fromkeys(mentioned_tickers))
+
+
+
+def generate_comment_corpus(num_comments, seed=0):
+    # Generate a repeatable corpus of WSB style comments (tickers, words to ignore, punctuation, mixed case, and unicode)
+    rng = random.Random(seed)
+    symbols = sorted(globals.TICKER_UNIVERSE.symbols)[:2000] + list(globals.ETFS_LIST)
+    ignored = list(globals.WORDS_TO_IGNORE)
+    words = ["the", "moon", "calls", "puts", "hold", "tendies", "buy", "sell", "YOLO", "I", "A", "IS", "ALL", "DD",
+             "rocket", "apes", "é", "ÉTÉ", "strong", "paper", "hands", "diamond", "GUH", "😂", "🚀🚀🚀", "-", "&"]
+    decorations = ["{}", "${}", "{}!", "{}?", "({})", "{}'s", "{}s", "{}.", "#{}", "{}🚀", "{},", "*{}*", "{}_{}"]
+
+    corpus = list()
+    for _ in range(num_comments):
+        tokens = list()
+        for _ in range(rng.randint(3, 40)):
+            pick = rng.random()
+            if pick < 0.10:
+                word = rng.choice(symbols)
+            elif pick < 0.15:
+                word = rng.choice(ignored)
+            else:
+                word = rng.choice(words)
+
+            if rng.random() < 0.3:
+                word = rng.choice(decorations).format(word, word)
+            if rng.random() < 0.05:
+                word = word.lower()
+
+            tokens.append(word)
+        corpus.append(rng.choice([" ", "  ", "\t"]).join(tokens))
+
+    return corpus
+
+
+
+def benchmark_ticker_extraction(num_comments=50000, num_golden=2000):
+    corpus = generate_comment_corpus(num_comments)
+    extractor = Ticker_Extractor(globals.TICKER_UNIVERSE)
+
+    # Run the legacy implementation on the golden corpus (legacy is too slow to run over the full corpus)
+    start = time.perf_counter()
+    golden = [legacy_find_mentioned_tickers(text) for text in corpus[:num_golden]]
+    legacy_rate = num_golden / (time.perf_counter() - start)
+
+    # Run the batch extractor over the full corpus
+    start = time.perf_counter()
+    results = extractor.find_mentioned_tickers_batch(corpus)
+    batch_rate = num_comments / (time.perf_counter() - start)
+
+    mismatches = sum(1 for expected, actual in zip(golden, results) if expected != actual)
+
+    print(f">>> Ticker Extraction: legacy {legacy_rate:,.0f} comments/sec | batch {batch_rate:,.0f} comments/sec | "
+          f"speedup {batch_rate/legacy_rate:,.1f}x | golden mismatches {mismatches}/{num_golden}")
+
+    return mismatches == 0
+
+
+
+def benchmark_startup(modules=('imports', 'globals', 'helper', 'Email_SMS', 'Short_Squeeze', 'WSB_Sentiment', 'wsb_main'), repeats=5):
+    # Measure import latency of each module in a fresh interpreter (and which heavy dependencies the import pulled in)
+    heavy_modules = ['pandas', 'yfinance', 'selenium', 'html2text', 'alive_progress', 'yaspin', 'holidays', 'urllib3']
+    script = ("import sys, time; start = time.perf_counter(); import {module}; elapsed = time.perf_counter() - start; "
+              f"print(elapsed, ','.join(m for m in {heavy_modules!r} if m in sys.modules))")
+
+    for module in modules:
+        timings, loaded = list(), ""
+        for _ in range(repeats):
+            output = subprocess.run([sys.executable, "-c", script.format(module=module)], capture_output=True, text=True,
+                                    cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip().splitlines()[-1]
+            elapsed, _, loaded = output.partition(' ')
+            timings.append(float(elapsed))
+
+        print(f">>> Import {module:<15} median {statistics.median(timings)*1000:8.1f} ms | heavy modules loaded: {loaded or 'none'}")
+
+    return True
+
+
+
+def generate_replay_file(path, num_comments, page_size=100, comments_per_snapshot=10, seed=0):
+    # Write a JSONL recording of "comment-area" snapshots (newest comments at the top of a scrolling page)
+    rng = random.Random(seed)
+    sentiments = ['bullish', '(bullish)', 'bearish', '(bearish)', 'none']
+    texts = generate_comment_corpus(num_comments, seed=seed)
+    page, timestamp = list(), time.time()
+
+    with open(path, 'w', encoding='utf-8') as file:
+        for i, text in enumerate(texts):
+            minute = (i // 60) % 1440
+            page.insert(0, f"{rng.choice(sentiments)} [{minute // 60:02d}:{minute % 60:02d}] user{rng.randint(0, 9999)} {text}")
+            del page[page_size:]
+
+            if (i + 1) % comments_per_snapshot == 0:
+                timestamp += 1.0
+                file.write(json.dumps({'timestamp': timestamp, 'comment_area': "\n".join(page)}) + "\n")
+
+    return path
+
+
+
+def benchmark_replay_pipeline(num_comments=20000):
+    # Run the full ingestion --> sentiment --> report pipeline from a replay recording (no browser or network)
+    import WSB_Sentiment as WSB
+
+    globals.TICKER_UNIVERSE                                     # Load stock tickers before leaving the program directory
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)                                      # Report files are written to the temporary directory
+        try:
+            replay_path = generate_replay_file(os.path.join(temp_dir, "replay.jsonl"), num_comments)
+            wsb = WSB.WSB_Sentiment(source=Replay_Source(replay_path), update_hour=24)
+
+            start = time.perf_counter()
+            wsb.get_wsb_comments()
+            elapsed = time.perf_counter() - start
+
+        finally:
+            os.chdir(cwd)
+
+    print(f">>> Replay Pipeline: {num_comments:,} comments ({wsb.comment_store.total_comments:,} stored) in {elapsed:.2f} sec | "
+          f"{num_comments/elapsed:,.0f} comments/sec")
+
+    return True
+
+
+
+def generate_feed_pages(num_comments, page_size=100, comments_per_page=5, seed=0):
+    # Return [(page text, new lines)] of a scrolling "comment-area" page (newest comments at the top) w/ repeated lines:
+    # multi-line comments w/ identical continuation lines and the same one-word reply posted again by the same author in the same minute
+    rng = random.Random(seed)
+    continuations = ["to the moon", "🚀🚀🚀", "not financial advice", "🚀🚀🚀"]
+    page, new_lines, pages = list(), list(), list()
+
+    for i in range(num_comments):
+        minute = (i // 60) % 1440
+        if rng.random() < 0.1:
+            comment = [f"bullish [{minute // 60:02d}:{minute % 60:02d}] user1 🚀🚀🚀"]
+        else:
+            comment = [f"{rng.choice(['bullish', 'bearish', 'none'])} [{minute // 60:02d}:{minute % 60:02d}] user{rng.randint(0, 99)} GME {i % 7}"]
+            comment += [rng.choice(continuations) for _ in range(rng.choice([0, 0, 1, 2]))]
+
+        page[:0] = comment
+        new_lines[:0] = comment
+        del page[page_size:]
+
+        if (i + 1) % comments_per_page == 0:
+            pages.append(("\n".join(page), new_lines[:page_size]))
+            new_lines = list()
+
+    return pages
+
+
+
+def benchmark_comment_feed(num_comments=20000):
+    # Check new lines found by the comment feed against the lines actually posted, and time it against the original page diff
+    from Comment_Feed import Comment_Feed
+
+    pages = generate_feed_pages(num_comments)
+
+    # Original diff (set of the previous page rebuilt for every line, repeated lines are dropped while a copy is on the previous page)
+    start, old_comments, legacy_missed = time.perf_counter(), list(), 0
+    for page_text, expected in pages:
+        new_comments = page_text.splitlines()
+        updated_comments = [comment for comment in new_comments if comment not in set(old_comments)]
+        legacy_missed += len(expected) - len(updated_comments)
+        old_comments = new_comments
+    legacy_elapsed = time.perf_counter() - start
+
+    comment_feed = Comment_Feed()
+    start, mismatches = time.perf_counter(), 0
+    for page_text, expected in pages:
+        mismatches += comment_feed.get_new_lines(page_text) != expected
+    elapsed = time.perf_counter() - start
+
+    # Re-rendered page (same comments in a different order) has no new lines
+    comments = re.split(r"\n(?=(?:bullish|bearish|none) )", pages[-1][0])
+    mismatches += comment_feed.get_new_lines("\n".join(reversed(comments))) != []
+
+    print(f">>> Comment Feed: {len(pages):,} pages | original diff {legacy_elapsed*1e3:.1f} ms ({legacy_missed:,} repeated lines missed) | "
+          f"comment feed {elapsed*1e3:.1f} ms | mismatches {mismatches}/{len(pages) + 1}")
+
+    return mismatches == 0
+
+
+
+def legacy_build_ticker_sentiment_df(wsb_sentiment_df):
+    # Original (loop per ticker) implementation of the ticker sentiment table in WSB_Sentiment.sentiment_analysis() used as the golden reference
+    wsb_sentiment_df = wsb_sentiment_df[wsb_sentiment_df['Sentiment'].isin(['bullish', '(bullish)', 'bearish', '(bearish)'])]
+    mentioned_tickers = list(filter(None, wsb_sentiment_df['Ticker'].unique().tolist()))
+
+    rows = list()
+    for ticker in mentioned_tickers:
+        ticker_value_counts = wsb_sentiment_df[wsb_sentiment_df['Ticker'].isin([ticker])]['Sentiment'].value_counts()
+        ticker_bull_count = ticker_value_counts.get('bullish', 0) + ticker_value_counts.get('(bullish)', 0)
+        ticker_bear_count = max(ticker_value_counts.get('bearish', 0) + ticker_value_counts.get('(bearish)', 0), 1)
+        rows.append({'Ticker': ticker, 'Bullish Count': ticker_bull_count, 'Bearish Count': ticker_bear_count, 'Bull/Bear Ratio': ticker_bull_count/ticker_bear_count})
+
+    ticker_sentiment_df = pd.DataFrame(rows, columns=['Ticker', 'Bullish Count', 'Bearish Count', 'Bull/Bear Ratio'])
+    return ticker_sentiment_df.sort_values(by=['Bullish Count', 'Bearish Count'], ascending=False, kind='stable').set_index('Ticker')
+
+
+
+def generate_comment_df(num_rows, num_tickers, seed=0):
+    # Generate a repeatable WSB comment dataframe (Zipf-like ticker popularity, ~20% rows w/o a ticker, ~10% "none" sentiment)
+    rng = np.random.default_rng(seed)
+    tickers = np.array([f"T{i:04d}" for i in range(num_tickers)] + [None], dtype=object)
+    weights = 1.0 / np.arange(1, num_tickers + 1)
+    weights = np.append(weights / weights.sum() * 0.8, 0.2)
+    sentiments = np.array(['bullish', '(bullish)', 'bearish', '(bearish)', 'none'], dtype=object)
+
+    return pd.DataFrame({'Time'      : '12:00',
+                         'Sentiment' : sentiments[rng.choice(5, num_rows, p=[0.35, 0.1, 0.35, 0.1, 0.1])],
+                         'Ticker'    : tickers[rng.choice(num_tickers + 1, num_rows, p=weights)],
+                         'Text'      : ''})
+
+
+
+def benchmark_ticker_sentiment_rebuild(sizes=((100000, 500), (1000000, 5000), (10000000, 5000)), num_golden=(200000, 1000)):
+    # Check the vectorized rebuild against the original loop per ticker, then time it at increasing comment row / ticker counts
+    golden_df = generate_comment_df(*num_golden)
+    start = time.perf_counter()
+    legacy_df = legacy_build_ticker_sentiment_df(golden_df)
+    legacy_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    rebuilt_df = Sentiment_Aggregator.build_ticker_sentiment_df(golden_df)
+    rebuilt_elapsed = time.perf_counter() - start
+
+    matches = legacy_df.astype(float).equals(rebuilt_df.astype(float))
+    print(f">>> Ticker Sentiment Rebuild: golden check ({num_golden[0]:,} rows / {num_golden[1]:,} tickers) {'OK' if matches else 'MISMATCH'} | "
+          f"loop per ticker {legacy_elapsed:.2f} sec | vectorized {rebuilt_elapsed:.3f} sec")
+
+    for num_rows, num_tickers in sizes:
+        wsb_sentiment_df = generate_comment_df(num_rows, num_tickers)
+
+        # Object strings (ex. archived wsb_comments excel file) vs. categorical codes (Comment_Buffer dataframes)
+        for encoding in ('object', 'category'):
+            if encoding == 'category':
+                wsb_sentiment_df = wsb_sentiment_df.astype({'Sentiment': 'category', 'Ticker': 'category'})
+            memory_mb = wsb_sentiment_df[['Sentiment', 'Ticker']].memory_usage(deep=True).sum() / (1024 * 1024)
+
+            start = time.perf_counter()
+            ticker_sentiment_df = Sentiment_Aggregator.build_ticker_sentiment_df(wsb_sentiment_df)
+            elapsed = time.perf_counter() - start
+            print(f">>> Ticker Sentiment Rebuild: {num_rows:,} rows / {len(ticker_sentiment_df):,} tickers ({encoding}, {memory_mb:,.0f} MB) in {elapsed:.2f} sec | "
+                  f"{num_rows/elapsed:,.0f} rows/sec")
+
+        del wsb_sentiment_df
+
+    return matches
+
+
+
+def benchmark_top_tickers(num_mentions=500000, num_tickers=5000, k=100, n=25):
+    # Check the streaming top k rankings against a full sort of exact counts (exact and count-min sketch modes)
+    wsb_sentiment_df = generate_comment_df(num_mentions, num_tickers).dropna()
+    sentiment_codes = wsb_sentiment_df['Sentiment'].map(get_sentiment_code).tolist()
+    tickers = wsb_sentiment_df['Ticker'].tolist()
+    ticker_sentiment_df = Sentiment_Aggregator.build_ticker_sentiment_df(wsb_sentiment_df, clamp=False)
+
+    matches = True
+    for sketch in (False, True):
+        tracker = Top_Ticker_Tracker(k=k, sketch=sketch)
+        start = time.perf_counter()
+        for sentiment_code, ticker in zip(sentiment_codes, tickers):
+            tracker.add(sentiment_code, [ticker])
+        elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        top_df = tracker.get_top_df('Bullish', n)
+        query_elapsed = time.perf_counter() - start
+
+        match = top_df.index.tolist() == ticker_sentiment_df.index[:n].tolist()
+        matches = matches and match
+        print(f">>> Top Tickers ({'count-min sketch' if sketch else 'exact'}): {len(tickers):,} mentions in {elapsed:.2f} sec | "
+              f"{elapsed/len(tickers)*1e6:.1f} us/mention | top {n} query {query_elapsed*1e3:.2f} ms | {'OK' if match else 'MISMATCH'}")
+
+    return matches
+
+
+
+def benchmark_comment_archive(num_flushes=20, comments_per_flush=500):
+    # Compare flushing comments w/ the old wsb_comments excel read-modify-write vs. appending segments to the comment archive
+    texts = generate_comment_corpus(num_flushes * comments_per_flush)
+    extractor = Ticker_Extractor(globals.TICKER_UNIVERSE)
+    comment_store = Comment_Store()
+
+    with tempfile.TemporaryDirectory() as dir_path:
+        comment_archive = Comment_Archive(dir_path, file_format=Comment_Archive.get_supported_format())
+        excel_path = os.path.join(dir_path, 'wsb_comments.xlsx')
+        excel_elapsed, archive_elapsed = 0.0, 0.0
+
+        for flush in range(num_flushes):
+            start = comment_store.total_comments
+            for i, text in enumerate(texts[flush * comments_per_flush:(flush + 1) * comments_per_flush]):
+                comment_store.append(f"{(i // 60) % 24:02d}:{i % 60:02d}", (i % 4) + 1, f"user{i}", extractor.find_mentioned_tickers(text), text)
+
+            timer = time.perf_counter()
+            df = comment_store.to_df(start=start).reset_index(drop=True)
+            if os.path.exists(excel_path):
+                df = pd.concat([pd.read_excel(excel_path, index_col=0, engine='openpyxl'), df], ignore_index=True)
+            df.to_excel(excel_path)
+            excel_elapsed += time.perf_counter() - timer
+
+            timer = time.perf_counter()
+            for partition, comments_df, mentions_df in comment_store.get_partition_tables(start=start):
+                comment_archive.append(comments_df, mentions_df)
+            archive_elapsed += time.perf_counter() - timer
+
+        timer = time.perf_counter()
+        ticker_df = comment_archive.to_df(columns=['Sentiment', 'Ticker'])
+        read_elapsed = time.perf_counter() - timer
+        timer = time.perf_counter()
+        comment_archive.compact()
+        compact_elapsed = time.perf_counter() - timer
+
+        match = len(ticker_df) == len(pd.read_excel(excel_path, index_col=0, engine='openpyxl')) and len(comment_archive) == comment_store.total_comments
+
+    print(f">>> Comment Archive: {num_flushes} flushes of {comments_per_flush} comments | excel rewrite {excel_elapsed:.2f} sec | "
+          f"archive append {archive_elapsed:.2f} sec ({excel_elapsed/archive_elapsed:.0f}x) | Sentiment/Ticker read {read_elapsed*1e3:.1f} ms | "
+          f"compact {compact_elapsed*1e3:.1f} ms | {'OK' if match else 'MISMATCH'}")
+
+    return match
+
+
+
+def benchmark_sentiment_history(num_sessions=30, num_tickers=500, num_comments=100000):
+    # Compare a "ticker sentiment over the last n sessions" lookup from session excel files vs. the SQLite history (+ batched comment inserts)
+    with tempfile.TemporaryDirectory() as data_dir:
+        for session in range(num_sessions):
+            session_date = (dt.date(2021, 1, 4) + dt.timedelta(days=session)).strftime("%Y-%m-%d")
+            ticker_sentiment_df = Sentiment_Aggregator.build_ticker_sentiment_df(generate_comment_df(num_tickers * 20, num_tickers, seed=session))
+            os.makedirs(f'{data_dir}/wsb_sentiment_{session_date}_{session_date}')
+            ticker_sentiment_df.to_excel(f'{data_dir}/wsb_sentiment_{session_date}_{session_date}/ticker_sentiment_all.xlsx')
+        ticker = ticker_sentiment_df.index[0]
+
+        start = time.perf_counter()
+        excel_history = list()
+        for dir_path in sorted(os.listdir(data_dir))[-num_sessions:]:
+            df = pd.read_excel(f'{data_dir}/{dir_path}/ticker_sentiment_all.xlsx', index_col=0, engine='openpyxl')
+            if ticker in df.index:
+                excel_history.append(df.loc[ticker, 'Bull/Bear Ratio'])
+        excel_elapsed = time.perf_counter() - start
+
+        sentiment_history = Sentiment_History(os.path.join(data_dir, 'wsb_history.db'))
+        sentiment_history.import_excel_sessions(data_dir)
+        start = time.perf_counter()
+        history_df = sentiment_history.get_ticker_history(ticker, num_sessions)
+        history_elapsed = time.perf_counter() - start
+
+        comment_store = Comment_Store()
+        for i, text in enumerate(generate_comment_corpus(num_comments)):
+            comment_store.append(f"{(i // 60) % 24:02d}:{i % 60:02d}", (i % 4) + 1, f"user{i}", [], text)
+        comments_df, mentions_df = comment_store.get_tables()
+        start = time.perf_counter()
+        sentiment_history.add_comments('wsb_sentiment_benchmark', comments_df, mentions_df)
+        insert_elapsed = time.perf_counter() - start
+        sentiment_history.close()
+
+    match = np.allclose(history_df['Bull/Bear Ratio'].values, excel_history)
+    print(f">>> Sentiment History: {ticker} over {num_sessions} sessions | excel files {excel_elapsed*1e3:.0f} ms | SQLite {history_elapsed*1e3:.2f} ms "
+          f"({excel_elapsed/history_elapsed:,.0f}x) | {num_comments:,} comment insert {insert_elapsed:.2f} sec | {'OK' if match else 'MISMATCH'}")
+
+    return match
+
+
+
+def benchmark_comment_wal(num_comments=20000, fsync_batches=(1, 32, 256)):
+    # Compare write-ahead log append throughput for fsync per record vs. group commit, and time a full replay
+    texts = generate_comment_corpus(num_comments)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for fsync_batch in fsync_batches:
+            comment_wal = Comment_WAL(os.path.join(temp_dir, f"wal_{fsync_batch}"), fsync_interval=1.0, fsync_batch=fsync_batch)
+            start = time.perf_counter()
+            for i, text in enumerate(texts):
+                comment_wal.append('wsb_sentiment_benchmark', 'bullish', f"{(i // 60) % 24:02d}:{i % 60:02d}", f"user{i}", text, time.time())
+            comment_wal.close()
+            elapsed = time.perf_counter() - start
+            print(f">>> Comment WAL (fsync every {fsync_batch} records): {num_comments:,} appends in {elapsed:.2f} sec | "
+                  f"{num_comments/elapsed:,.0f} comments/sec | {comment_wal.syncs} fsyncs")
+
+        start = time.perf_counter()
+        replayed = sum(1 for _ in comment_wal.replay())
+        elapsed = time.perf_counter() - start
+
+    print(f">>> Comment WAL Replay: {replayed:,} comments in {elapsed*1e3:.0f} ms | {'OK' if replayed == num_comments else 'MISMATCH'}")
+
+    return replayed == num_comments
+
+
+
+def benchmark_wal_recovery(num_comments=5000):
+    # Crash between the comment archive write and the WAL checkpoint, then check the restarted collector does not count comments twice
+    import WSB_Sentiment as WSB
+    from Comment_Source import Selenium_Source
+
+    texts = generate_comment_corpus(num_comments)
+    session = globals.TRADING_CALENDAR.get_session()['Session']     # Current trading session (its archived counts are loaded on restart)
+    with tempfile.TemporaryDirectory() as temp_dir, contextlib.redirect_stdout(io.StringIO()):
+        wsb = WSB.WSB_Sentiment(source=Selenium_Source(), data_dir=temp_dir)
+        wsb.comment_wal.checkpoint = lambda segments: None      # Process killed after the archive write (WAL segments are not removed)
+        for i, text in enumerate(texts):
+            wsb.ingest_comment(['bullish', 'bearish', '(bullish)', '(bearish)'][i % 4], f"{(i // 60) % 24:02d}:{i % 60:02d}", f"user{i}", text, session)
+            if i == num_comments // 2:
+                wsb.flush_comments()                            # First half archived, second half only in the WAL
+                wsb.persistence_worker.drain()
+        wsb.comment_wal.sync()
+        expected = (wsb.sentiment_aggregator.get_counts(), wsb.get_all_ticker_sentiment_df())
+
+        start = time.perf_counter()
+        restarted = WSB.WSB_Sentiment(source=Selenium_Source(), data_dir=temp_dir)
+        elapsed = time.perf_counter() - start
+        recovered = (restarted.sentiment_aggregator.get_counts(), restarted.get_all_ticker_sentiment_df())
+
+    match = expected[0] == recovered[0] and expected[1].sort_index().equals(recovered[1].sort_index())     # (Tickers w/ equal counts may be listed in any order)
+    print(f">>> WAL Recovery: {num_comments:,} comments (crash before checkpoint) restarted in {elapsed:.2f} sec | "
+          f"counts {expected[0]} --> {recovered[0]} | {'OK' if match else 'MISMATCH'}")
+
+    return match
+
+
+
+def benchmark_persistence_worker(num_comments=50000):
+    # Time how long sentiment_analysis() holds up the WSB comment thread when disk writes are handed to the persistence worker
+    import WSB_Sentiment as WSB
+
+    globals.TICKER_UNIVERSE                                     # Load stock tickers before leaving the program directory
+    texts = generate_comment_corpus(num_comments)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)                                      # Report files are written to the temporary directory
+        try:
+            wsb = WSB.WSB_Sentiment(source=Replay_Source(os.path.join(temp_dir, "replay.jsonl")))
+            for i, text in enumerate(texts):
+                wsb.ingest_comment(['bullish', 'bearish', '(bullish)', '(bearish)'][i % 4], f"{(i // 60) % 24:02d}:{i % 60:02d}", f"user{i}", text, 'wsb_sentiment_benchmark')
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                wsb.sentiment_analysis()
+                stall_elapsed = time.perf_counter() - start
+                wsb.persistence_worker.drain()
+                write_elapsed = time.perf_counter() - start
+
+        finally:
+            os.chdir(cwd)
+
+    stats = wsb.get_persistence_stats()
+    print(f">>> Persistence Worker: {num_comments:,} comments | comment thread blocked {stall_elapsed*1e3:.0f} ms | "
+          f"background writes {write_elapsed:.2f} sec (max write latency {stats['Max Latency MS']} ms) | {stats['Tasks Failed']} failed")
+
+    return stats['Tasks Failed'] == 0
+
+
+
+def benchmark_trading_calendar(start_year=2016, end_year=2025, step_minutes=5):
+    # Resolve the trading session of every timestamp (step_minutes apart) over a multi-year backfill range
+    start = time.perf_counter()
+    trading_calendar = Trading_Calendar(start_year, end_year + 1)
+    build_elapsed = time.perf_counter() - start
+
+    timestamps = [dt.datetime(start_year, 1, 4) + dt.timedelta(minutes=step_minutes * i)
+                  for i in range(int((dt.datetime(end_year, 12, 31) - dt.datetime(start_year, 1, 4)).total_seconds() // (60 * step_minutes)))]
+    start = time.perf_counter()
+    sessions = [trading_calendar.get_session(timestamp)['Session'] for timestamp in timestamps]
+    lookup_elapsed = time.perf_counter() - start
+
+    num_sessions = len(trading_calendar.get_sessions(dt.date(start_year, 1, 1), dt.date(end_year, 12, 31)))
+    match = len(set(sessions)) == num_sessions
+    print(f">>> Trading Calendar: {end_year - start_year + 1} years ({num_sessions:,} sessions) built in {build_elapsed*1e3:.0f} ms | "
+          f"{len(timestamps):,} lookups in {lookup_elapsed:.2f} sec ({lookup_elapsed/len(timestamps)*1e6:.2f} us/lookup) | {'OK' if match else 'MISMATCH'}")
+
+    return match
+
+
+
+def benchmark_sentiment_ema(num_sessions=2500, spans=(5, 10, 20)):
+    # Compare the daily EMA update (stored EMA state) vs. recomputing ewm() over the whole daily bull/bear ratio history
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sentiment_history = Sentiment_History(os.path.join(temp_dir, 'wsb_history.db'))
+        sessions = Trading_Calendar(2010, 2021).get_sessions(dt.date(2011, 1, 1), dt.date(2020, 12, 31))[:num_sessions]
+        ratios = np.random.default_rng(0).uniform(0.5, 2.0, len(sessions))
+        for session, ratio in zip(sessions[:-1], ratios):
+            sentiment_history.write_session_sentiment(session['Session'], int(ratio * 1000), 1000)
+        sentiment_ema = Sentiment_EMA(sentiment_history, spans)
+        sentiment_ema.load()                                    # (One time EMA state initialization from the history)
+
+        session, date = sessions[-1]['Session'], sentiment_history.get_session_date(sessions[-1]['Session'])
+        sentiment_history.write_session_sentiment(session, int(ratios[-1] * 1000), 1000)
+
+        start = time.perf_counter()
+        sessions_df = sentiment_history.get_session_sentiment_df()
+        full_emas = {span: sessions_df['Bull/Bear Ratio'].ewm(span=span, adjust=False).mean().iloc[-1] for span in spans}
+        full_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        emas = sentiment_ema.update(date, int(ratios[-1] * 1000) / 1000)
+        update_elapsed = time.perf_counter() - start
+        match = all(np.isclose(emas[span], full_emas[span]) for span in spans) and sentiment_ema.update(date, int(ratios[-1] * 1000) / 1000) == emas
+        sentiment_history.close()
+
+    print(f">>> Sentiment EMA: {len(sessions):,} sessions, spans {spans} | full recompute {full_elapsed*1e3:.1f} ms | "
+          f"incremental update {update_elapsed*1e3:.2f} ms | {'OK' if match else 'MISMATCH'}")
+
+    return match
+
+
+
+def benchmark_open_prices(num_tickers=25, num_unlisted=3, round_trip=0.2):
+    # Compare one request per ticker (previous get_top_tickers loop) vs. one batched request w/ concurrent per-ticker fallback
+    # (Yahoo finance is replaced by a stand-in w/ a fixed round trip time, "num_unlisted" tickers are missing from the batched request)
+    tickers = [f"T{i:03d}" for i in range(num_tickers)]
+    prices = {ticker: 10.0 + i for i, ticker in enumerate(tickers)}
+    unlisted = set(tickers[:num_unlisted])
+
+    def simulated_download(tickers, period='1d', **kwargs):
+        time.sleep(round_trip)                                  # One round trip for every ticker
+        listed = [ticker for ticker in tickers if ticker not in unlisted]
+        columns = pd.MultiIndex.from_product([listed, ['Open', 'Close']])
+        return pd.DataFrame([[prices[ticker] for ticker in listed for _ in range(2)]], columns=columns)
+
+    class Simulated_Ticker():
+        def __init__(self, ticker):
+            self.ticker = ticker
+
+        @property
+        def info(self):
+            time.sleep(round_trip)                              # One round trip per ticker
+            return {'open': prices[self.ticker]}
+
+    yf.download, yf.Ticker = simulated_download, Simulated_Ticker       # (Stand-in for the Yahoo finance requests of Market_Data)
+    try:
+        Market_Data().get_open_prices(tickers[num_unlisted:])  # (Warm up pandas before timing)
+
+        market_data = Market_Data(max_workers=8)                # (Separate instances, per ticker responses are cached)
+        start = time.perf_counter()
+        serial_prices = {ticker: Market_Data().get_open_price(ticker) for ticker in tickers}
+        serial_elapsed = time.perf_counter() - start
+
+        open_prices = market_data.get_open_prices(tickers)
+        fetch = market_data.get_last_fetch()
+
+    finally:
+        del yf.download, yf.Ticker
+
+    match = open_prices == serial_prices == prices and fetch['Batched'] == num_tickers - num_unlisted
+
+    print(f">>> Open Prices: {num_tickers} tickers ({num_unlisted} per ticker fallback), {round_trip*1e3:.0f} ms round trip | "
+          f"per ticker {serial_elapsed:.2f} sec | batched {fetch['Total Seconds']:.2f} sec "
+          f"(batch {fetch['Batch Seconds']:.2f} sec) | {'OK' if match else 'MISMATCH'}")
+
+    return match
+
+
+
+def benchmark_market_data_cache(num_tickers=25, round_trip=0.02):
+    # Count Yahoo finance requests of the short squeeze analysis w/ the cached market data vs. w/o caching (ttl=0, one request per lookup)
+    # (Yahoo finance is replaced by a stand-in w/ a fixed round trip time)
+    rng = np.random.default_rng(0)
+    tickers = [f"T{i:03d}" for i in range(num_tickers)]
+    dates = pd.bdate_range(end=dt.date.today(), periods=22)
+    histories = {ticker: pd.DataFrame({'Close': rng.uniform(10, 20, 22).cumsum(), 'Volume': rng.integers(1e5, 1e6, 22)}, index=dates) for ticker in tickers}
+    infos = {ticker: {'previousClose': histories[ticker]['Close'].iloc[-2] * 0.9, 'averageVolume': 3e5, 'fiftyTwoWeekLow': 10.0,
+                      'shortPercentOfFloat': float(rng.uniform(0, 30)), 'beta': float(rng.uniform(-2, 2))} for ticker in tickers}
+
+    class Simulated_Market_Data(Market_Data):
+        def request_history(self, ticker, period='1mo'):
+            time.sleep(round_trip)
+            return histories[ticker]
+
+        def request_info(self, ticker):
+            time.sleep(round_trip)
+            return infos[ticker]
+
+    def analyze(market_data):
+        # Same market data lookups as Short_Squeeze.analyze_tickers() (w/o the top 25 excel file and progress bar)
+        short_squeeze = Short_Squeeze(market_data=market_data)
+        start = time.perf_counter()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=25) as executor:
+            rows = list(executor.map(short_squeeze.get_ticker_data, tickers))
+        rows = [row for row in rows if row['Percent Change'] >= 5 or (row['Percent Change'] > 0 and short_squeeze.is_price_uptrend(row['Ticker']))]
+        short_squeeze.short_squeeze_df = pd.DataFrame(rows).set_index('Ticker')
+        short_squeeze.check_watchlist()
+        return short_squeeze.get_watchlist(), time.perf_counter() - start, market_data.get_cache_stats()
+
+    uncached_df, uncached_elapsed, uncached_stats = analyze(Simulated_Market_Data(ttl=0))
+    cached_df, cached_elapsed, cached_stats = analyze(Simulated_Market_Data())
+    match = cached_df.equals(uncached_df) and cached_stats['Misses'] == 2 * num_tickers
+
+    print(f">>> Market Data Cache: {num_tickers} tickers ({len(cached_df)} on watchlist), {round_trip*1e3:.0f} ms round trip | "
+          f"uncached {uncached_stats['Misses']} requests in {uncached_elapsed:.2f} sec | cached {cached_stats['Misses']} requests in {cached_elapsed:.2f} sec "
+          f"({cached_stats['Hits']} hits, {cached_stats['Coalesced']} coalesced) | {'OK' if match else 'MISMATCH'}")
+
+    return match
+
+
+
+def start_comment_feed_server(num_comments=10000, page_size=100, comments_per_request=10):
+    # Start a local stand-in for the JSON comment feed (each request scrolls the feed forward by "comments_per_request")
+    texts = generate_comment_corpus(num_comments)
+    comments = [{'sentiment': ['bullish', 'bearish', '(bullish)', '(bearish)'][i % 4], 'time': f"{(i // 60) % 24:02d}:{i % 60:02d}",
+                 'author': f"user{i}", 'text': text} for i, text in enumerate(texts)]
+    position = {'Index': 0}
+
+    class Comment_Feed_Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"                           # Keep-alive connections
+
+        def setup(self):
+            super().setup()
+            self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)     # Send headers and body without waiting on delayed ACKs
+
+        def do_GET(self):
+            position['Index'] = min(position['Index'] + comments_per_request, len(comments))
+            body = json.dumps({'comments': comments[max(position['Index'] - page_size, 0):position['Index']][::-1]}).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Comment_Feed_Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+
+def benchmark_http_source(num_reads=500):
+    # Poll a local stand-in comment feed w/ the asyncio HTTP source (keep-alive connection reuse, no browser)
+    server = start_comment_feed_server()
+    source = Http_Source([f"http://127.0.0.1:{server.server_address[1]}/comments"])
+    source.open()
+
+    try:
+        start = time.perf_counter()
+        lines = sum(len(source.read().splitlines()) for _ in range(num_reads))
+        elapsed = time.perf_counter() - start
+        connections, requests = source.client.connections_opened, source.client.requests_sent
+
+    finally:
+        source.close()
+        server.shutdown()
+
+    print(f">>> HTTP Source: {num_reads} reads ({lines:,} lines) in {elapsed:.2f} sec | {num_reads/elapsed:,.0f} reads/sec | "
+          f"{connections} connection(s) opened for {requests} requests")
+
+    return True
+
+
+
+BENCHMARKS = {'ticker_extraction' : benchmark_ticker_extraction,
+              'startup'           : benchmark_startup,
+              'replay_pipeline'   : benchmark_replay_pipeline,
+              'comment_feed'      : benchmark_comment_feed,
+              'http_source'       : benchmark_http_source,
+              'ticker_sentiment'  : benchmark_ticker_sentiment_rebuild,
+              'top_tickers'       : benchmark_top_tickers,
+              'comment_archive'   : benchmark_comment_archive,
+              'sentiment_history' : benchmark_sentiment_history,
+              'comment_wal'       : benchmark_comment_wal,
+              'wal_recovery'      : benchmark_wal_recovery,
+              'persistence'       : benchmark_persistence_worker,
+              'trading_calendar'  : benchmark_trading_calendar,
+              'sentiment_ema'     : benchmark_sentiment_ema,
+              'open_prices'       : benchmark_open_prices,
+              'market_data_cache' : benchmark_market_data_cache}
+
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="WSB Sentiment benchmarks")
+    parser.add_argument('benchmarks', nargs='*', help=f"Benchmarks to run {list(BENCHMARKS.keys())} (default: all)")
+    args = parser.parse_args()
+
+    for name in (args.benchmarks or BENCHMARKS.keys()):
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark '{name}'")
+        BENCHMARKS[name]()
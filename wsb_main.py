@@ -1,129 +1,168 @@
-"""
-    WSB_Sentiment v2.0:
-        Uses website "https://stocks.comment.ai/" to gather sentiment data from WSB. Stores any ticker mentions
-        in a pandas dataframe and includes number of mentions to determine if a stock should be bought or sold.
-
-    v2.0 Update:
-        We use a Thread to collect WSB sentiment data. This lets us collect sentiment data continuously so we can get
-        accurate data in  real time.
-"""
-"""
-    Momentum Trading off Sentiment from r/wallstreetbets
------------------------------------------------------------
-    Idea Referenced From: https://medium.com/@mjysong/momentum-trading-off-sentiment-from-r-wallstreetbets-149c19c7538d
-
-    General Use:
-        1.) During closed market hours, the script will collect comments from Reddit's WSB subreddit. All comments are 
-            collected from "https://stocks.comment.ai/" which already categorizes each comment as "bullish" or "bearish".
-        
-        2.) When the market opens, the script will determine an overall sentiment score and collect the top 25 mentioned 
-            tickers from the collected comments. The script will then collect an open price for each stock ticker.
-        
-        3.) The script will then determine a 10-day EMA via the overall sentiment score. If the current day's EMA is above
-            the 10-day EMA sentiment score, we will signal a "BUY". If/When the current day's EMA is below the 10-day EMA
-            sentiment score, we will signal a "SELL". Otherwise a "HOLD" signal will be given.
-        
-        4.) During weekends, the script will only collect WSB comments and any tickers that may be mentioned.
-"""
-
-import WSB_Sentiment as WSB
-import Short_Squeeze as SHORT
-import Email_SMS as SMS
-import globals
-from helper import *
-from imports import *
-
-
-
-if __name__ == '__main__':
-    program_title()                         # Pretty title for program
-
-    wsb = WSB.WSB_Sentiment(update_hour=1)  # Setup WSB sentiment analysis class
-    short_squeeze = SHORT.Short_Squeeze()   # Setup short squeeze analysis class
-    email_sms = SMS.Email_SMS(delete=True,  # Setup email_sms class for sending market updates via text
-                              logger=False)
-   
-    # If no stock tickers were collected from the csv files, exit the program 
-    # (We do this because we need stock tickers to compare against mentioned tickers from WSB comments)
-    if globals.TICKER_DICT is None:
-        print(">>> No stock tickers collected!. . . Cannot perform analysis without a list of NASDAQ, NYSE, or AMEX tickers. . .")
-        print(">>> Exiting WSB Sentiment Program. . .")
-        sys.exit(0)                                         # Exit WSB program
-
-    wsb.run()                                               # Run WSB sentiment analysis on separate thread
-
-    # Main loop forever. . .
-    while True:
-        try:
-            # If Weekday (Mon-Fri) and not a Market Closure Holiday or Early Market Close time is provided
-            if (is_weekday()[0] and not is_market_holiday()) or (globals.MARKET_CLOSE != dt.datetime.strptime('01:00PM', '%I:%M%p').time()):
-                
-                if globals.IS_WEEKEND:                                      # If recently changed to weekday
-                    globals.IS_WEEKEND = False
-
-                # (--- Stock Market is Closed ---)
-                if dt.datetime.now().time() >= globals.MARKET_CLOSE or dt.datetime.now().time() < globals.MARKET_OPEN:      
-                   
-                    if globals.IS_MARKET_OPEN:                              # If the market just closed
-                        with globals.WSB_SPINNER.hidden():
-                            print(">>>")
-                            print(">>> $$$ US Stock Market Closed $$$")
-                            wsb.get_close_price_and_percent_chng()          # Get close price and calculate percent change from open price
-                            wsb.determine_potential_profits()               # Determine potential end-of-day profits and losses
-                            globals.IS_MARKET_OPEN = False                  # Set market open flag to false (market closed)
-
-               # ( --- Stock Market is Open --- )
-                else:
-                    if not globals.IS_MARKET_OPEN:                          # If the market just opened
-                        with globals.WSB_SPINNER.hidden():
-                            print(">>>")
-                            print(">>> $$$ US Stock Market Open $$$") 
-                            wsb.get_top_tickers()                           # Determine top 25 bullish/bearish tickers and get their open prices
-
-                            short_squeeze.analyze_tickers()                 # Determine if any of the top 25 bullish/bearish tickers have a short squeeze
-                        
-                            ema = wsb.calc_ema()                            # Calculate 10 day EMA for daily bull/bear ratio
-                    
-                            if wsb.get_overall_sentiment() > ema:           # Set 'BUY' signal if bull/bear ratio above its 10 day EMA
-                                print(">>> BUY SIGNAL SET. . .")
-                                                
-                            elif wsb.get_overall_sentiment() < ema:         # Set 'SELL' signal if bull/bear ratio below its 10 day EMA
-                                print(">>> SELL SIGNAL SET. . .")
-
-                            else:                                           # Set 'HOLD' signal if bull/bear ratio equal to its 10 day EMA
-                                print(">>> HOLD SIGNAL SET. . .")
-
-                            # Send SMS message with top 10 WSB tickers
-                            email_sms.sms_send_top_tickers(wsb.get_top_ticker_sentiment_df())
-
-                            globals.IS_MARKET_OPEN = True                   # Set market open flag to true (market open)
-                                                        
-            # Else Weekend (Sat-Sun) or Market Holiday
-            else:
-                if not globals.IS_WEEKEND:
-                    with globals.WSB_SPINNER.hidden():
-                        print(">>> US Stock Market Closed for Weekend and/or Holiday. . .")
-                        globals.IS_WEEKEND = True 
-
-            # Check if WSB sentiment thread is still active
-            if not wsb.get_wsb_thread().is_alive():
-                logging.warning("*** WSB Sentiment Thread Shutdown. . . Exiting WSB Sentiment Program")
-                sys.exit(0)     
-
-        # /// Keyboard Shutdown Enabled
-        except KeyboardInterrupt:
-            with globals.WSB_SPINNER.hidden():
-                logging.warning("*** KeyboardInterrupt: Exiting WSB Sentiment Program. . .")
-                sys.exit(0)
-
-        # /// Unknown Exception Handling
-        except Exception:
-            with globals.WSB_SPINNER.hidden():                                                           
-                logging.error(f"*** Unexpected Exception Occured! (Main Loop)***", exc_info=True)
-                sys.exit(0)                                               # If an Unknown Exception occured, Exit WSB program
-
-
-    
-
-
+"""
+    WSB_Sentiment v2.0:
+        Uses website "https://stocks.comment.ai/" to gather sentiment data from WSB. Stores any ticker mentions
+        in a pandas dataframe and includes number of mentions to determine if a stock should be bought or sold.
+
+    v2.0 Update:
+        We use a Thread to collect WSB sentiment data. This lets us collect sentiment data continuously so we can get
+        accurate data in  real time.
+"""
+"""
+    Momentum Trading off Sentiment from r/wallstreetbets
+-----------------------------------------------------------
+    Idea Referenced From: https://medium.com/@mjysong/momentum-trading-off-sentiment-from-r-wallstreetbets-149c19c7538d
+
+    General Use:
+        1.) During closed market hours, the script will collect comments from Reddit's WSB subreddit. All comments are 
+            collected from "https://stocks.comment.ai/" which already categorizes each comment as "bullish" or "bearish".
+        
+        2.) When the market opens, the script will determine an overall sentiment score and collect the top 25 mentioned 
+            tickers from the collected comments. The script will then collect an open price for each stock ticker.
+        
+        3.) The script will then determine a 10-day EMA via the overall sentiment score. If the current day's EMA is above
+            the 10-day EMA sentiment score, we will signal a "BUY". If/When the current day's EMA is below the 10-day EMA
+            sentiment score, we will signal a "SELL". Otherwise a "HOLD" signal will be given.
+        
+        4.) During weekends, the script will only collect WSB comments and any tickers that may be mentioned.
+"""
+
+import argparse
+import tempfile
+import WSB_Sentiment as WSB
+import Short_Squeeze as SHORT
+import Email_SMS as SMS
+import globals
+from helper import *
+from imports import *
+from Comment_Source import Selenium_Source, Replay_Source, Http_Source
+
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="WSB Sentiment")
+    parser.add_argument('--replay', help="Replay recorded comment-area snapshots (JSONL file or directory of .txt files) instead of using Chrome")
+    parser.add_argument('--speed', type=float, default=None, help="Replay speed (1.0 = real-time, default = as fast as possible)")
+    parser.add_argument('--record', help="Record comment-area snapshots from Chrome to a JSONL file for replay")
+    parser.add_argument('--http', nargs='+', help="Collect comments from JSON comment feed URL(s) over HTTP instead of using Chrome")
+    parser.add_argument('--update-seconds', type=float, default=3600, help="Seconds between WSB sentiment status reports (default = 1 hour)")
+    parser.add_argument('--spike-factor', type=float, default=3.0, help="Flag tickers whose recent mention rate exceeds their baseline rate by this factor")
+    parser.add_argument('--data-dir', help="Directory for session data, history database and write-ahead log (default = Data, temporary directory for replay)")
+    parser.add_argument('--bucket-seconds', type=float, default=60, help="Length of the sentiment time buckets in seconds, buckets cover 24 hours (default = 1 minute)")
+    args = parser.parse_args()
+
+    program_title()                         # Pretty title for program
+
+    # Setup WSB comment source (Chrome webdriver, JSON comment feed over HTTP, or offline replay of recorded comments)
+    data_dir = args.data_dir or 'Data'      # Session data, history database and write-ahead log
+    if args.replay:
+        source = Replay_Source(args.replay, speed=args.speed)
+        data_dir = args.data_dir or tempfile.mkdtemp(prefix='wsb_replay_')     # Replay never writes to the live session data
+        print(f">>> Writing replay session data to {data_dir}. . .")
+    elif args.http:
+        source = Http_Source(args.http)
+    else:
+        source = Selenium_Source(record_path=args.record)
+
+    wsb = WSB.WSB_Sentiment(update_seconds=args.update_seconds,    # Setup WSB sentiment analysis class
+                            bucket_seconds=args.bucket_seconds,
+                            num_buckets=int(24 * 3600 // args.bucket_seconds),
+                            spike_factor=args.spike_factor,
+                            data_dir=data_dir,
+                            source=source)
+    short_squeeze = SHORT.Short_Squeeze(market_data=wsb.market_data)     # Setup short squeeze analysis class (shares WSB's cached market data)
+    if not args.replay:                     # Setup email_sms class for sending market updates via text (not needed for replay)
+        email_sms = SMS.Email_SMS(delete=True,
+                                  logger=False)
+   
+    # If no stock tickers were collected from the csv files, exit the program 
+    # (We do this because we need stock tickers to compare against mentioned tickers from WSB comments)
+    if globals.TICKER_DICT is None:
+        print(">>> No stock tickers collected!. . . Cannot perform analysis without a list of NASDAQ, NYSE, or AMEX tickers. . .")
+        print(">>> Exiting WSB Sentiment Program. . .")
+        sys.exit(0)                                         # Exit WSB program
+
+    wsb.run()                                               # Run WSB sentiment analysis on separate thread
+
+    # If replaying recorded comments, only run the ingestion --> sentiment --> report pipeline (no browser, network, or SMS needed)
+    if args.replay:
+        wsb.get_wsb_thread().join()                         # Wait for replay to finish (final sentiment report is written when replay ends)
+        print(">>> Replay finished. . . Exiting WSB Sentiment Program. . .")
+        sys.exit(0)
+
+    # Main loop forever. . .
+    while True:
+        try:
+            session = globals.TRADING_CALENDAR.get_session_by_date(dt.date.today())     # Today's trading session (None on weekends and market holidays)
+
+            # If Weekday (Mon-Fri) and not a Market Closure Holiday
+            if session is not None:
+                
+                if globals.IS_WEEKEND:                                      # If recently changed to weekday
+                    globals.IS_WEEKEND = False
+
+                # (--- Stock Market is Closed ---) (early close days close at the session's close time)
+                if dt.datetime.now() >= session['Close'] or dt.datetime.now() < session['Open']:      
+                   
+                    if globals.IS_MARKET_OPEN:                              # If the market just closed
+                        with globals.WSB_SPINNER.hidden():
+                            print(">>>")
+                            print(">>> $$$ US Stock Market Closed $$$")
+                            wsb.get_close_price_and_percent_chng()          # Get close price and calculate percent change from open price
+                            wsb.determine_potential_profits()               # Determine potential end-of-day profits and losses
+                            globals.IS_MARKET_OPEN = False                  # Set market open flag to false (market closed)
+
+               # ( --- Stock Market is Open --- )
+                else:
+                    if not globals.IS_MARKET_OPEN:                          # If the market just opened
+                        with globals.WSB_SPINNER.hidden():
+                            print(">>>")
+                            print(">>> $$$ US Stock Market Open $$$") 
+                            if session['Early Close']:                      # Early market close day (ex. day after Thanksgiving)
+                                print(f">>> Market Closing Early today because of {session['Early Close']}. . .")
+                            wsb.get_top_tickers()                           # Determine top 25 bullish/bearish tickers and get their open prices
+
+                            short_squeeze.analyze_tickers()                 # Determine if any of the top 25 bullish/bearish tickers have a short squeeze
+                        
+                            wsb.calc_ema()                                  # Update 5/10/20 day EMAs of the daily bull/bear ratio (O(1), no excel file read)
+                            for span, row in wsb.get_ema_df().iterrows():
+                                print(f">>> {span}: {row['EMA']:.2f} (BULL/BEAR RATIO: {row['Bull/Bear Ratio']:.2f})")
+
+                            # Set 'BUY' signal if bull/bear ratio above its 10 day EMA, 'SELL' if below, else 'HOLD'
+                            print(f">>> {wsb.get_ema_signal()} SIGNAL SET. . .")
+
+                            # Send SMS message with top 10 WSB tickers
+                            email_sms.sms_send_top_tickers(wsb.get_top_ticker_sentiment_df())
+
+                            globals.IS_MARKET_OPEN = True                   # Set market open flag to true (market open)
+                                                        
+            # Else Weekend (Sat-Sun) or Market Holiday
+            else:
+                if not globals.IS_WEEKEND:
+                    with globals.WSB_SPINNER.hidden():
+                        if is_market_holiday():
+                            print(f">>> Market Closed today because of {globals.TRADING_CALENDAR.get_holiday_name(dt.date.today())}. . .")
+                        print(">>> US Stock Market Closed for Weekend and/or Holiday. . .")
+                        globals.IS_WEEKEND = True 
+
+            # Check if WSB sentiment thread is still active
+            if not wsb.get_wsb_thread().is_alive():
+                logging.warning("*** WSB Sentiment Thread Shutdown. . . Exiting WSB Sentiment Program")
+                sys.exit(0)     
+
+        # /// Keyboard Shutdown Enabled
+        except KeyboardInterrupt:
+            with globals.WSB_SPINNER.hidden():
+                logging.warning("*** KeyboardInterrupt: Exiting WSB Sentiment Program. . .")
+                sys.exit(0)
+
+        # /// Unknown Exception Handling
+        except Exception:
+            with globals.WSB_SPINNER.hidden():                                                           
+                logging.error(f"*** Unexpected Exception Occured! (Main Loop)***", exc_info=True)
+                sys.exit(0)                                               # If an Unknown Exception occured, Exit WSB program
+
+
+    
+
+
   
\ No newline at end of file